@@ -1,11 +1,22 @@
+import importlib
+import importlib.util
 import threading
 import numpy as np
 
-try:
-    import sounddevice as sd
-    HAS_SOUNDDEVICE = True
-except ImportError:
-    HAS_SOUNDDEVICE = False
+# sounddevice is imported on first use (start() or a background preload), not at startup
+HAS_SOUNDDEVICE = importlib.util.find_spec("sounddevice") is not None
+sd = None
+
+
+def load_sounddevice():
+    """Import sounddevice once. Returns the module, or None if it cannot be loaded."""
+    global sd
+    if sd is None and HAS_SOUNDDEVICE:
+        try:
+            sd = importlib.import_module("sounddevice")
+        except Exception as e:  # e.g. PortAudio library missing
+            print(f"[audio] failed to load sounddevice: {e}")
+    return sd
 
 
 class AudioCapture:
@@ -22,7 +33,7 @@ class AudioCapture:
         self._running = False
 
     def start(self):
-        if not HAS_SOUNDDEVICE:
+        if load_sounddevice() is None:
             print("[audio] sounddevice not installed, skipping audio capture")
             return False
 
@@ -0,0 +1,70 @@
+import json
+import os
+
+COSTS_FILE = "effect_costs.json"
+
+
+class EffectCostTable:
+    """Per-effect render time (ms), measured live and kept per resolution.
+
+    The runner calls record() with the time each effect took this frame;
+    values are smoothed with an EMA. Keys are effect names (stable across
+    ID changes) under a "WxH" resolution key, and the table is persisted
+    to `filepath` so a new session starts with last session's numbers.
+    """
+
+    def __init__(self, filepath=COSTS_FILE, alpha=0.05):
+        self.filepath = filepath
+        self.alpha = alpha
+        self.tables = {}        # "WxH" -> {effect name: ms}
+        self._res = None
+        self._table = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, "r") as f:
+                    self.tables = json.load(f)
+            except Exception as e:
+                print(f"[costs] failed to load: {e}")
+                self.tables = {}
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp = self.filepath + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(self.tables, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.filepath)
+            self._dirty = False
+        except Exception as e:
+            print(f"[costs] failed to save: {e}")
+
+    def set_resolution(self, width, height):
+        res = f"{width}x{height}"
+        if res != self._res:
+            self._res = res
+            self._table = self.tables.setdefault(res, {})
+
+    def record(self, name, ms):
+        prev = self._table.get(name)
+        if prev is None:
+            self._table[name] = ms
+        else:
+            self._table[name] = prev + (ms - prev) * self.alpha
+        self._dirty = True
+
+    def get(self, name, default=None):
+        return self._table.get(name, default)
+
+    def estimate(self, name):
+        """Cost of `name`, or the mean of known costs if it was never measured."""
+        ms = self._table.get(name)
+        if ms is not None:
+            return ms
+        if not self._table:
+            return 0.0
+        return sum(self._table.values()) / len(self._table)
@@ -1,6 +1,9 @@
+import threading
 import time
+from effects import EFFECTS_FACTORY
+from .costs import EffectCostTable
 from .sequencer import Sequencer
-from .transitions import CrossfadeTransition
+from .transitions import CrossfadeTransition, LiveTransition
 
 
 class AutoVJManager:
@@ -8,16 +11,39 @@ class AutoVJManager:
 
     Combines motion and audio energy to determine intensity level,
     then selects appropriate effects from pools with crossfade transitions.
+    transition_mode "live" keeps the outgoing stack rendering during the
+    transition (see LiveTransition); "frozen" fades from a still frame.
+    `prewarm` seconds before a scheduled change the next selection is chosen
+    and its not-yet-created effects are instantiated and warmed up on a
+    background thread; the change waits for that thread to finish.
+    With `budget_ms` > 0 only combinations whose measured cost (see
+    EffectCostTable, fed by the runner) fits the budget are selected.
     """
 
-    def __init__(self, interval=8.0, crossfade_frames=30):
+    def __init__(self, interval=8.0, crossfade_frames=30, transition_mode="live",
+                 transition="crossfade", outgoing_scale=1.0, outgoing_budget_ms=10.0,
+                 prewarm=1.0, budget_ms=0.0):
         self.interval = interval  # seconds between effect changes
+        self.prewarm = prewarm
+        self.budget_ms = budget_ms
+        self.costs = EffectCostTable()
+        self.transition_mode = transition_mode
         self.crossfade = CrossfadeTransition(duration_frames=crossfade_frames)
+        self.live = LiveTransition(
+            duration_frames=crossfade_frames,
+            kind=transition,
+            outgoing_scale=outgoing_scale,
+            budget_ms=outgoing_budget_ms,
+        )
         self.sequencer = Sequencer()
         self._enabled = False
         self._last_change = 0.0
         self._energy_smooth = 0.0
 
+        self._next_ids = None       # prepared selection
+        self._prepared = {}         # effect_id -> warmed instance (not yet in the runner cache)
+        self._warm_thread = None
+
     @property
     def enabled(self):
         return self._enabled
@@ -31,12 +57,13 @@ class AutoVJManager:
             print("[autovj] disabled")
         return self._enabled
 
-    def update(self, runner, controls):
+    def update(self, runner, controls, frame=None):
         """Called once per frame. May trigger effect changes.
 
         Args:
             runner: PipelineRunner instance
             controls: Current controls dict with motion, audio data
+            frame: Current input frame (used to prewarm the next selection)
         """
         if not self._enabled:
             return
@@ -57,14 +84,58 @@ class AutoVJManager:
         beat = float(controls.get("beat", 0.0))
         force_change = beat > 0.5 and elapsed > self.interval * 0.5
 
+        if (frame is not None and self.prewarm > 0 and self._next_ids is None
+                and self._last_change > 0 and elapsed >= self.interval - self.prewarm):
+            self._prepare_next(runner, frame)
+
         if elapsed >= self.interval or force_change:
+            if self._warm_thread is not None and self._warm_thread.is_alive():
+                return  # next selection still warming up
             self._change_effects(runner)
             self._last_change = now
 
+    def _effect_cost(self, effect_id):
+        name = EFFECTS_FACTORY.name(effect_id)   # metadata only, no import
+        return self.costs.estimate(name) if name is not None else 0.0
+
+    def _select(self):
+        return self.sequencer.select(
+            self._energy_smooth,
+            cost=self._effect_cost if self.budget_ms > 0 else None,
+            budget_ms=self.budget_ms,
+        )
+
+    def _prepare_next(self, runner, frame):
+        """Choose the next selection now and warm its new effects in the background."""
+        self._next_ids = self._select()
+        missing = [eid for eid in self._next_ids if eid not in runner._effect_cache]
+        if not missing:
+            return
+        self._warm_thread = threading.Thread(
+            target=self._warm, args=(missing, frame.copy()), daemon=True
+        )
+        self._warm_thread.start()
+
+    def _warm(self, ids, frame):
+        for eid in ids:
+            EffectCls = EFFECTS_FACTORY.get(eid)
+            if EffectCls is None:
+                continue
+            effect = EffectCls()
+            effect.warmup(frame)
+            self._prepared[eid] = effect
+
     def _change_effects(self, runner):
         """Select new effects and apply with crossfade."""
-        # Capture current frame for crossfade (will be applied in runner)
-        new_ids = self.sequencer.select(self._energy_smooth)
+        new_ids = self._next_ids
+        if new_ids is None:
+            new_ids = self._select()
+        self._next_ids = None
+
+        # Hand prewarmed instances to the runner cache (keep any created meanwhile)
+        for eid, effect in self._prepared.items():
+            runner._effect_cache.setdefault(eid, effect)
+        self._prepared = {}
 
         # Clear and set new effects
         runner._clear_effects()
@@ -78,3 +149,16 @@ class AutoVJManager:
     def start_crossfade(self, frame):
         """Start crossfade from current frame."""
         self.crossfade.start(frame)
+
+    def start_transition(self, frame, old_stack, new_stack):
+        """Start the configured transition after a stack change."""
+        if self.transition_mode == "live":
+            self.live.start(old_stack, new_stack)
+        else:
+            self.crossfade.start(frame)
+
+    def apply_transition(self, frame, out, controls):
+        """Apply the active transition to the new stack output `out`."""
+        if self.transition_mode == "live":
+            return self.live.apply(frame, out, controls)
+        return self.crossfade.apply(out)
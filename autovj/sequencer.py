@@ -14,11 +14,19 @@ class Sequencer:
     def __init__(self):
         self._last_selection = []
 
-    def select(self, energy_level):
+    def pool_ids(self):
+        """All effect IDs the sequencer may pick (for warm-up)."""
+        return sorted(set(POOL_LOW) | set(POOL_MID) | set(POOL_HIGH))
+
+    def select(self, energy_level, cost=None, budget_ms=0.0, tries=24):
         """Return a list of effect IDs based on energy level (0-1).
 
         Args:
             energy_level: Combined energy from motion + audio (0.0 to 1.0)
+            cost: Optional callable effect_id -> predicted ms per frame
+            budget_ms: If > 0 (with cost), only combos whose predicted total
+                fits are chosen; fewer effects are tried before giving up,
+                and the cheapest single effect is the last resort
 
         Returns:
             List of effect IDs to activate
@@ -36,6 +44,11 @@ class Sequencer:
             pool = POOL_HIGH
             count = random.choice([2, 3])
 
+        if cost is not None and budget_ms > 0:
+            selection = self._select_within(pool, count, cost, budget_ms, tries)
+            self._last_selection = selection
+            return selection
+
         # Pick random effects, avoid repeating same combo
         selection = random.sample(pool, min(count, len(pool)))
 
@@ -45,3 +58,16 @@ class Sequencer:
 
         self._last_selection = selection
         return selection
+
+    def _select_within(self, pool, count, cost, budget_ms, tries):
+        """Random combo from `pool` whose summed cost fits `budget_ms`."""
+        for n in range(min(count, len(pool)), 0, -1):
+            fits = []
+            for _ in range(tries):
+                combo = random.sample(pool, n)
+                if sum(cost(eid) for eid in combo) <= budget_ms:
+                    fits.append(combo)
+            if fits:
+                fresh = [c for c in fits if c != self._last_selection]
+                return random.choice(fresh or fits)
+        return [min(pool, key=cost)]
@@ -1,4 +1,7 @@
+import time
+
 import cv2
+import numpy as np
 
 
 class CrossfadeTransition:
@@ -42,3 +45,165 @@ class CrossfadeTransition:
     @property
     def is_active(self):
         return self._active
+
+
+TRANSITION_TYPES = ("crossfade", "wipe", "luma", "noise")
+
+
+class LiveTransition:
+    """A/B transition where the outgoing stack keeps rendering during the blend.
+
+    The old stack is applied to each new input frame (optionally at
+    `outgoing_scale`, halved further while it overruns `budget_ms`) and
+    blended with the new stack's output. Scaled rendering uses fresh private
+    instances of the effects (same parameters, clean state), so cached
+    instances never see the small frames.
+    Types:
+    - crossfade: linear mix
+    - wipe: left-to-right reveal
+    - luma: bright areas of the incoming look appear first
+    - noise: blocky dissolve in a random order fixed at start()
+    All blends write into preallocated buffers.
+    """
+
+    def __init__(self, duration_frames=30, kind="crossfade", outgoing_scale=1.0,
+                 budget_ms=10.0, noise_cell=16):
+        if kind not in TRANSITION_TYPES:
+            raise ValueError(f"Unknown transition: {kind!r} (options: {', '.join(TRANSITION_TYPES)})")
+        self.duration = duration_frames
+        self.kind = kind
+        self.outgoing_scale = outgoing_scale
+        self.budget_ms = budget_ms
+        self.noise_cell = noise_cell
+
+        self._progress = 0
+        self._active = False
+        self._stack = []
+        self._scale = outgoing_scale
+        self._shape = None
+        self._out = None
+        self._old = None
+        self._small = None
+        self._gray = None
+        self._mask = None
+        self._noise = None
+
+    def start(self, old_stack, new_stack):
+        """Begin a transition from `old_stack` to `new_stack` (lists of (id, effect)).
+
+        Effects present in both stacks get a fresh instance with the same
+        parameters for the outgoing side, so they are not advanced twice per
+        frame. Their temporal state is not copied: deep-copying frame
+        histories (slit scan, trails) here would stall the transition start.
+        """
+        shared = {id(effect) for _, effect in new_stack}
+        self._stack = [
+            (eid, self._clone(effect) if id(effect) in shared else effect)
+            for eid, effect in old_stack
+        ]
+        self._scale = 1.0
+        self._set_scale(self.outgoing_scale)
+        self._noise = None
+        self._progress = 0
+        self._active = bool(self._stack)
+
+    @staticmethod
+    def _clone(effect):
+        clone = type(effect)()
+        clone.set_params(effect.get_params())
+        return clone
+
+    def _set_scale(self, scale):
+        if scale == self._scale:
+            return
+        if self._scale == 1.0:
+            # Fresh instances start clean: no reset needed
+            self._stack = [(eid, self._clone(effect)) for eid, effect in self._stack]
+        else:
+            for _, effect in self._stack:
+                effect.reset()
+        self._scale = scale
+
+    def _alloc(self, shape):
+        h, w = shape[:2]
+        self._shape = shape
+        self._out = np.empty(shape, np.uint8)
+        self._old = np.empty(shape, np.uint8)
+        self._gray = np.empty((h, w), np.uint8)
+        self._mask = np.empty((h, w), np.uint8)
+        self._noise = None
+
+    def _render_old(self, frame, controls):
+        t0 = time.perf_counter()
+        h, w = frame.shape[:2]
+        src = frame
+        if self._scale < 1.0:
+            size = (max(1, int(w * self._scale)), max(1, int(h * self._scale)))
+            if self._small is None or self._small.shape[:2] != (size[1], size[0]):
+                self._small = np.empty((size[1], size[0], 3), np.uint8)
+            src = cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+
+        out = src
+        for _, effect in self._stack:
+            try:
+                effect.set_controls(controls)
+            except Exception:
+                pass
+            out = effect.apply(out)
+
+        if out.shape != self._shape:
+            cv2.resize(out, (w, h), dst=self._old, interpolation=cv2.INTER_LINEAR)
+        else:
+            np.copyto(self._old, out)
+
+        # Over budget: render the outgoing look smaller for the rest of the fade
+        if (time.perf_counter() - t0) * 1000.0 > self.budget_ms and self._scale > 0.25:
+            self._set_scale(self._scale * 0.5)
+        return self._old
+
+    def apply(self, frame, new_frame, controls):
+        """Blend the live outgoing render of `frame` with `new_frame`.
+
+        Returns:
+            Blended frame if transitioning, or new_frame if done.
+        """
+        if not self._active:
+            return new_frame
+
+        if self._shape != new_frame.shape:
+            self._alloc(new_frame.shape)
+        old = self._render_old(frame, controls)
+
+        self._progress += 1
+        alpha = min(1.0, self._progress / max(1, self.duration))
+        out = self._out
+
+        if self.kind == "crossfade":
+            cv2.addWeighted(old, 1.0 - alpha, new_frame, alpha, 0, dst=out)
+        elif self.kind == "wipe":
+            x = int(alpha * out.shape[1])
+            out[:, :x] = new_frame[:, :x]
+            out[:, x:] = old[:, x:]
+        else:
+            if self.kind == "luma":
+                cv2.cvtColor(new_frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+                cv2.threshold(self._gray, 255.0 * (1.0 - alpha), 255, cv2.THRESH_BINARY, dst=self._mask)
+            else:
+                if self._noise is None:
+                    h, w = out.shape[:2]
+                    cells = np.random.randint(0, 255, (max(1, h // self.noise_cell), max(1, w // self.noise_cell)), np.uint8)
+                    self._noise = cv2.resize(cells, (w, h), interpolation=cv2.INTER_NEAREST)
+                cv2.threshold(self._noise, 255.0 * alpha, 255, cv2.THRESH_BINARY_INV, dst=self._mask)
+            np.copyto(out, old)
+            cv2.copyTo(new_frame, self._mask, out)
+
+        if alpha >= 1.0:
+            self._active = False
+            self._stack = []
+            return new_frame
+
+        return out
+
+    @property
+    def is_active(self):
+        return self._active
@@ -0,0 +1,94 @@
+"""
+Benchmark del frame bus en memoria compartida (output/framebus.py).
+
+Uso (desde la raíz del repo):
+    python -m bench.framebus_publish [--width 1920 --height 1080 --frames 600]
+
+Mide el costo de publish() en el thread de render y, en paralelo, un proceso
+lector que cuenta frames leídos (zero-copy y con copia) y lecturas descartadas.
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from output.framebus import FrameBusPublisher, FrameBusReader
+
+
+BUS_NAME = "cameravj-bench"
+
+
+def _reader(duration, copy):
+    """Modo lector: corre como proceso independiente e imprime "frames latencia_ms"."""
+    reader = FrameBusReader(BUS_NAME)
+    got = 0
+    latency = 0.0
+    frame = None  # puede no llegar ningún frame en `duration`
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        item = reader.read(copy=copy)
+        if item is None:
+            time.sleep(0.0005)
+            continue
+        seq, ts, frame = item
+        _ = int(frame[0, 0, 0])  # tocar los pixeles
+        latency += time.perf_counter() - ts
+        got += 1
+    del frame
+    reader.close()
+    print(got, latency / max(1, got) * 1000.0)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=1920)
+    ap.add_argument("--height", type=int, default=1080)
+    ap.add_argument("--frames", type=int, default=600)
+    ap.add_argument("--fps", type=float, default=60.0)
+    ap.add_argument("--reader", choices=("copy", "view"), help=argparse.SUPPRESS)
+    ap.add_argument("--duration", type=float, default=0.0, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.reader:
+        _reader(args.duration, args.reader == "copy")
+        return
+
+    frame = np.random.randint(0, 255, (args.height, args.width, 3), np.uint8)
+    bus = FrameBusPublisher(BUS_NAME)
+    bus.start(args.width, args.height)
+
+    # Costo puro de publish (sin lector)
+    t0 = time.perf_counter()
+    for _ in range(args.frames):
+        bus.publish(frame)
+    ms = (time.perf_counter() - t0) * 1000.0 / args.frames
+    print(f"{args.width}x{args.height}: publish {ms:.2f} ms/frame ({frame.nbytes / 1e6:.1f} MB)")
+
+    # Con un lector en otro proceso (independiente, como un cliente externo),
+    # publicando a ritmo de show
+    duration = args.frames / args.fps
+    for mode in ("view", "copy"):
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "bench.framebus_publish",
+             "--reader", mode, "--duration", str(duration + 1.5)],
+            stdout=subprocess.PIPE, text=True,
+        )
+        time.sleep(1.0)  # que el lector arranque y se conecte
+        sent = 0
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            bus.publish(frame)
+            sent += 1
+            time.sleep(1.0 / args.fps)
+        out, _ = proc.communicate()
+        got, lat = out.split()
+        got, lat = int(got), float(lat)
+        print(f"reader {mode:<9}: {got}/{sent} frames, latency {lat:.2f} ms")
+
+    bus.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark de backends de movimiento (vision/motion.py).
+
+Uso (desde la raíz del repo):
+    python -m bench.motion_backends [--width 1920 --height 1080 --frames 300]
+
+Genera frames sintéticos (ruido de sensor + un rectángulo que se mueve) y mide:
+(los frames se arman al vuelo sobre un set chico de fondos con ruido, así la
+memoria no crece con --frames; el armado queda fuera del tiempo medido)
+  - costo por frame (ms) de MotionEstimator.update()
+  - estabilidad en escena quieta: desvío estándar del valor motion (más bajo = menos “temblor”)
+  - respuesta con movimiento: valor motion medio
+"""
+import argparse
+import time
+
+import numpy as np
+
+from vision.motion import MotionEstimator, MOTION_BACKENDS
+
+
+NOISE_FRAMES = 8  # fondos con ruido precalculados (se reciclan en rueda)
+
+
+def _make_frames(width, height, n, moving, seed=0):
+    """Generador de n frames: un fondo del set + el rectángulo en su posición."""
+    rng = np.random.default_rng(seed)
+    noisy = [
+        90 + rng.integers(0, 8, (height, width, 1), dtype=np.uint8).repeat(3, axis=2)
+        for _ in range(NOISE_FRAMES)
+    ]
+    bw, bh = width // 6, height // 4
+    y = height // 3
+    f = np.empty((height, width, 3), np.uint8)
+    for i in range(n):
+        np.copyto(f, noisy[i % NOISE_FRAMES])
+        if moving:
+            x = int((i * 12) % (width - bw))
+            f[y:y + bh, x:x + bw] += np.array((130, 110, 90), np.uint8)
+        yield f
+
+
+def _run(backend, frames, scale):
+    est = MotionEstimator(scale=scale, backend=backend)
+    values = []
+    elapsed = 0.0
+    for f in frames:
+        t0 = time.perf_counter()
+        m, _ = est.update(f)
+        elapsed += time.perf_counter() - t0
+        values.append(m)
+    return elapsed * 1000.0 / len(values), np.array(values)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=1920)
+    ap.add_argument("--height", type=int, default=1080)
+    ap.add_argument("--frames", type=int, default=300)
+    ap.add_argument("--scale", type=float, default=0.5)
+    args = ap.parse_args()
+
+    warm = args.frames // 5  # ignorar el arranque (el fondo todavía aprende)
+
+    print(f"{args.width}x{args.height} scale={args.scale} frames={args.frames}")
+    print(f"{'backend':<12} {'ms/frame':>9} {'still std':>10} {'moving mean':>12}")
+    for name in MOTION_BACKENDS:
+        still = _make_frames(args.width, args.height, args.frames, moving=False)
+        moving = _make_frames(args.width, args.height, args.frames, moving=True, seed=1)
+        ms, v_still = _run(name, still, args.scale)
+        _, v_move = _run(name, moving, args.scale)
+        print(f"{name:<12} {ms:9.2f} {v_still[warm:].std():10.4f} {v_move[warm:].mean():12.4f}")
+
+
+if __name__ == "__main__":
+    main()
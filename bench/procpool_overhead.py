@@ -0,0 +1,72 @@
+"""
+Benchmark del pool de procesos para efectos gil_bound (pipeline/procpool.py).
+
+Uso (desde la raíz del repo):
+    python -m bench.procpool_overhead [--width 1920 --height 1080 --frames 60 --workers 4]
+
+Para cada efecto gil_bound mide ms/frame en el proceso principal (apply()
+directo) y a través del pool, y separa el tiempo del pool en trabajo del
+worker y overhead de IPC (copias a/desde memoria compartida + mensajes).
+Los efectos tile_safe (pixel sort horizontal) se reparten en bandas entre
+todos los workers; el resto corre entero en un worker.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from effects import EFFECTS_FACTORY
+from pipeline.procpool import ProcessPool
+
+
+def _make_frames(width, height, n, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return [np.roll(base, i * 8, axis=1) for i in range(n)]
+
+
+def _run(effect, frames, apply):
+    effect.set_controls({"motion": 0.4, "zones": {"top": 0.3}, "beat": 0.0, "flow": None})
+    apply(effect, frames[0])  # warm-up (attach, first-use costs)
+    t0 = time.perf_counter()
+    for f in frames:
+        apply(effect, f)
+    return (time.perf_counter() - t0) * 1000.0 / len(frames)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=1920)
+    ap.add_argument("--height", type=int, default=1080)
+    ap.add_argument("--frames", type=int, default=60)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+
+    frames = _make_frames(args.width, args.height, args.frames)
+    t0 = time.perf_counter()
+    pool = ProcessPool(workers=args.workers).start()
+    if pool is None:
+        return
+    print(f"{args.width}x{args.height} frames={args.frames} cpus={os.cpu_count()} "
+          f"workers={args.workers} (started in {(time.perf_counter() - t0) * 1000.0:.0f} ms)")
+    print(f"{'effect':<16}{'mode':>7}{'local ms':>10}{'pool ms':>9}{'work ms':>9}{'ipc ms':>8}  speedup")
+
+    for eid in EFFECTS_FACTORY:
+        cls = EFFECTS_FACTORY[eid]
+        if not cls.gil_bound:
+            continue
+        local = _run(cls(), frames, lambda fx, f: fx.apply(f))
+        effect = cls()
+        pool.frames = 0
+        remote = _run(effect, frames, pool.apply)
+        mode = pool.mode(effect) or "local"
+        print(f"{cls.name:<16}{mode:>7}{local:10.2f}{remote:9.2f}{pool.work_ms:9.2f}{pool.ipc_ms:8.2f}"
+              f"  {local / remote:.2f}x")
+        pool.retain(())
+
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark de ejecución por bandas (pipeline/tiles.py).
+
+Uso (desde la raíz del repo):
+    python -m bench.tile_scaling [--width 1920 --height 1080 --frames 60 --threads 1,2,4,8]
+
+Para cada efecto tile_safe mide ms/frame con 1 thread (apply() directo) y con
+N bandas en paralelo, y la aceleración relativa (curva de escalado). También
+verifica que la salida por bandas sea idéntica a la de apply().
+OpenCV usa sus propios threads dentro de cada llamada: la columna 1T los
+incluye (--cv-threads N los fija), mientras que con bandas el executor los
+apaga (cv2.setNumThreads(1)) para no sobresuscribir los núcleos. Medir en la
+máquina del show, con todos sus núcleos libres.
+"""
+import argparse
+import copy
+import os
+import time
+
+import cv2
+import numpy as np
+
+from effects import EFFECTS_FACTORY
+from pipeline.tiles import TileExecutor
+
+
+def _make_frames(width, height, n, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    return [np.roll(base, i * 8, axis=1) for i in range(n)]
+
+
+def _run(effect, frames, executor):
+    controls = {"motion": 0.4, "zones": {"top": 0.3, "bottom": 0.3}, "beat": 0.0}
+    effect.set_controls(controls)
+    executor.apply(effect, frames[0])  # warm-up
+    t0 = time.perf_counter()
+    for f in frames:
+        executor.apply(effect, f)
+    return (time.perf_counter() - t0) * 1000.0 / len(frames)
+
+
+def _check(cls, frames, executor):
+    a, b = cls(), cls()
+    for f in frames[:6]:
+        if not np.array_equal(a.apply(f), executor.apply(b, f)):
+            return False
+    return True
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--width", type=int, default=1920)
+    ap.add_argument("--height", type=int, default=1080)
+    ap.add_argument("--frames", type=int, default=60)
+    ap.add_argument("--threads", default="1,2,4,8")
+    ap.add_argument("--cv-threads", type=int, default=-1, help="cv2.setNumThreads (-1 = default)")
+    args = ap.parse_args()
+
+    if args.cv_threads >= 0:
+        cv2.setNumThreads(args.cv_threads)
+    counts = [int(x) for x in args.threads.split(",")]
+    frames = _make_frames(args.width, args.height, args.frames)
+    executors = {n: TileExecutor(threads=n) for n in counts}
+
+    print(f"{args.width}x{args.height} frames={args.frames} cpus={os.cpu_count()} cv_threads={cv2.getNumThreads()}")
+    header = "".join(f"{f'{n}T ms':>9}" for n in counts)
+    print(f"{'effect':<22}{header}  speedup  exact")
+    for eid in EFFECTS_FACTORY:
+        cls = EFFECTS_FACTORY[eid]
+        if cls.gil_bound or not cls().tile_safe:
+            continue
+        proto = cls()
+        times = [_run(copy.deepcopy(proto), frames, executors[n]) for n in counts]
+        speedup = " ".join(f"{times[0] / t:.2f}x" for t in times[1:])
+        exact = _check(cls, frames, executors[counts[-1]])
+        cols = "".join(f"{t:9.2f}" for t in times)
+        print(f"{cls.name:<22}{cols}  {speedup}  {'yes' if exact else 'NO'}")
+
+    for ex in executors.values():
+        ex.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,80 @@ MOTION_SCALE = 0.5        # resolución interna del detector (0.4–0.7 recomend
 MOTION_SMOOTH = 0.2       # suavizado EMA (0.1–0.3)
 MOTION_GAIN = 2.5         # multiplica sensibilidad (1.0–4.0)
 MOTION_DEADZONE = 0.02    # ignora movimiento chiquito (0.01–0.05)
+MOTION_BACKEND = "mog2"   # "mog2" | "framediff" | "running_avg" (framediff = el más barato)
+MOTION_STRIDE = 1         # analizar 1 de cada k frames (2–4 libera CPU para el stack)
+MOTION_RATE_HZ = 0.0      # si > 0, analiza a tasa fija (Hz) e ignora MOTION_STRIDE
+ZONE_GRID = (8, 6)        # columnas x filas de zonas de movimiento (left/right/top/bottom salen de acá)
+
+# --- Optical flow (dirección del movimiento para efectos) ---
+FLOW_ENABLED = True       # barato (~2 ms a 1080p), se puede dejar prendido en show
+FLOW_WIDTH = 160          # ancho interno del análisis (120–240)
+FLOW_GRID = (8, 6)        # columnas x filas de la grilla que ven los efectos
+FLOW_GAIN = 60.0          # escala de controls["flow"]["mag"]
+
+# --- Pose ---
+POSE_INFERENCE_HZ = 12.0  # MediaPipe a tasa fija (10–15 Hz); 0 = cada frame
+POSE_PREDICT = True       # predice landmarks entre inferencias (trails/gestos suaves)
+
+# --- Virtual cam ---
+VCAM_BACKEND = "pyvirtualcam"  # "null" = cámara falsa (probar sin driver)
+
+# --- Frame bus (memoria compartida para otros procesos locales) ---
+FRAMEBUS_NAME = "cameravj"    # nombre del bloque de shared memory
+FRAMEBUS_SLOTS = 3            # buffers rotativos (3 = triple buffering)
+
+# --- Screenshots / burst (encoding en threads aparte) ---
+EXPORT_WORKERS = 3            # threads de encoding PNG/JPEG
+EXPORT_MAX_PENDING = 48       # frames esperando encoding (más = se descartan)
+BURST_SECONDS = 5.0           # Shift+S: exporta cada frame durante N segundos
+BURST_FORMAT = "jpg"          # "jpg" (rápido) | "png"
+
+# --- Instant replay (últimos N segundos en memoria como JPEG) ---
+REPLAY_ENABLED = True         # buffer siempre corriendo (encoding en thread aparte, a REPLAY_SCALE)
+REPLAY_SECONDS = 15.0
+REPLAY_MAX_MB = 256           # tope de memoria del buffer
+REPLAY_SCALE = 0.5            # 1.0 = resolución completa (más CPU/memoria)
+REPLAY_QUALITY = 80           # calidad JPEG
+
+# --- Recording ---
+REC_FPS = 30.0                # fps constante del archivo (duplica/descarta según timestamps)
+REC_TIMESTAMPS = False        # escribe rec-<ts>.csv con el timestamp real de cada frame
+REC_SEGMENT_MINUTES = 0       # corta en segmentos cada N minutos (0 = un solo archivo)
+REC_SEGMENT_MB = 0            # y/o cada N MB (0 = sin límite)
+REC_QUEUE_SIZE = 8            # frames en cola hacia el encoder (thread aparte)
+REC_DROP_POLICY = "drop_oldest"  # si el encoder se atrasa: "block" | "drop_oldest" | "drop_newest"
+
+# --- MIDI ---
+MIDI_CLOCK_PORT = ""          # puerto extra para MIDI clock (vacío = mismo puerto que el K2)
+
+# --- OSC (UDP) ---
+OSC_ENABLED = False           # tecla u activa/desactiva
+OSC_HOST = "127.0.0.1"        # "0.0.0.0" para aceptar desde la LAN
+OSC_PORT = 9000
+
+# --- Auto-VJ ---
+AUTOVJ_TRANSITION_MODE = "live"     # live | frozen (fade desde un frame congelado)
+AUTOVJ_TRANSITION = "crossfade"     # crossfade | wipe | luma | noise (solo modo live)
+AUTOVJ_TRANSITION_FRAMES = 30
+AUTOVJ_OUTGOING_SCALE = 1.0         # escala de render del stack saliente (0.5 = mitad)
+AUTOVJ_OUTGOING_BUDGET_MS = 10.0    # si el stack saliente tarda más, baja su escala
+AUTOVJ_PREWARM_SECONDS = 1.0        # prepara (instancia + warm-up) la próxima selección antes del cambio
+AUTOVJ_EFFECT_BUDGET_MS = 20.0      # costo máximo previsto del stack elegido (0 = sin límite)
 
 # --- Effect Stack ---
+PARAM_SMOOTH_TAU = 0.06   # suavizado (s) de knobs sobre parámetros continuos (0 = instantáneo)
 EFFECT_STACK_MAX = 4      # máximo efectos simultáneos en el stack
+TILE_THREADS = 0          # bandas en paralelo para efectos tile_safe (0 = todos los núcleos, 1 = off; OpenCV corre con 1 thread por banda)
+TILE_MIN_ROWS = 64        # filas mínimas por banda (frames chicos no se dividen)
+PROC_WORKERS = 0          # procesos para efectos gil_bound (ascii, datamosh, pixel sort, glitch blocks); 0 = off
+SCENE_MORPH_SECONDS = 2.0     # duración del morph entre escenas (tecla z activa el modo morph)
+SCENE_MORPH_BEATS = 0         # si > 0, el morph dura N beats (usa controls["bpm"])
+SCENE_MORPH_DEFAULT_BPM = 120.0
+SCENE_SNAPSHOT_STATE = False  # escenas guardan también el estado temporal de los efectos (en memoria)
+EFFECT_WARMUP = "all"     # all | autovj | off — pre-instancia efectos, uno por frame tras el primer frame
+
+# --- Arranque ---
+# Subsistemas opcionales que se cargan en segundo plano tras el primer frame
+# (si no, se cargan al activarlos). () = ninguno
+PRELOAD_OPTIONAL = ("pose", "audio", "midi", "vcam")
 
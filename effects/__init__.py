@@ -1,44 +1,39 @@
-from .color_posterize import ColorPosterize
-from .contours_glow import ContoursGlow
-from .feedback_glitch import FeedbackGlitch
-from .mirror_kaleido import MirrorKaleido
-from .scanlines_rgbshift import ScanlinesRGBShift
-from .motion_trails import MotionTrails
-from .chromatic_aberration import ChromaticAberration
-from .pixel_sort import PixelSort
-from .thermal_vision import ThermalVision
-from .strobe_flash import StrobeFlash
-from .edge_neon import EdgeNeon
-from .vhs_retro import VHSRetro
-from .glitch_blocks import GlitchBlocks
-from .ascii_art import ASCIIArt
-from .particle_rain import ParticleRain
-from .color_invert_pulse import ColorInvertPulse
-from .datamosh import Datamosh
-from .zoom_pulse import ZoomPulse
-from .duotone import Duotone
-from .slit_scan import SlitScan
+from .registry import EffectRegistry, EffectSpec, PAGE_SIZE
 
+# Built-in effects: (ID, name, module, class). Modules are imported on first use.
+BUILTIN_EFFECTS = (
+    (1, "color_posterize", ".color_posterize", "ColorPosterize"),
+    (2, "contours_glow", ".contours_glow", "ContoursGlow"),
+    (3, "feedback_glitch", ".feedback_glitch", "FeedbackGlitch"),
+    (4, "mirror_kaleido", ".mirror_kaleido", "MirrorKaleido"),
+    (5, "scanlines_rgbshift", ".scanlines_rgbshift", "ScanlinesRGBShift"),
+    (6, "motion_trails", ".motion_trails", "MotionTrails"),
+    (7, "chromatic_aberration", ".chromatic_aberration", "ChromaticAberration"),
+    (8, "pixel_sort", ".pixel_sort", "PixelSort"),
+    (9, "thermal_vision", ".thermal_vision", "ThermalVision"),
+    (10, "strobe_flash", ".strobe_flash", "StrobeFlash"),
+    (11, "edge_neon", ".edge_neon", "EdgeNeon"),
+    (12, "vhs_retro", ".vhs_retro", "VHSRetro"),
+    (13, "glitch_blocks", ".glitch_blocks", "GlitchBlocks"),
+    (14, "ascii_art", ".ascii_art", "ASCIIArt"),
+    (15, "particle_rain", ".particle_rain", "ParticleRain"),
+    (16, "color_invert_pulse", ".color_invert_pulse", "ColorInvertPulse"),
+    (17, "datamosh", ".datamosh", "Datamosh"),
+    (18, "zoom_pulse", ".zoom_pulse", "ZoomPulse"),
+    (19, "duotone", ".duotone", "Duotone"),
+    (20, "slit_scan", ".slit_scan", "SlitScan"),
+)
 
-EFFECTS_FACTORY = {
-    1: ColorPosterize,
-    2: ContoursGlow,
-    3: FeedbackGlitch,
-    4: MirrorKaleido,
-    5: ScanlinesRGBShift,
-    6: MotionTrails,
-    7: ChromaticAberration,
-    8: PixelSort,
-    9: ThermalVision,
-    10: StrobeFlash,
-    11: EdgeNeon,
-    12: VHSRetro,
-    13: GlitchBlocks,
-    14: ASCIIArt,
-    15: ParticleRain,
-    16: ColorInvertPulse,
-    17: Datamosh,
-    18: ZoomPulse,
-    19: Duotone,
-    20: SlitScan,
-}
+EFFECTS_FACTORY = EffectRegistry(
+    EffectSpec(eid, name, f"{module}:{cls}") for eid, name, module, cls in BUILTIN_EFFECTS
+)
+
+_CLASS_IDS = {cls: eid for eid, _, _, cls in BUILTIN_EFFECTS}
+
+
+def __getattr__(attr):
+    # `from effects import ColorPosterize` still works (imports that module only)
+    eid = _CLASS_IDS.get(attr)
+    if eid is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+    return EFFECTS_FACTORY[eid]
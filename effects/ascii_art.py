@@ -1,14 +1,22 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ASCIIArt(Effect):
     name = "ascii_art"
+    gil_bound = True
 
     # Characters ordered by density (dark to bright)
     CHARS = " .:-=+*#%@"
 
+    PARAMS = {
+        "cell_size": Param(4, 16, int, curve="inv", knob=0, presets=(8, 5, 8)),
+        "colored": Param(kind=bool, knob=1, presets=(True, True, False)),
+        "font_scale": Param(0.2, 0.6),
+    }
+
     def __init__(self):
         self.cell_size = 8       # pixel size of each character cell
         self.colored = True      # use original colors or green monochrome
@@ -1,5 +1,41 @@
+import numpy as np
+
+
 class Effect:
+    """Base effect.
+
+    Subclasses declare their tunable attributes in PARAMS ({attr: Param});
+    the knob and preset dispatch tables are built once per class when it is
+    defined, so set_knob()/apply_preset() are plain lookups.
+
+    Tile-safe effects (tile_safe = True) split apply() in two: begin_frame()
+    advances per-frame state once, and apply_tile() renders a horizontal
+    band that depends only on its own rows plus `tile_halo` rows of context
+    above and below, so pipeline/tiles.py can run bands concurrently.
+
+    gil_bound effects (hot loops in Python) are rendered in worker processes
+    by pipeline/procpool.py when it is enabled; the worker copy receives
+    get_params() plus the attributes named in proc_sync every frame.
+    """
+
     name = "base"
+    tile_safe = False
+    tile_halo = 0           # rows of context apply_tile() needs on each side
+    gil_bound = False
+    proc_sync = ()          # non-PARAMS attributes set_controls() changes
+    PARAMS = {}
+    _KNOBS = {}             # knob slot -> Param
+    _PRESET_PARAMS = ()     # Params with preset values
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        params = cls.__dict__.get("PARAMS")
+        if params is None:
+            return
+        for attr, param in params.items():
+            param.name = attr
+        cls._KNOBS = {p.knob: p for p in params.values() if p.knob is not None}
+        cls._PRESET_PARAMS = tuple(p for p in params.values() if p.presets)
 
     def reset(self):
         pass
@@ -9,10 +45,83 @@ class Effect:
         controls ejemplo:
         {
           "motion": 0.0..1.0,
-          "zones": {"left":..,"right":..,"top":..,"bottom":..}
+          "zones": {"left":..,"right":..,"top":..,"bottom":.., "grid": (rows, cols)},
+          "flow": {"grid": (rows, cols, 2), "dx":.., "dy":.., "mag": 0..1, "angle": rad},
+          "beat": 0.0 | 1.0,
+          # con MIDI clock: "bpm", "beat_phase": 0..1, "clock": 1.0
         }
         """
         pass
 
     def apply(self, frame):
+        if self.tile_safe:
+            self.begin_frame(frame)
+            return self.apply_tile(frame, 0)
         return frame
+
+    # -------- Tiled execution (tile_safe effects only) --------
+
+    def begin_frame(self, frame):
+        """Advance per-frame state (counters, phases). Called once per frame."""
+        pass
+
+    def apply_tile(self, band, y0):
+        """Render rows y0 .. y0 + len(band) of the frame; returns an array shaped like `band`.
+
+        Must not modify effect state: bands of the same frame run concurrently.
+        """
+        return band
+
+    # -------- Parameters (see effects/params.py) --------
+
+    def set_param(self, param, value):
+        setattr(self, param.name, value)
+        if param.on_change is not None:
+            getattr(self, param.on_change)()
+
+    def apply_preset(self, idx):
+        for param in self._PRESET_PARAMS:
+            self.set_param(param, param.presets[idx % len(param.presets)])
+
+    def set_knob(self, slot, value, smoother=None):
+        """Apply a 0..1 knob value to the parameter mapped to `slot`."""
+        param = self._KNOBS.get(slot)
+        if param is None:
+            return
+        value = param.from_knob(value)
+        if smoother is not None and param.smooth:
+            smoother.set(self, param, value)
+        else:
+            self.set_param(param, value)
+
+    def get_params(self):
+        return {attr: getattr(self, attr) for attr in self.PARAMS}
+
+    def set_params(self, params):
+        for attr, value in params.items():
+            param = self.PARAMS.get(attr)
+            if param is not None:
+                self.set_param(param, param.coerce(value))
+
+    def warmup(self, frame):
+        """Run on a frame of the working resolution before the effect goes live.
+
+        Pays first-use costs (lazy buffers, OpenCV tables) ahead of time,
+        then reset() so the first live frame starts from a clean state.
+        reset() clears state but keeps allocated buffers (see _keep()), and
+        the parameters are restored afterwards, so warming never undoes a
+        preset or a scene's values.
+        """
+        params = self.get_params()
+        self.apply(frame)
+        self.apply(frame)
+        self.reset()
+        self.set_params(params)
+
+    @staticmethod
+    def _keep(buf, src):
+        """Copy `src` into `buf`, reusing its storage when shape and dtype match."""
+        if buf is None or buf.shape != src.shape or buf.dtype != src.dtype:
+            return src.copy()
+        np.copyto(buf, src)
+        return buf
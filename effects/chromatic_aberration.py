@@ -1,11 +1,17 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ChromaticAberration(Effect):
     name = "chromatic_aberration"
 
+    PARAMS = {
+        "strength": Param(2, 32, int, knob=0, presets=(8, 16, 12)),
+        "radial": Param(kind=bool, presets=(True, True, False)),
+    }
+
     def __init__(self, strength=8, radial=True):
         self.strength = int(strength)
         self.radial = radial
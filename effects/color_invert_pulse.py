@@ -1,10 +1,17 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ColorInvertPulse(Effect):
     name = "color_invert_pulse"
+    tile_safe = True
+
+    PARAMS = {
+        "rate": Param(2, 17, int, curve="inv", knob=0),
+        "smooth": Param(0.05, 0.45, knob=1),
+    }
 
     def __init__(self):
         self.rate = 8           # pulse every N frames
@@ -18,7 +25,7 @@ class ColorInvertPulse(Effect):
         self.blend = 0.0
         self._target = 0.0
 
-    def apply(self, frame):
+    def begin_frame(self, frame):
         self.t += 1
 
         # Trigger pulse
@@ -28,6 +35,7 @@ class ColorInvertPulse(Effect):
         # Smooth blend toward target
         self.blend += (self._target - self.blend) * self.smooth
 
+    def apply_tile(self, frame, y0):
         if self.blend < 0.01:
             return frame
 
@@ -1,20 +1,28 @@
 import numpy as np
 import cv2
 from .base import Effect
+from .params import Param
 
 
 class ColorPosterize(Effect):
     name = "color_posterize"
+    tile_safe = True
+
+    PARAMS = {
+        "levels": Param(2, 16, int, knob=0, presets=(6, 4, 10)),
+        "speed": Param(0.01, 0.16, knob=1, presets=(0.03, 0.06, 0.02)),
+    }
 
     def __init__(self, levels=6, speed=0.03):
         self.levels = max(2, int(levels))
         self.speed = float(speed)
         self.phase = 0.0
 
-    def apply(self, frame):
-        # Hue shift (HSV) + posterize (cuantización)
+    def begin_frame(self, frame):
         self.phase = (self.phase + self.speed) % 180.0
 
+    def apply_tile(self, frame, y0):
+        # Hue shift (HSV) + posterize (cuantización)
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
         h, s, v = cv2.split(hsv)
 
@@ -1,11 +1,18 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ContoursGlow(Effect):
     name = "contours_glow"
 
+    PARAMS = {
+        "t1": Param(10, 100, int, knob=0, presets=(50, 30, 80)),
+        "t2": Param(50, 250, int, knob=1, presets=(150, 100, 200)),
+        "blur_ksize": Param(3, 23, int, knob=2, odd=True, presets=(9, 13, 7)),
+    }
+
     def __init__(self, edge_threshold1=50, edge_threshold2=150, blur_ksize=9):
         self.t1 = int(edge_threshold1)
         self.t2 = int(edge_threshold2)
@@ -1,33 +1,52 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class Datamosh(Effect):
     name = "datamosh"
+    gil_bound = True
+    proc_sync = ("_flow_grid",)
+
+    PARAMS = {
+        "corruption": Param(0.05, 0.75, knob=0, presets=(0.3, 0.6, 0.15)),
+        "intensity": Param(0.2, 0.9, knob=1, presets=(0.7, 0.9, 0.5)),
+        "block_size": Param(8, 40, int, curve="inv", knob=2, presets=(16, 8, 24)),
+    }
 
     def __init__(self):
         self.intensity = 0.7     # blend with previous
         self.block_size = 16     # motion block size
         self.corruption = 0.3    # chance of corrupting a block
+        self.follow = 4.0        # how strongly blocks follow optical flow
+        self._flow_grid = None   # (rows, cols, 2) flow grid from controls
         self.prev = None
+        self._primed = False     # prev holds a real frame (reset() keeps the buffer)
         self.t = 0
 
     def reset(self):
-        self.prev = None
+        self._primed = False
         self.t = 0
 
     def apply(self, frame):
         self.t += 1
         h, w = frame.shape[:2]
 
-        if self.prev is None:
-            self.prev = frame.copy()
+        if not self._primed or self.prev.shape != frame.shape:
+            self.prev = self._keep(self.prev, frame)
+            self._primed = True
             return frame
 
         out = frame.copy()
         bs = max(8, self.block_size)
 
+        # Per-pixel motion vectors from the flow grid (like a codec's MVs)
+        grid = self._flow_grid
+        if grid is not None:
+            g_rows, g_cols = grid.shape[:2]
+            mv = grid * np.array([w * self.follow, h * self.follow], np.float32)
+
         # Iterate over blocks
         for by in range(0, h - bs, bs):
             for bx in range(0, w - bs, bs):
@@ -35,6 +54,11 @@ class Datamosh(Effect):
                     # Use block from previous frame (displaced)
                     dx = np.random.randint(-bs, bs + 1)
                     dy = np.random.randint(-bs // 2, bs // 2 + 1)
+                    if grid is not None:
+                        # Pull the block from where the motion came from
+                        mvx, mvy = mv[by * g_rows // h, bx * g_cols // w]
+                        dx = int(dx * 0.25 - mvx)
+                        dy = int(dy * 0.25 - mvy)
                     sy = max(0, min(by + dy, h - bs))
                     sx = max(0, min(bx + dx, w - bs))
                     out[by:by+bs, bx:bx+bs] = self.prev[sy:sy+bs, sx:sx+bs]
@@ -42,7 +66,7 @@ class Datamosh(Effect):
         # Blend with previous for trailing effect
         out = cv2.addWeighted(out, 1.0 - self.intensity * 0.3, self.prev, self.intensity * 0.3, 0)
 
-        self.prev = out.copy()
+        self.prev = self._keep(self.prev, out)
         return out
 
     def set_controls(self, controls: dict):
@@ -53,5 +77,8 @@ class Datamosh(Effect):
         self.intensity = 0.4 + 0.5 * m
         self.block_size = max(8, int(24 - 16 * m))
 
+        flow = controls.get("flow")
+        self._flow_grid = flow["grid"] if flow is not None else None
+
         if beat > 0.5:
             self.corruption = min(0.8, self.corruption + 0.3)
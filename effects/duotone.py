@@ -1,10 +1,12 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class Duotone(Effect):
     name = "duotone"
+    tile_safe = True
 
     # Preset duotone palettes: (dark_bgr, light_bgr)
     PALETTES = [
@@ -15,6 +17,11 @@ class Duotone(Effect):
         ((0, 60, 0), (200, 200, 255)),       # Dark Green-Warm White
     ]
 
+    PARAMS = {
+        "palette_idx": Param(choices=range(5), knob=0, presets=(0, 1, 2)),
+        "contrast": Param(0.6, 2.1, knob=1),
+    }
+
     def __init__(self):
         self.palette_idx = 0
         self.contrast = 1.2
@@ -26,8 +33,10 @@ class Duotone(Effect):
         self.palette_idx = 0
         self._hue_offset = 0.0
 
-    def apply(self, frame):
+    def begin_frame(self, frame):
         self.t += 1
+
+    def apply_tile(self, frame, y0):
         h, w = frame.shape[:2]
 
         # Convert to grayscale
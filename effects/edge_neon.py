@@ -1,11 +1,19 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class EdgeNeon(Effect):
     name = "edge_neon"
 
+    PARAMS = {
+        "t1": Param(0, 255, int, presets=(40, 20, 60)),
+        "t2": Param(0, 255, int, presets=(120, 80, 160)),
+        "hue_speed": Param(0.5, 8.5, knob=0, presets=(2.0, 4.0, 1.0)),
+        "glow_size": Param(1, 13, int, knob=1, presets=(5, 8, 3)),
+    }
+
     def __init__(self):
         self.t1 = 40
         self.t2 = 120
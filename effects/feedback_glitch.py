@@ -1,34 +1,49 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class FeedbackGlitch(Effect):
     name = "feedback_glitch"
 
+    PARAMS = {
+        "feedback": Param(0.80, 0.98, knob=0, presets=(0.90, 0.94, 0.88)),
+        "warp": Param(1, 21, int, knob=1, presets=(4, 7, 10)),
+        "noise": Param(1, 31, int, knob=2, presets=(4, 8, 12)),
+    }
+
     def __init__(self, feedback=0.92, warp=6, noise=6):
         self.feedback = float(feedback)  # más alto = más “trail”
         self.warp = int(warp)            # pixels de desplazamiento max
         self.noise = int(noise)          # intensidad de ruido
+        self.follow = 3.0                # cuánto arrastra el optical flow al feedback
+        self._flow = (0.0, 0.0)          # dirección dominante (fracción del frame)
         self.prev = None
+        self._primed = False     # prev holds a real frame (reset() keeps the buffer)
         self.t = 0
 
     def reset(self):
-        self.prev = None
+        self._primed = False
         self.t = 0
 
     def apply(self, frame):
         self.t += 1
         h, w = frame.shape[:2]
 
-        if self.prev is None:
-            self.prev = frame.copy()
+        if not self._primed or self.prev.shape != frame.shape:
+            self.prev = self._keep(self.prev, frame)
+            self._primed = True
             return frame
 
         # Pequeño “warp” horizontal/vertical que cambia con el tiempo
         dx = int(np.sin(self.t * 0.07) * self.warp)
         dy = int(np.cos(self.t * 0.05) * self.warp)
 
+        # El feedback “se arrastra” en la dirección real del movimiento
+        dx += int(self._flow[0] * w * self.follow)
+        dy += int(self._flow[1] * h * self.follow)
+
         M = np.float32([[1, 0, dx], [0, 1, dy]])
         warped_prev = cv2.warpAffine(self.prev, M, (w, h), borderMode=cv2.BORDER_WRAP)
 
@@ -42,7 +57,7 @@ class FeedbackGlitch(Effect):
             out = cv2.add(out, n)
 
         # Guardar para siguiente frame
-        self.prev = out.copy()
+        self.prev = self._keep(self.prev, out)
         return out
 
     def set_controls(self, controls: dict):
@@ -54,3 +69,7 @@ class FeedbackGlitch(Effect):
         self.warp = int(3 + 14 * m + 6 * abs(lr))
         self.noise = int(2 + 20 * m)
 
+        flow = controls.get("flow")
+        if flow is not None:
+            self._flow = (float(flow["dx"]), float(flow["dy"]))
+
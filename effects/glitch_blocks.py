@@ -1,10 +1,18 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class GlitchBlocks(Effect):
     name = "glitch_blocks"
+    gil_bound = True
+
+    PARAMS = {
+        "block_count": Param(2, 22, int, knob=0, presets=(8, 16, 4)),
+        "max_shift": Param(5, 85, int, knob=1, presets=(30, 60, 15)),
+        "intensity": Param(0.0, 1.0, knob=2, presets=(0.5, 0.8, 0.3)),
+    }
 
     def __init__(self):
         self.block_count = 8       # number of glitch blocks per frame
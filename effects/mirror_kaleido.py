@@ -1,11 +1,16 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class MirrorKaleido(Effect):
     name = "mirror_kaleido"
 
+    PARAMS = {
+        "mode": Param(choices=(0, 1, 2), presets=(0, 1, 2)),
+    }
+
     def __init__(self, mode=0):
         # mode 0: espejo horizontal
         # mode 1: espejo vertical
@@ -1,26 +1,34 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class MotionTrails(Effect):
     name = "motion_trails"
 
+    PARAMS = {
+        "persist": Param(0.70, 0.98, knob=0),
+        "glow": Param(0.0, 0.5, knob=1),
+    }
+
     def __init__(self):
         self.persist = 0.88   # 0.80..0.98 (más alto = más fantasma)
         self.glow = 0.15      # 0..0.5
         self.prev = None
+        self._primed = False  # prev holds a real frame (reset() keeps the buffer)
         self.controls = {"motion": 0.0, "zones": {}}
 
     def reset(self):
-        self.prev = None
+        self._primed = False
 
     def set_controls(self, controls):
         self.controls = controls or self.controls
 
     def apply(self, frame):
-        if self.prev is None:
-            self.prev = frame.copy()
+        if not self._primed or self.prev.shape != frame.shape:
+            self.prev = self._keep(self.prev, frame)
+            self._primed = True
             return frame
 
         # motion controla persistencia (más motion = menos persistencia)
@@ -35,5 +43,5 @@ class MotionTrails(Effect):
             blur = cv2.GaussianBlur(out, (0, 0), 6)
             out = cv2.addWeighted(out, 1.0, blur, self.glow, 0.0)
 
-        self.prev = out.copy()
+        self.prev = self._keep(self.prev, out)
         return out
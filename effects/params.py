@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+
+
+class Param:
+    """Declarative description of one tunable effect attribute.
+
+    Args:
+        lo, hi: knob range (value = lo + (hi - lo) * knob)
+        kind: float, int or bool
+        curve: "linear", or "inv" to map the knob reversed (hi at 0)
+        choices: discrete values picked by knob position (overrides lo/hi)
+        presets: value for each preset index
+        knob: K2 knob slot (0-3) on the active effect, or None
+        odd: keep int values odd (kernel sizes)
+        smooth: glide knob changes (default: float params only)
+        on_change: name of an effect method to call after the value changes
+    """
+
+    __slots__ = ("name", "lo", "hi", "kind", "curve", "choices", "presets",
+                 "knob", "odd", "smooth", "on_change")
+
+    def __init__(self, lo=0.0, hi=1.0, kind=float, curve="linear", choices=None,
+                 presets=None, knob=None, odd=False, smooth=None, on_change=None):
+        self.name = None
+        self.lo = lo
+        self.hi = hi
+        self.kind = kind
+        self.curve = curve
+        self.choices = tuple(choices) if choices is not None else None
+        self.presets = tuple(presets) if presets is not None else None
+        self.knob = knob
+        self.odd = odd
+        self.smooth = (kind is float and choices is None) if smooth is None else smooth
+        self.on_change = on_change
+
+    def from_knob(self, value):
+        """Map a 0..1 knob value to this parameter's value."""
+        if self.curve == "inv":
+            value = 1.0 - value
+        if self.choices is not None:
+            n = len(self.choices)
+            return self.choices[min(n - 1, int(value * (n - 0.01)))]
+        if self.kind is bool:
+            return value > 0.5
+        x = self.lo + (self.hi - self.lo) * value
+        if self.kind is int:
+            x = int(x)
+            if self.odd and x % 2 == 0:
+                x += 1
+        return x
+
+    def coerce(self, value):
+        """Convert a stored value (e.g. from JSON) to this parameter's type."""
+        if self.choices is not None:
+            return value
+        if self.kind is bool:
+            return bool(value)
+        if self.kind is int:
+            x = int(round(value))
+            if self.odd and x % 2 == 0:
+                x += 1
+            return x
+        return float(value)
+
+    @property
+    def discrete(self):
+        return self.choices is not None or self.kind is bool
+
+
+class ParamSmoother:
+    """Glide knob-driven parameters toward their targets.
+
+    set() registers a target; step() advances every gliding parameter in one
+    vectorized pass per frame (exponential approach with time constant
+    `tau`) and drops the ones that arrived. hold() hands parameters over to
+    another driver (a SceneMorph): their glides are dropped and set() ignores
+    them until release().
+    """
+
+    def __init__(self, tau=0.06):
+        self.tau = tau
+        self._index = {}            # (id(effect), name) -> position
+        self._owners = []           # (effect, Param)
+        self._cur = np.zeros(0)
+        self._tgt = np.zeros(0)
+        self._eps = np.zeros(0)
+        self._held = set()          # (id(effect), name) driven elsewhere
+
+    @property
+    def active(self):
+        return len(self._owners)
+
+    def set(self, effect, param, value):
+        key = (id(effect), param.name)
+        if key in self._held:
+            return
+        idx = self._index.get(key)
+        if idx is None:
+            idx = len(self._owners)
+            self._index[key] = idx
+            self._owners.append((effect, param))
+            self._cur = np.append(self._cur, float(getattr(effect, param.name)))
+            self._tgt = np.append(self._tgt, float(value))
+            self._eps = np.append(self._eps, abs(param.hi - param.lo) * 1e-3)
+        else:
+            self._tgt[idx] = value
+
+    def step(self, dt):
+        if not self._owners:
+            return
+        k = 1.0 - math.exp(-dt / self.tau) if self.tau > 0 else 1.0
+        cur = self._cur
+        cur += (self._tgt - cur) * k
+        done = np.abs(self._tgt - cur) <= self._eps
+        np.copyto(cur, self._tgt, where=done)
+
+        for (effect, param), value in zip(self._owners, cur.tolist()):
+            effect.set_param(param, value)
+
+        if done.any():
+            self._drop(~done)
+
+    def hold(self, owned):
+        """Stop gliding the (effect, Param) pairs in `owned` until release()."""
+        self._held = {(id(e), p.name) for e, p in owned}
+        keep = [(id(e), p.name) not in self._held for e, p in self._owners]
+        if not all(keep):
+            self._drop(np.array(keep, bool))
+
+    def release(self):
+        self._held = set()
+
+    def _drop(self, keep):
+        self._owners = [o for o, k in zip(self._owners, keep) if k]
+        self._cur = self._cur[keep]
+        self._tgt = self._tgt[keep]
+        self._eps = self._eps[keep]
+        self._index = {(id(e), p.name): i for i, (e, p) in enumerate(self._owners)}
+
+    def clear(self):
+        self._index = {}
+        self._owners = []
+        self._cur = np.zeros(0)
+        self._tgt = np.zeros(0)
+        self._eps = np.zeros(0)
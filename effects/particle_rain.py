@@ -1,22 +1,35 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ParticleRain(Effect):
     name = "particle_rain"
 
+    PARAMS = {
+        "speed": Param(0.5, 8.5, knob=0),
+        "max_particles": Param(50, 450, int, knob=1),
+        "direction": Param(choices=(-1, 1), knob=2),
+    }
+
     def __init__(self):
         self.max_particles = 200
         self.speed = 3.0
         self.direction = 1       # 1=down, -1=up
         self.hue_shift = 0.0
+        self.follow = 6.0        # how strongly particles drift with optical flow
+        self._flow_grid = None   # (rows, cols, 2) flow grid from controls
         self._particles = None
         self._frame_shape = None
 
     def reset(self):
         self._particles = None
 
+    def warmup(self, frame):
+        # Keep the particles: a fresh random field is exactly what reset() would rebuild
+        self.apply(frame)
+
     def _init_particles(self, h, w):
         self._frame_shape = (h, w)
         n = self.max_particles
@@ -40,6 +53,16 @@ class ParticleRain(Effect):
         # Update positions
         p[:, 1] += p[:, 2] * self.speed * self.direction
 
+        # Drift with the local optical flow under each particle
+        grid = self._flow_grid
+        if grid is not None:
+            g_rows, g_cols = grid.shape[:2]
+            cx = np.clip((p[:, 0] * (g_cols / w)).astype(np.int32), 0, g_cols - 1)
+            cy = np.clip((p[:, 1] * (g_rows / h)).astype(np.int32), 0, g_rows - 1)
+            local = grid[cy, cx]
+            p[:, 0] = (p[:, 0] + local[:, 0] * w * self.follow) % w
+            p[:, 1] += local[:, 1] * h * self.follow
+
         # Wrap around
         if self.direction > 0:
             mask = p[:, 1] > h
@@ -74,6 +97,9 @@ class ParticleRain(Effect):
         self.hue_shift = 0.5 + 3.0 * m
         self.max_particles = int(100 + 300 * m)
 
+        flow = controls.get("flow")
+        self._flow_grid = flow["grid"] if flow is not None else None
+
         # Direction based on vertical zone movement
         if top > bottom + 0.1:
             self.direction = -1  # upward
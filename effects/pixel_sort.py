@@ -1,10 +1,19 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class PixelSort(Effect):
     name = "pixel_sort"
+    gil_bound = True
+
+    PARAMS = {
+        "threshold": Param(20, 220, int, knob=0, presets=(80, 40, 120)),
+        "intensity": Param(0.0, 1.0, knob=1, presets=(0.5, 0.8, 0.4)),
+        "direction": Param(choices=(0, 1)),
+        "_step": Param(2, 6, int, presets=(4, 2, 6)),
+    }
 
     def __init__(self, threshold=80, direction=0):
         self.threshold = int(threshold)  # brightness threshold for sorting
@@ -15,18 +24,37 @@ class PixelSort(Effect):
     def reset(self):
         self.intensity = 0.5
 
+    @property
+    def tile_safe(self):
+        return self.direction == 0  # horizontal sort: each row on its own
+
     def apply(self, frame):
-        h, w = frame.shape[:2]
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         out = frame.copy()
 
         if self.direction == 1:
             out = cv2.rotate(out, cv2.ROTATE_90_CLOCKWISE)
             gray = cv2.rotate(gray, cv2.ROTATE_90_CLOCKWISE)
-            h, w = out.shape[:2]
 
+        self._sort_rows(out, gray, 0)
+
+        if self.direction == 1:
+            out = cv2.rotate(out, cv2.ROTATE_90_COUNTERCLOCKWISE)
+
+        # Blend with original
+        result = cv2.addWeighted(frame, 1.0 - self.intensity, out, self.intensity, 0)
+        return result
+
+    def apply_tile(self, frame, y0):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        out = frame.copy()
+        # Sorted rows are every _step-th row of the whole frame
+        self._sort_rows(out, gray, -y0 % self._step)
+        return cv2.addWeighted(frame, 1.0 - self.intensity, out, self.intensity, 0)
+
+    def _sort_rows(self, out, gray, first):
         # Sort rows where brightness > threshold
-        for y in range(0, h, self._step):
+        for y in range(first, out.shape[0], self._step):
             row_gray = gray[y]
             mask = row_gray > self.threshold
             indices = np.where(mask)[0]
@@ -39,13 +67,6 @@ class PixelSort(Effect):
             order = np.argsort(lum)
             out[y, start:end] = segment[order]
 
-        if self.direction == 1:
-            out = cv2.rotate(out, cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-        # Blend with original
-        result = cv2.addWeighted(frame, 1.0 - self.intensity, out, self.intensity, 0)
-        return result
-
     def set_controls(self, controls: dict):
         m = float(controls.get("motion", 0.0))
         zones = controls.get("zones", {})
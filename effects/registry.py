@@ -0,0 +1,146 @@
+import importlib
+import json
+import os
+import threading
+from collections.abc import Mapping
+
+ENTRY_POINT_GROUP = "cameravj.effects"
+IDS_FILE = "effect_ids.json"
+PAGE_SIZE = 12  # keys 1-9 - = \ / K2 pads 1-12
+
+
+class EffectSpec:
+    """What the registry knows about an effect before its module is imported."""
+
+    __slots__ = ("eid", "name", "target", "source")
+
+    def __init__(self, eid, name, target, source="builtin"):
+        self.eid = eid
+        self.name = name            # Effect.name (cost table, HUD)
+        self.target = target        # "package.module:ClassName"
+        self.source = source        # "builtin" or the distribution providing it
+
+    def __repr__(self):
+        return f"EffectSpec({self.eid}, {self.name!r}, {self.target!r})"
+
+
+class EffectRegistry(Mapping):
+    """Effect ID -> Effect class, importing each module on first lookup.
+
+    Iteration, len(), `in` and name() only read metadata, so listing effects
+    (paging, the Auto-VJ pool, cost estimates) imports nothing. Built-in
+    effects keep their fixed IDs; effects from third-party packages declared
+    under the "cameravj.effects" entry point group get the next free ID,
+    which is stored in `ids_file` so scenes keep pointing at the same effect
+    across sessions and installs.
+
+    A plugin package declares, e.g. in pyproject.toml:
+
+        [project.entry-points."cameravj.effects"]
+        my_glow = "my_pkg.glow:MyGlow"
+    """
+
+    def __init__(self, builtins=(), ids_file=IDS_FILE, discover=True):
+        self.ids_file = ids_file
+        self._specs = {}
+        self._classes = {}
+        self._lock = threading.Lock()
+        for spec in builtins:
+            self._specs[spec.eid] = spec
+        if discover:
+            self._discover()
+
+    # -------- Discovery --------
+
+    def _load_ids(self):
+        if os.path.exists(self.ids_file):
+            try:
+                with open(self.ids_file, "r") as f:
+                    return {k: int(v) for k, v in json.load(f).items()}
+            except Exception as e:
+                print(f"[effects] failed to load {self.ids_file}: {e}")
+        return {}
+
+    def _save_ids(self, ids):
+        tmp = self.ids_file + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump(ids, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.ids_file)
+        except Exception as e:
+            print(f"[effects] failed to save {self.ids_file}: {e}")
+
+    def _discover(self):
+        try:
+            from importlib.metadata import entry_points
+            eps = entry_points(group=ENTRY_POINT_GROUP)
+        except Exception as e:
+            print(f"[effects] entry point discovery failed: {e}")
+            return
+        if not eps:
+            return
+
+        ids = self._load_ids()
+        taken = set(self._specs) | set(ids.values())
+        changed = False
+        for ep in sorted(eps, key=lambda ep: ep.value):
+            eid = ids.get(ep.value)
+            if eid is None or eid in self._specs:
+                eid = max(taken) + 1 if taken else 1
+                ids[ep.value] = eid
+                taken.add(eid)
+                changed = True
+            dist = getattr(ep, "dist", None)
+            source = dist.metadata["Name"] if dist is not None else ep.value.split(".")[0]
+            self._specs[eid] = EffectSpec(eid, ep.name, ep.value, source)
+            print(f"[effects] plugin {ep.name} ({source}) -> ID {eid}")
+        if changed:
+            self._save_ids(ids)
+
+    # -------- Mapping --------
+
+    def __getitem__(self, eid):
+        cls = self._classes.get(eid)
+        if cls is not None:
+            return cls
+        spec = self._specs[eid]
+        with self._lock:
+            cls = self._classes.get(eid)
+            if cls is None:
+                module_name, _, attr = spec.target.partition(":")
+                try:
+                    module = importlib.import_module(module_name, package=__package__)
+                    cls = getattr(module, attr)
+                except Exception as e:
+                    print(f"[effects] failed to load {spec.name} ({spec.target}): {e}")
+                    raise KeyError(eid) from e
+                self._classes[eid] = cls
+        return cls
+
+    def __iter__(self):
+        return iter(sorted(self._specs))
+
+    def __len__(self):
+        return len(self._specs)
+
+    def __contains__(self, eid):
+        return eid in self._specs
+
+    # -------- Metadata --------
+
+    def spec(self, eid):
+        return self._specs.get(eid)
+
+    def name(self, eid):
+        """Effect name without importing its module (None for unknown IDs)."""
+        spec = self._specs.get(eid)
+        return spec.name if spec is not None else None
+
+    def loaded(self, eid):
+        return eid in self._classes
+
+    def pages(self, per_page=PAGE_SIZE):
+        """Number of pages of `per_page` IDs needed to reach the highest ID."""
+        if not self._specs:
+            return 1
+        return (max(self._specs) - 1) // per_page + 1
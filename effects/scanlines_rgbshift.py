@@ -1,35 +1,48 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ScanlinesRGBShift(Effect):
     name = "scanlines_rgbshift"
+    tile_safe = True
+
+    PARAMS = {
+        "scan_strength": Param(0.05, 0.55, knob=0, presets=(0.20, 0.35, 0.15)),
+        "shift": Param(1, 21, int, knob=1, presets=(3, 6, 10)),
+        "speed": Param(1, 6, int, knob=2, presets=(1, 2, 3)),
+    }
 
     def __init__(self, scan_strength=0.25, shift=4, speed=1):
         self.scan_strength = float(scan_strength)
         self.shift = int(shift)
         self.speed = int(speed)
         self.t = 0
+        self._s = 0
 
     def reset(self):
         self.t = 0
+        self._s = 0
 
-    def apply(self, frame):
+    def begin_frame(self, frame):
         self.t += 1
+        self._s = int(np.sin(self.t * 0.08 * self.speed) * self.shift)
+
+    def apply_tile(self, frame, y0):
         h, w = frame.shape[:2]
 
-        # RGB shift: desplazamos canal R a la derecha y B a la izquierda
+        # RGB shift: desplazamos canal R a la derecha y B a la izquierda (solo horizontal)
         b, g, r = cv2.split(frame)
-        s = int(np.sin(self.t * 0.08 * self.speed) * self.shift)
+        s = self._s
 
         r2 = np.roll(r, s, axis=1)
         b2 = np.roll(b, -s, axis=1)
         out = cv2.merge([b2, g, r2])
 
-        # Scanlines: oscurecer filas alternas
+        # Scanlines: oscurecer filas pares del frame (paridad absoluta, y0 puede ser impar)
         mask = np.ones((h, 1), dtype=np.float32)
-        mask[::2] = 1.0 - self.scan_strength
+        mask[y0 % 2::2] = 1.0 - self.scan_strength
         out = (out.astype(np.float32) * mask[:, None]).clip(0, 255).astype(np.uint8)
 
         return out
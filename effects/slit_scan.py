@@ -1,29 +1,47 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class SlitScan(Effect):
     name = "slit_scan"
 
+    PARAMS = {
+        "buffer_size": Param(10, 60, int, knob=0, presets=(30, 50, 15)),
+        "spread": Param(0.2, 3.2, knob=1, presets=(1.0, 2.0, 0.5)),
+    }
+
     def __init__(self):
         self.buffer_size = 30     # number of frames to keep
         self.spread = 1.0         # how many rows apart in time
         self._buffer = []
+        self._free = []           # frame buffers kept for reuse (reset() moves them here)
         self.t = 0
 
     def reset(self):
+        self._free.extend(self._buffer)
         self._buffer.clear()
         self.t = 0
 
+    def warmup(self, frame):
+        super().warmup(frame)
+        # Storage for the whole window up front: filling it then never allocates
+        while len(self._free) < self.buffer_size:
+            self._free.append(np.empty_like(frame))
+
     def apply(self, frame):
         self.t += 1
         h, w = frame.shape[:2]
 
-        # Add frame to buffer
-        self._buffer.append(frame.copy())
-        if len(self._buffer) > self.buffer_size:
-            self._buffer.pop(0)
+        # Add frame to buffer (recycling the oldest or a spare buffer)
+        if len(self._buffer) >= self.buffer_size:
+            slot = self._buffer.pop(0)
+        else:
+            slot = self._free.pop() if self._free else None
+        self._buffer.append(self._keep(slot, frame))
+        while len(self._buffer) > self.buffer_size:
+            self._free.append(self._buffer.pop(0))
 
         if len(self._buffer) < 2:
             return frame
@@ -1,11 +1,18 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class StrobeFlash(Effect):
     name = "strobe_flash"
 
+    PARAMS = {
+        "rate": Param(1, 13, int, curve="inv", knob=0, presets=(6, 3, 4)),
+        "intensity": Param(0.2, 1.0, knob=1, presets=(0.8, 1.0, 0.9)),
+        "color_mode": Param(choices=(0, 1), knob=2, presets=(0, 0, 1)),
+    }
+
     def __init__(self):
         self.rate = 6          # flash every N frames
         self.intensity = 0.8   # 0..1 flash brightness
@@ -1,10 +1,18 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ThermalVision(Effect):
     name = "thermal_vision"
+    tile_safe = True
+
+    PARAMS = {
+        "contrast": Param(0.8, 2.3, knob=0),
+        "_map_idx": Param(choices=(0, 1, 2), knob=1, presets=(0, 1, 2), on_change="_update_colormap"),
+        "blur": Param(0, 5, int),
+    }
 
     def __init__(self):
         self.colormap = cv2.COLORMAP_JET
@@ -17,14 +25,25 @@ class ThermalVision(Effect):
             cv2.COLORMAP_INFERNO,
         ]
         self._map_idx = 0
+        self._frame_h = 0
 
     def reset(self):
         self.t = 0
         self._map_idx = 0
-        self.colormap = self._colormaps[0]
+        self._update_colormap()
+
+    def _update_colormap(self):
+        self.colormap = self._colormaps[self._map_idx % len(self._colormaps)]
 
-    def apply(self, frame):
+    @property
+    def tile_halo(self):
+        return self.blur    # GaussianBlur radius
+
+    def begin_frame(self, frame):
         self.t += 1
+        self._frame_h = frame.shape[0]
+
+    def apply_tile(self, frame, y0):
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
         # Enhance contrast
@@ -38,11 +57,14 @@ class ThermalVision(Effect):
         # Apply colormap
         out = cv2.applyColorMap(gray, self.colormap)
 
-        # Subtle scan flicker
+        # Subtle scan flicker (rows in frame coordinates: clip to this band)
         if self.t % 3 == 0:
-            row = (self.t * 7) % frame.shape[0]
-            end = min(row + 2, frame.shape[0])
-            out[row:end] = np.clip(out[row:end].astype(np.int16) + 30, 0, 255).astype(np.uint8)
+            full_h = self._frame_h or frame.shape[0]
+            row = (self.t * 7) % full_h
+            end = min(row + 2, full_h)
+            a, b = max(row, y0) - y0, min(end, y0 + frame.shape[0]) - y0
+            if a < b:
+                out[a:b] = np.clip(out[a:b].astype(np.int16) + 30, 0, 255).astype(np.uint8)
 
         return out
 
@@ -55,4 +77,4 @@ class ThermalVision(Effect):
         new_idx = min(2, int(m * 3))
         if new_idx != self._map_idx:
             self._map_idx = new_idx
-            self.colormap = self._colormaps[self._map_idx]
+            self._update_colormap()
@@ -1,11 +1,18 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class VHSRetro(Effect):
     name = "vhs_retro"
 
+    PARAMS = {
+        "tracking_intensity": Param(0.0, 1.0, knob=0, presets=(0.3, 0.7, 0.15)),
+        "color_bleed": Param(1, 16, int, knob=1, presets=(4, 8, 2)),
+        "noise_amount": Param(2, 42, int, knob=2, presets=(12, 25, 6)),
+    }
+
     def __init__(self):
         self.tracking_intensity = 0.3
         self.color_bleed = 4
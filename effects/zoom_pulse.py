@@ -1,15 +1,22 @@
 import cv2
 import numpy as np
 from .base import Effect
+from .params import Param
 
 
 class ZoomPulse(Effect):
     name = "zoom_pulse"
 
+    PARAMS = {
+        "amplitude": Param(0.02, 0.32, knob=0, presets=(0.08, 0.20, 0.04)),
+        "speed": Param(0.04, 0.29, knob=1, presets=(0.12, 0.20, 0.06)),
+    }
+
     def __init__(self):
         self.amplitude = 0.08    # zoom range (0.05 = subtle, 0.2 = intense)
         self.speed = 0.12        # oscillation speed
         self.t = 0
+        self._beat_phase = None  # MIDI clock phase (0..1) when synced
 
     def reset(self):
         self.t = 0
@@ -19,8 +26,12 @@ class ZoomPulse(Effect):
         h, w = frame.shape[:2]
         cx, cy = w // 2, h // 2
 
-        # Sinusoidal zoom factor
-        zoom = 1.0 + np.sin(self.t * self.speed) * self.amplitude
+        if self._beat_phase is not None:
+            # Locked to the clock: kick on each beat, easing out until the next
+            zoom = 1.0 + (1.0 - self._beat_phase) ** 2 * self.amplitude
+        else:
+            # Sinusoidal zoom factor
+            zoom = 1.0 + np.sin(self.t * self.speed) * self.amplitude
 
         # Zoom from center using affine transform
         M = cv2.getRotationMatrix2D((cx, cy), 0, zoom)
@@ -35,6 +46,7 @@ class ZoomPulse(Effect):
 
         self.amplitude = 0.04 + 0.20 * m
         self.speed = 0.08 + 0.15 * m
+        self._beat_phase = controls.get("beat_phase") if controls.get("clock") else None
 
         # Bass drives amplitude
         if bass > 0.3:
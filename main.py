@@ -1,11 +1,19 @@
+import time
+
+_T0 = time.perf_counter()
+
 import config
 from capture.camera import CameraCapture
 from pipeline.runner import PipelineRunner
+from pipeline.startup import StartupTimer
 
 
 def main():
+    startup = StartupTimer(_T0)
+    startup.mark("imports")
     cam = CameraCapture(config.CAMERA_INDEX, config.CAPTURE_BACKEND).open()
-    runner = PipelineRunner(cam)
+    startup.mark("camera")
+    runner = PipelineRunner(cam, startup=startup)
     try:
         runner.run()
     finally:
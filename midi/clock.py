@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import deque
+
+PPQN = 24  # MIDI clock ticks per quarter note
+
+
+class MidiClock:
+    """Tempo and beat phase from MIDI clock (0xF8) and start/continue/stop.
+
+    tick() is called from the MIDI callback with the message timestamp.
+    BPM comes from a least-squares fit over the last `window` ticks (two
+    beats by default), which averages out per-tick jitter of USB/driver
+    delivery, and is then lightly smoothed. The clock counts as present
+    while ticks keep arriving (see `timeout`); after a gap longer than that,
+    or a MIDI start, the fit starts over so ticks from before the pause
+    never drag the new tempo.
+    """
+
+    def __init__(self, window=48, smooth=0.2, timeout=0.5):
+        self.window = window
+        self.smooth = smooth
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._times = deque(maxlen=window)
+        self._ticks = 0             # ticks since start (position in the song)
+        self._last_tick = None
+        self._interval = None       # filtered seconds per tick
+        self._running = True
+        self._last_beat = -1
+        self.bpm = 0.0
+
+    def tick(self, ts):
+        with self._lock:
+            if self._last_tick is not None and ts - self._last_tick > self.timeout:
+                self._restart_fit()
+            self._times.append(ts)
+            self._last_tick = ts
+            if self._running:
+                self._ticks += 1
+            n = len(self._times)
+            if n >= 8:
+                # Slope of time vs tick index
+                t0 = self._times[0]
+                mean_i = (n - 1) / 2.0
+                mean_t = sum(t - t0 for t in self._times) / n
+                num = sum((i - mean_i) * (t - t0 - mean_t) for i, t in enumerate(self._times))
+                den = n * (n * n - 1) / 12.0
+                interval = num / den
+                if interval > 0:
+                    if self._interval is None:
+                        self._interval = interval
+                    else:
+                        self._interval += (interval - self._interval) * self.smooth
+                    self.bpm = 60.0 / (self._interval * PPQN)
+
+    def start(self):
+        """MIDI start: song position back to the first beat."""
+        with self._lock:
+            self._ticks = 0
+            self._last_beat = -1
+            self._running = True
+            self._restart_fit()
+
+    def _restart_fit(self):
+        self._times.clear()
+        self._interval = None
+
+    def resume(self):
+        with self._lock:
+            self._running = True
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+
+    def handle(self, msg, ts):
+        """Route a realtime message. Returns True if it was a clock message."""
+        kind = msg.type
+        if kind == "clock":
+            self.tick(ts)
+        elif kind == "start":
+            self.start()
+        elif kind == "continue":
+            self.resume()
+        elif kind == "stop":
+            self.stop()
+        else:
+            return False
+        return True
+
+    def present(self, now=None):
+        if self._last_tick is None or self._interval is None:
+            return False
+        if now is None:
+            now = time.perf_counter()
+        return now - self._last_tick < self.timeout
+
+    def controls(self, now=None):
+        """Controls dict for this frame, or None without a live clock.
+
+        {"bpm": float, "beat_phase": 0..1, "beat": 1.0 on the first frame of
+        each beat else 0.0, "clock": 1.0}
+        """
+        if now is None:
+            now = time.perf_counter()
+        if not self.present(now):
+            return None
+        with self._lock:
+            ticks = self._ticks
+            since = now - self._last_tick
+            interval = self._interval
+            running = self._running
+        # Interpolate between ticks (at most one tick ahead)
+        frac = min(1.0, since / interval) if running else 0.0
+        pos = (ticks - 1 + frac) / PPQN if ticks > 0 else 0.0
+        beat_idx = int(pos)
+        phase = pos - beat_idx
+        beat = 0.0
+        if running and beat_idx != self._last_beat:
+            self._last_beat = beat_idx
+            beat = 1.0
+        return {"bpm": self.bpm, "beat_phase": phase, "beat": beat, "clock": 1.0}
@@ -1,3 +1,4 @@
+from .clock import MidiClock
 from .input import MidiInput, HAS_MIDO
 from .mapper import K2State
 
@@ -10,14 +11,21 @@ class MidiController:
     - Pad 13: Clear stack
     - Pad 14: Toggle Auto-VJ (placeholder)
     - Pad 15: Toggle Audio
-    - Pad 16: Toggle Pose
+    - Pad 16: Next effect page
     - Knobs 1-4: Params of active effect (dynamic)
     - Knobs 5-8: motion_gain, deadzone, preset, reserved
     - Fader: Global intensity (mix original/processed)
+    - Replay button: save instant replay buffer
+
+    MIDI clock on the same port (or on `clock_port`) drives `clock`, whose
+    bpm / beat_phase / beat are merged into the frame controls.
     """
 
-    def __init__(self):
-        self.input = MidiInput()
+    def __init__(self, clock_port=None):
+        self.clock = MidiClock()
+        self.clock_port = clock_port
+        self.input = MidiInput(clock=self.clock)
+        self.clock_input = None
         self.state = K2State()
         self._enabled = False
         self._available = HAS_MIDO
@@ -44,11 +52,18 @@ class MidiController:
         if self._enabled:
             return True
         ok = self.input.start()
+        if ok and self.clock_port:
+            self.clock_input = MidiInput(clock=self.clock)
+            if not self.clock_input.start(self.clock_port):
+                self.clock_input = None
         self._enabled = ok
         return ok
 
     def stop(self):
         self.input.stop()
+        if self.clock_input is not None:
+            self.clock_input.stop()
+            self.clock_input = None
         self._enabled = False
         print("[midi] disabled")
 
@@ -61,14 +76,19 @@ class MidiController:
         if not self._enabled:
             return
 
-        msgs = self.input.poll()
-        for msg in msgs:
+        for _, msg in self.input.poll():
             event = self.state.process_message(msg)
             if event is None:
                 continue
 
             self._handle_event(event, runner)
 
+    def clock_controls(self):
+        """bpm/beat_phase/beat from MIDI clock, or None if no clock is running."""
+        if not self._enabled:
+            return None
+        return self.clock.controls()
+
     def _handle_event(self, event, runner):
         etype = event[0]
 
@@ -85,14 +105,13 @@ class MidiController:
             value = event[1]
             self._handle_fader(value, runner)
 
-    def _handle_pad(self, pad_num, runner):
-        from effects import EFFECTS_FACTORY
+        elif etype == "button":
+            self._handle_button(event[1], runner)
 
+    def _handle_pad(self, pad_num, runner):
         if 1 <= pad_num <= 12:
             # Toggle effect (page-aware, same as keyboard)
-            effect_id = pad_num + runner.fx_page * 12
-            if effect_id in EFFECTS_FACTORY:
-                runner._toggle_effect(effect_id)
+            runner._toggle_page_effect(pad_num)
 
         elif pad_num == 13:
             runner._clear_effects()
@@ -104,8 +123,8 @@ class MidiController:
             runner.audio.toggle()
 
         elif pad_num == 16:
-            # Page toggle (same as 'n' key)
-            runner.fx_page = 1 - runner.fx_page
+            # Next page (same as 'n' key)
+            runner._next_page()
 
     def _handle_knob(self, knob_idx, value, runner):
         import config
@@ -127,145 +146,17 @@ class MidiController:
             preset = int(value * 2.99)
             runner._apply_preset(preset)
 
+    def _handle_button(self, name, runner):
+        if name == "replay":
+            runner._dump_replay()
+
     def _handle_fader(self, value, runner):
         # Store fader value for global mix (used in runner)
         runner._midi_fader = value
 
     def _map_knob_to_effect(self, knob_idx, value, runner):
-        """Map knobs 1-4 to active effect parameters dynamically."""
+        """Map knobs 1-4 to active effect parameters (slots from the effect's PARAMS)."""
         effect, eid = runner._active_effect()
         if effect is None:
             return
-
-        name = getattr(effect, "name", "")
-
-        # Each effect gets its own knob mapping
-        if name == "color_posterize":
-            if knob_idx == 0:
-                effect.levels = int(2 + 14 * value)
-            elif knob_idx == 1:
-                effect.speed = 0.01 + 0.15 * value
-
-        elif name == "feedback_glitch":
-            if knob_idx == 0:
-                effect.feedback = 0.80 + 0.18 * value
-            elif knob_idx == 1:
-                effect.warp = int(1 + 20 * value)
-            elif knob_idx == 2:
-                effect.noise = int(1 + 30 * value)
-
-        elif name == "contours_glow":
-            if knob_idx == 0:
-                effect.t1 = int(10 + 90 * value)
-            elif knob_idx == 1:
-                effect.t2 = int(50 + 200 * value)
-            elif knob_idx == 2:
-                k = int(3 + 20 * value)
-                effect.blur_ksize = k if k % 2 == 1 else k + 1
-
-        elif name == "scanlines_rgbshift":
-            if knob_idx == 0:
-                effect.scan_strength = 0.05 + 0.50 * value
-            elif knob_idx == 1:
-                effect.shift = int(1 + 20 * value)
-            elif knob_idx == 2:
-                effect.speed = int(1 + 5 * value)
-
-        elif name == "chromatic_aberration":
-            if knob_idx == 0:
-                effect.strength = int(2 + 30 * value)
-
-        elif name == "pixel_sort":
-            if knob_idx == 0:
-                effect.threshold = int(20 + 200 * value)
-            elif knob_idx == 1:
-                effect.intensity = value
-
-        elif name == "strobe_flash":
-            if knob_idx == 0:
-                effect.rate = max(1, int(1 + 12 * (1.0 - value)))
-            elif knob_idx == 1:
-                effect.intensity = 0.2 + 0.8 * value
-            elif knob_idx == 2:
-                effect.color_mode = 1 if value > 0.5 else 0
-
-        elif name == "edge_neon":
-            if knob_idx == 0:
-                effect.hue_speed = 0.5 + 8.0 * value
-            elif knob_idx == 1:
-                effect.glow_size = int(1 + 12 * value)
-
-        elif name == "vhs_retro":
-            if knob_idx == 0:
-                effect.tracking_intensity = value
-            elif knob_idx == 1:
-                effect.color_bleed = int(1 + 15 * value)
-            elif knob_idx == 2:
-                effect.noise_amount = int(2 + 40 * value)
-
-        elif name == "motion_trails":
-            if knob_idx == 0:
-                effect.persist = 0.70 + 0.28 * value
-            elif knob_idx == 1:
-                effect.glow = 0.5 * value
-
-        elif name == "thermal_vision":
-            if knob_idx == 0:
-                effect.contrast = 0.8 + 1.5 * value
-            elif knob_idx == 1:
-                effect._map_idx = int(value * 2.99)
-                effect.colormap = effect._colormaps[effect._map_idx]
-
-        elif name == "glitch_blocks":
-            if knob_idx == 0:
-                effect.block_count = int(2 + 20 * value)
-            elif knob_idx == 1:
-                effect.max_shift = int(5 + 80 * value)
-            elif knob_idx == 2:
-                effect.intensity = value
-
-        elif name == "ascii_art":
-            if knob_idx == 0:
-                effect.cell_size = max(4, int(4 + 12 * (1.0 - value)))
-            elif knob_idx == 1:
-                effect.colored = value > 0.5
-
-        elif name == "particle_rain":
-            if knob_idx == 0:
-                effect.speed = 0.5 + 8.0 * value
-            elif knob_idx == 1:
-                effect.max_particles = int(50 + 400 * value)
-            elif knob_idx == 2:
-                effect.direction = -1 if value < 0.5 else 1
-
-        elif name == "color_invert_pulse":
-            if knob_idx == 0:
-                effect.rate = max(2, int(2 + 15 * (1.0 - value)))
-            elif knob_idx == 1:
-                effect.smooth = 0.05 + 0.4 * value
-
-        elif name == "datamosh":
-            if knob_idx == 0:
-                effect.corruption = 0.05 + 0.7 * value
-            elif knob_idx == 1:
-                effect.intensity = 0.2 + 0.7 * value
-            elif knob_idx == 2:
-                effect.block_size = max(8, int(8 + 32 * (1.0 - value)))
-
-        elif name == "zoom_pulse":
-            if knob_idx == 0:
-                effect.amplitude = 0.02 + 0.30 * value
-            elif knob_idx == 1:
-                effect.speed = 0.04 + 0.25 * value
-
-        elif name == "duotone":
-            if knob_idx == 0:
-                effect.palette_idx = int(value * 4.99)
-            elif knob_idx == 1:
-                effect.contrast = 0.6 + 1.5 * value
-
-        elif name == "slit_scan":
-            if knob_idx == 0:
-                effect.buffer_size = int(10 + 50 * value)
-            elif knob_idx == 1:
-                effect.spread = 0.2 + 3.0 * value
+        effect.set_knob(knob_idx, value, runner.param_smoother)
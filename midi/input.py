@@ -1,26 +1,50 @@
+import importlib
+import importlib.util
 import threading
+import time
 
-try:
-    import mido
-    HAS_MIDO = True
-except ImportError:
-    HAS_MIDO = False
+# mido (and its rtmidi backend) is imported on first use, not at startup
+HAS_MIDO = importlib.util.find_spec("mido") is not None
+mido = None
+
+
+def load_mido():
+    """Import mido and its default backend once. Returns the module, or None."""
+    global mido
+    if mido is None and HAS_MIDO:
+        try:
+            module = importlib.import_module("mido")
+            module.backend.load()
+            mido = module
+        except Exception as e:
+            print(f"[midi] failed to load mido: {e}")
+    return mido
 
 
 class MidiInput:
-    """MIDI input receiver using mido. Auto-detects K2 controller."""
+    """MIDI input receiver using mido. Auto-detects K2 controller.
+
+    Messages arrive through the port callback (no polling thread) and are
+    stamped with time.perf_counter(). Control changes are coalesced: only the
+    latest value per (channel, control) is kept until the next poll(), so a
+    fast knob sweep costs one update per frame. Notes and all other messages
+    are kept in order. Clock/start/continue/stop messages go straight to
+    `clock` (a MidiClock) from the callback and are not queued.
+    """
 
     K2_NAMES = ["traktor", "kontrol", "k2", "ni k2"]
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock
         self._port = None
         self._running = False
-        self._messages = []
+        self._messages = []         # (ts, msg), every non-CC message
+        self._cc = {}               # (channel, control) -> (ts, msg), latest only
         self._lock = threading.Lock()
-        self._thread = None
+        self.coalesced = 0          # CC messages replaced before a poll()
 
     def start(self, port_name=None):
-        if not HAS_MIDO:
+        if load_mido() is None:
             print("[midi] mido not installed. Install with: pip install mido python-rtmidi")
             return False
 
@@ -37,19 +61,18 @@ class MidiInput:
                 return False
 
         try:
-            self._port = mido.open_input(port_name)
             self._running = True
-            self._thread = threading.Thread(target=self._read_loop, daemon=True)
-            self._thread.start()
+            self._port = mido.open_input(port_name, callback=self._on_message)
             print(f"[midi] Connected to: {port_name}")
             return True
         except Exception as e:
+            self._running = False
             print(f"[midi] Failed to open {port_name}: {e}")
             return False
 
     def _find_k2(self):
         """Auto-detect Native Instruments K2."""
-        if not HAS_MIDO:
+        if load_mido() is None:
             return None
         for name in mido.get_input_names():
             lower = name.lower()
@@ -58,23 +81,33 @@ class MidiInput:
                     return name
         return None
 
-    def _read_loop(self):
-        while self._running and self._port:
-            try:
-                for msg in self._port.iter_pending():
-                    with self._lock:
-                        self._messages.append(msg)
-            except Exception:
-                break
-            # Small sleep to avoid busy-waiting
-            import time
-            time.sleep(0.002)
+    def _on_message(self, msg):
+        """Port callback (runs on the MIDI backend's thread)."""
+        ts = time.perf_counter()
+        if self.clock is not None and self.clock.handle(msg, ts):
+            return
+        with self._lock:
+            if msg.type == "control_change":
+                key = (msg.channel, msg.control)
+                if key in self._cc:
+                    self.coalesced += 1
+                self._cc[key] = (ts, msg)
+            else:
+                self._messages.append((ts, msg))
 
     def poll(self):
-        """Return and clear pending messages."""
+        """Return and clear pending (timestamp, message) pairs, oldest first."""
         with self._lock:
-            msgs = self._messages[:]
-            self._messages.clear()
+            if not self._messages and not self._cc:
+                return []
+            msgs = self._messages
+            self._messages = []
+            ccs = self._cc
+            self._cc = {}
+        if not ccs:
+            return msgs
+        msgs.extend(ccs.values())
+        msgs.sort(key=lambda item: item[0])
         return msgs
 
     def stop(self):
@@ -10,6 +10,7 @@ Default K2 mapping (may need adjustment based on actual K2 config):
 - Pads 1-16: Notes 36-51 (bottom-left to top-right)
 - Knobs 1-8: CC 16-23
 - Fader: CC 7
+- Replay button: Note 52 (first button above the pads)
 """
 
 
@@ -30,6 +31,11 @@ KNOB_CCS = {
 # --- Fader CC ---
 FADER_CC = 7
 
+# --- Extra buttons (note -> action name) ---
+BUTTON_NOTES = {
+    52: "replay",   # dump instant replay buffer
+}
+
 
 class K2State:
     """Holds parsed K2 controller state."""
@@ -47,6 +53,10 @@ class K2State:
                 self.pads[pad_num] = True
                 return ("pad", pad_num)
 
+            button = BUTTON_NOTES.get(msg.note)
+            if button is not None:
+                return ("button", button)
+
         elif msg.type == "control_change":
             knob_idx = KNOB_CCS.get(msg.control)
             if knob_idx is not None:
@@ -0,0 +1 @@
+from .controller import OscController
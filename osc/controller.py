@@ -0,0 +1,151 @@
+import threading
+
+from .server import OscServer
+
+
+class OscController:
+    """OSC control surface for CameraVJ.
+
+    Address map (values are 0..1 unless noted):
+    - /fx/<id>/toggle [0|1]   toggle effect, or force off/on with an argument
+    - /fx/<id>/<param> value  set a PARAMS entry of the effect (knob mapping)
+    - /fx/clear               clear the stack
+    - /scene/<n>              load scene slot n (morphs when morph mode is on)
+    - /fader value            global mix, like the K2 fader
+    - /preset <i>             preset index for the active effect
+    - /autovj [0|1]           toggle Auto-VJ, or force off/on
+
+    Packets are queued by the server thread and applied in poll() at the
+    next frame boundary: a bundle is applied as a whole, and for continuous
+    addresses (parameters, fader) only the latest value per address in a
+    frame is kept (coalesced as packets arrive). At most MAX_PENDING
+    discrete messages wait for a frame; a flooding sender's extra messages
+    are dropped and counted in `dropped`.
+    """
+
+    MAX_PENDING = 256
+
+    def __init__(self, host="127.0.0.1", port=9000):
+        self.server = OscServer(host, port, self._on_packet)
+        self._pending = []          # (seq, address, args), discrete messages
+        self._latest = {}           # continuous address -> (seq, args)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._enabled = False
+        self.received = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def toggle(self):
+        if self._enabled:
+            self.stop()
+        else:
+            self.start()
+        return self._enabled
+
+    def start(self):
+        if self._enabled:
+            return True
+        self._enabled = self.server.start()
+        if self._enabled:
+            print(f"[osc] listening on udp://{self.server.host}:{self.server.port}")
+        return self._enabled
+
+    def stop(self):
+        if self._enabled:
+            self.server.stop()
+            print("[osc] disabled")
+        self._enabled = False
+
+    def _on_packet(self, messages):
+        """Called on the server thread with one decoded datagram."""
+        with self._lock:
+            for address, args in messages:
+                self._seq += 1
+                if self._continuous(address):
+                    if address in self._latest:
+                        self.coalesced += 1
+                    elif len(self._latest) >= self.MAX_PENDING:
+                        self.dropped += 1
+                        continue
+                    self._latest[address] = (self._seq, args)
+                elif len(self._pending) < self.MAX_PENDING:
+                    self._pending.append((self._seq, address, args))
+                else:
+                    self.dropped += 1
+            self.received += len(messages)
+
+    def poll(self, runner, controls):
+        """Apply queued messages to runner (call once per frame)."""
+        if not self._enabled:
+            return
+        with self._lock:
+            if not self._pending and not self._latest:
+                return
+            msgs = self._pending
+            self._pending = []
+            latest = self._latest
+            self._latest = {}
+
+        # Continuous addresses (latest value only) back in arrival order
+        if latest:
+            msgs.extend((seq, address, args) for address, (seq, args) in latest.items())
+            msgs.sort(key=lambda m: m[0])
+        for _, address, args in msgs:
+            try:
+                self._dispatch(address, args, runner, controls)
+            except (IndexError, TypeError, ValueError) as e:
+                print(f"[osc] {address} {args}: {e}")
+
+    @staticmethod
+    def _continuous(address):
+        if address == "/fader":
+            return True
+        return address.startswith("/fx/") and address.count("/") == 3 and not address.endswith("/toggle")
+
+    def _dispatch(self, address, args, runner, controls):
+        from effects import EFFECTS_FACTORY
+
+        parts = address.strip("/").split("/")
+        head = parts[0]
+
+        if head == "fx":
+            if len(parts) == 2 and parts[1] == "clear":
+                runner._clear_effects()
+                return
+            if len(parts) != 3:
+                return
+            eid = int(parts[1])
+            if eid not in EFFECTS_FACTORY:
+                return
+            if parts[2] == "toggle":
+                active = eid in runner._stack_ids()
+                if not args or bool(args[0]) != active:
+                    runner._toggle_effect(eid)
+                return
+            effect = runner._get_effect(eid)
+            param = effect.PARAMS.get(parts[2])
+            if param is None:
+                return
+            value = param.from_knob(min(1.0, max(0.0, float(args[0]))))
+            if param.smooth:
+                runner.param_smoother.set(effect, param, value)
+            else:
+                effect.set_param(param, value)
+
+        elif head == "scene" and len(parts) == 2:
+            runner.scene_mgr.load_scene(int(parts[1]), runner, runner._morph_seconds(controls))
+
+        elif head == "fader":
+            runner._midi_fader = min(1.0, max(0.0, float(args[0])))
+
+        elif head == "preset":
+            runner._apply_preset(int(args[0]))
+
+        elif head == "autovj":
+            if not args or bool(args[0]) != runner.autovj.enabled:
+                runner.autovj.toggle()
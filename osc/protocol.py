@@ -0,0 +1,133 @@
+"""
+Minimal OSC 1.0 codec (messages and bundles) for the control server.
+
+Supported argument types: i f d h s S b T F N I.
+"""
+import struct
+
+
+class OscError(ValueError):
+    pass
+
+
+def _unpack(fmt, data, off):
+    try:
+        return struct.unpack_from(fmt, data, off)[0]
+    except struct.error:
+        raise OscError(f"truncated packet (need {struct.calcsize(fmt)} bytes at {off})") from None
+
+
+def _read_string(data, off):
+    end = data.find(b"\0", off)
+    if end < 0:
+        raise OscError("unterminated string")
+    return data[off:end].decode("utf-8", "replace"), (end + 4) & ~3
+
+
+def _read_blob(data, off):
+    size = _unpack(">i", data, off)
+    off += 4
+    if size < 0 or off + size > len(data):
+        raise OscError(f"bad blob size {size}")
+    return bytes(data[off:off + size]), (off + size + 3) & ~3
+
+
+def decode_message(data):
+    """Decode one OSC message into (address, args)."""
+    address, off = _read_string(data, 0)
+    if not address.startswith("/"):
+        raise OscError(f"bad address {address!r}")
+    if off >= len(data):
+        return address, []
+    tags, off = _read_string(data, off)
+    if not tags.startswith(","):
+        raise OscError("missing type tags")
+
+    args = []
+    for tag in tags[1:]:
+        if tag == "i":
+            args.append(_unpack(">i", data, off))
+            off += 4
+        elif tag == "f":
+            args.append(_unpack(">f", data, off))
+            off += 4
+        elif tag == "d":
+            args.append(_unpack(">d", data, off))
+            off += 8
+        elif tag == "h":
+            args.append(_unpack(">q", data, off))
+            off += 8
+        elif tag in "sS":
+            s, off = _read_string(data, off)
+            args.append(s)
+        elif tag == "b":
+            b, off = _read_blob(data, off)
+            args.append(b)
+        elif tag == "T":
+            args.append(True)
+        elif tag == "F":
+            args.append(False)
+        elif tag == "N":
+            args.append(None)
+        elif tag == "I":
+            args.append(1)
+        else:
+            raise OscError(f"unsupported type tag {tag!r}")
+    return address, args
+
+
+def decode_packet(data):
+    """Decode a datagram into a list of (address, args), flattening bundles in order."""
+    data = memoryview(data).tobytes() if not isinstance(data, bytes) else data
+    if data.startswith(b"#bundle\0"):
+        out = []
+        off = 16  # "#bundle\0" + 8-byte timetag (applied immediately)
+        while off + 4 <= len(data):
+            size = _unpack(">i", data, off)
+            off += 4
+            if size < 0 or off + size > len(data):
+                raise OscError(f"bad bundle element size {size}")
+            out.extend(decode_packet(data[off:off + size]))
+            off += size
+        return out
+    return [decode_message(data)]
+
+
+def _pad(b):
+    return b + b"\0" * (4 - len(b) % 4)
+
+
+def encode_message(address, *args):
+    """Encode an OSC message (ints, floats, strings, bools, None)."""
+    tags = ","
+    payload = b""
+    for a in args:
+        if a is True:
+            tags += "T"
+        elif a is False:
+            tags += "F"
+        elif a is None:
+            tags += "N"
+        elif isinstance(a, int):
+            tags += "i"
+            payload += struct.pack(">i", a)
+        elif isinstance(a, float):
+            tags += "f"
+            payload += struct.pack(">f", a)
+        elif isinstance(a, str):
+            tags += "s"
+            payload += _pad(a.encode())
+        elif isinstance(a, (bytes, bytearray)):
+            tags += "b"
+            payload += struct.pack(">i", len(a)) + bytes(a) + b"\0" * (-len(a) % 4)
+        else:
+            raise OscError(f"cannot encode {type(a).__name__}")
+    return _pad(address.encode()) + _pad(tags.encode()) + payload
+
+
+def encode_bundle(*messages):
+    """Encode a bundle of already encoded messages (timetag: immediately)."""
+    out = b"#bundle\0" + struct.pack(">Q", 1)
+    for m in messages:
+        out += struct.pack(">i", len(m)) + m
+    return out
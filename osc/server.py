@@ -0,0 +1,97 @@
+import asyncio
+import socket
+import threading
+
+from .protocol import OscError, decode_packet
+
+
+class _OscProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server):
+        self.server = server
+
+    def datagram_received(self, data, addr):
+        try:
+            messages = decode_packet(data)
+        except (OscError, IndexError, ValueError) as e:
+            self.server.errors += 1
+            if self.server.errors <= 3:
+                print(f"[osc] bad packet from {addr[0]}: {e}")
+            return
+        self.server.on_packet(messages)
+
+
+class OscServer:
+    """OSC-over-UDP receiver on its own asyncio event loop thread.
+
+    Every datagram (a message or a whole bundle) is decoded on the loop
+    thread and handed to `on_packet` as one list, so a bundle always arrives
+    in one piece.
+    """
+
+    RCVBUF = 1 << 20    # room for bursts from fast senders (kernel default is ~200 KB)
+
+    def __init__(self, host, port, on_packet):
+        self.host = host
+        self.port = port
+        self.on_packet = on_packet
+        self.errors = 0
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return True
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True, name="osc")
+        self._thread.start()
+        self._ready.wait(2.0)
+        if self._error is not None:
+            print(f"[osc] Failed to bind {self.host}:{self.port}: {self._error}")
+            self._thread.join()
+            self._thread = None
+            return False
+        return True
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RCVBUF)
+                sock.bind((self.host, self.port))
+            except OSError:
+                sock.close()
+                raise
+            transport, _ = loop.run_until_complete(loop.create_datagram_endpoint(
+                lambda: _OscProtocol(self), sock=sock
+            ))
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            transport.close()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+            self._loop = None
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
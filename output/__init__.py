@@ -1,2 +1,5 @@
 from .virtualcam import VirtualCamOutput
 from .recorder import VideoRecorder
+from .framebus import FrameBusPublisher, FrameBusReader
+from .exporter import ImageExporter
+from .replay import ReplayBuffer
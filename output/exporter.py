@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+
+class ImageExporter:
+    """Encode screenshots and burst sequences on a small worker pool.
+
+    The render thread only copies the frame; PNG/JPEG encoding runs on
+    `workers` threads (cv2.imwrite releases the GIL, so they scale across
+    cores). At most `max_pending` frames wait for encoding; beyond that new
+    frames are dropped and counted instead of growing memory.
+    """
+
+    FORMATS = {
+        "png": [cv2.IMWRITE_PNG_COMPRESSION, 1],
+        "jpg": [cv2.IMWRITE_JPEG_QUALITY, 92],
+    }
+
+    def __init__(self, output_dir="output", workers=3, max_pending=32):
+        self.output_dir = output_dir
+        self.workers = max(1, int(workers))
+        self._slots = threading.BoundedSemaphore(max(1, int(max_pending)))
+        self._pool = None
+        self.dropped = 0
+
+        self._burst_end = None
+        self._burst_dir = None
+        self._burst_fmt = "jpg"
+        self._burst_count = 0
+
+    @property
+    def bursting(self):
+        return self._burst_end is not None
+
+    def _submit(self, frame, path, params=None):
+        if not self._slots.acquire(blocking=False):
+            self.dropped += 1
+            return False
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="export")
+        self._pool.submit(self._encode, frame.copy(), path, params or [])
+        return True
+
+    def _encode(self, frame, path, params):
+        try:
+            if not cv2.imwrite(path, frame, params):
+                print(f"[export] failed to write {path}")
+        finally:
+            self._slots.release()
+
+    def snapshot(self, frame):
+        """Queue a PNG screenshot. Returns its path, or None if dropped (all slots busy)."""
+        ts = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"snap-{ts}.png")
+        if not self._submit(frame, path):
+            return None
+        return path
+
+    def start_burst(self, seconds, fmt="jpg"):
+        """Export every frame passed to feed() for the next `seconds`."""
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown burst format: {fmt!r} (options: {', '.join(self.FORMATS)})")
+        if self.bursting:
+            return self._burst_dir
+        ts = time.strftime("%Y%m%d-%H%M%S")
+        self._burst_dir = os.path.join(self.output_dir, f"burst-{ts}")
+        os.makedirs(self._burst_dir, exist_ok=True)
+        self._burst_fmt = fmt
+        self._burst_count = 0
+        self._burst_dropped = self.dropped
+        self._burst_end = time.perf_counter() + seconds
+        print(f"[export] burst {seconds:.1f}s -> {self._burst_dir}")
+        return self._burst_dir
+
+    def feed(self, frame, ts=None):
+        """Call once per frame; exports it while a burst is running."""
+        if not self.bursting:
+            return
+        if ts is None:
+            ts = time.perf_counter()
+        if ts >= self._burst_end:
+            self._finish_burst()
+            return
+        path = os.path.join(self._burst_dir, f"frame-{self._burst_count:05d}.{self._burst_fmt}")
+        if self._submit(frame, path, self.FORMATS[self._burst_fmt]):
+            self._burst_count += 1
+
+    def _finish_burst(self):
+        dropped = self.dropped - self._burst_dropped
+        print(f"[export] burst done: {self._burst_count} frames ({dropped} dropped) in {self._burst_dir}")
+        self._burst_end = None
+
+    def stop(self):
+        """Finish pending encodes."""
+        if self.bursting:
+            self._finish_burst()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -0,0 +1,240 @@
+"""
+Shared-memory frame bus: publish rendered frames to other local processes.
+
+Layout of the shared memory block (little endian):
+- bus header (64 bytes): magic "CVJB", version, slots, width, height,
+  channels, latest slot, latest sequence number, publisher pid (offset 40)
+- per slot: header (64 bytes) + width*height*channels bytes of pixels
+  slot header: seq (odd while being written), timestamp, height, width,
+  channels, format ("BGR8")
+
+The publisher writes round-robin into `slots` buffers (triple buffering by
+default), so a reader has ~2 frame periods to use a frame before it is
+overwritten. Readers detect torn reads through the slot seq (seqlock),
+which must equal 2 * the header's latest sequence number.
+"""
+import os
+import struct
+import sys
+import time
+
+import cv2
+import numpy as np
+
+try:
+    from multiprocessing import shared_memory
+    HAS_SHM = True
+except ImportError:
+    HAS_SHM = False
+
+
+MAGIC = b"CVJB"
+VERSION = 1
+FORMAT = b"BGR8"
+
+_BUS_HDR = struct.Struct("<4sIIIIIiQ")      # magic, version, slots, w, h, c, latest_slot, latest_seq
+_SLOT_HDR = struct.Struct("<QdIII8s")       # seq, ts, h, w, c, format
+_HDR_SIZE = 64
+_OWNER_OFF = 40                             # publisher pid (uint32) in the bus header
+
+
+def _pid_alive(pid):
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        return True     # Windows drops the block with its last handle: it has a live owner
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _slot_size(width, height, channels):
+    data = width * height * channels
+    return _HDR_SIZE + (data + 63) // 64 * 64
+
+
+class FrameBusPublisher:
+    """Publish frames into shared memory for zero-copy readers (see FrameBusReader)."""
+
+    def __init__(self, name="cameravj", slots=3):
+        self.name = name
+        self.slots = max(2, int(slots))
+        self._shm = None
+        self._views = []
+        self._enabled = False
+        self._available = HAS_SHM
+        self._seq = 0
+        self._slot = -1
+
+    @property
+    def available(self):
+        return self._available
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def toggle(self, frame_size=None):
+        """Toggle publishing on/off. Pass current frame size (h, w) when starting."""
+        if self._enabled:
+            self.stop()
+        elif frame_size:
+            self.start(frame_size[1], frame_size[0])
+        else:
+            print("[bus] Need frame size to start publishing")
+        return self._enabled
+
+    def start(self, width, height, channels=3):
+        if not self._available:
+            print("[bus] multiprocessing.shared_memory not available (Python 3.8+)")
+            return False
+        if self._enabled:
+            return True
+
+        self.width, self.height, self.channels = int(width), int(height), int(channels)
+        slot_size = _slot_size(self.width, self.height, self.channels)
+        size = _HDR_SIZE + self.slots * slot_size
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        except FileExistsError:
+            # Only replace a leftover from a crashed session (owner pid gone);
+            # a live publisher may have readers attached
+            stale = shared_memory.SharedMemory(name=self.name)
+            magic = bytes(stale.buf[:4])
+            pid = struct.unpack_from("<I", stale.buf, _OWNER_OFF)[0] if stale.size >= _HDR_SIZE else 0
+            stale.close()
+            if magic != MAGIC or _pid_alive(pid):
+                owner = f"pid {pid}" if magic == MAGIC else "another program"
+                print(f"[bus] shared memory '{self.name}' is in use by {owner}; not publishing")
+                return False
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+
+        buf = self._shm.buf
+        self._views = []
+        for i in range(self.slots):
+            off = _HDR_SIZE + i * slot_size
+            _SLOT_HDR.pack_into(buf, off, 0, 0.0, self.height, self.width, self.channels, FORMAT)
+            self._views.append(np.ndarray(
+                (self.height, self.width, self.channels), np.uint8,
+                buffer=buf, offset=off + _HDR_SIZE,
+            ))
+        self._slot_size = slot_size
+        self._seq = 0
+        self._slot = -1
+        _BUS_HDR.pack_into(buf, 0, MAGIC, VERSION, self.slots,
+                           self.width, self.height, self.channels, -1, 0)
+        struct.pack_into("<I", buf, _OWNER_OFF, os.getpid())
+
+        self._enabled = True
+        print(f"[bus] publishing {self.width}x{self.height} on shared memory '{self.name}' ({self.slots} slots)")
+        return True
+
+    def publish(self, frame, ts=None):
+        """Copy a BGR frame into the next slot (resized if its size differs)."""
+        if not self._enabled:
+            return
+        if ts is None:
+            ts = time.perf_counter()
+
+        buf = self._shm.buf
+        slot = (self._slot + 1) % self.slots
+        off = _HDR_SIZE + slot * self._slot_size
+        self._seq += 1
+        seq = self._seq * 2
+
+        struct.pack_into("<Q", buf, off, seq - 1)   # odd = writing
+        view = self._views[slot]
+        if frame.shape == view.shape:
+            np.copyto(view, frame)
+        else:
+            cv2.resize(frame, (self.width, self.height), dst=view)
+        _SLOT_HDR.pack_into(buf, off, seq, ts, self.height, self.width, self.channels, FORMAT)
+
+        self._slot = slot
+        struct.pack_into("<iQ", buf, _BUS_HDR.size - 12, slot, self._seq)
+
+    def stop(self):
+        if self._shm is not None:
+            self._views = []
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        if self._enabled:
+            print(f"[bus] stopped ({self._seq} frames published)")
+        self._enabled = False
+
+
+class FrameBusReader:
+    """Read frames published by FrameBusPublisher from another process.
+
+    read() returns (seq, ts, frame) for the newest frame, or None if there is
+    nothing new. With copy=False `frame` is a view into shared memory (zero
+    copy): use it right away and check is_current() afterwards if a torn
+    frame matters.
+    """
+
+    def __init__(self, name="cameravj"):
+        self.name = name
+        if sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            try:
+                # Readers must not unlink the block when they exit (POSIX resource tracker)
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+            except Exception:
+                pass
+
+        magic, version, slots, w, h, c, _, _ = _BUS_HDR.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._shm.close()
+            raise ValueError(f"'{name}' is not a CameraVJ frame bus (v{VERSION})")
+        self.slots, self.width, self.height, self.channels = slots, w, h, c
+        slot_size = _slot_size(w, h, c)
+        self._offsets = [_HDR_SIZE + i * slot_size for i in range(slots)]
+        self._views = [
+            np.ndarray((h, w, c), np.uint8, buffer=self._shm.buf, offset=off + _HDR_SIZE)
+            for off in self._offsets
+        ]
+        self._last_seq = 0
+        self._read_slot = None
+        self._read_slot_seq = 0
+
+    def read(self, copy=True, retries=3):
+        buf = self._shm.buf
+        for _ in range(retries):
+            slot, seq = struct.unpack_from("<iQ", buf, _BUS_HDR.size - 12)
+            if slot < 0 or seq == self._last_seq:
+                return None
+            off = self._offsets[slot]
+            slot_seq, ts = struct.unpack_from("<Qd", buf, off)
+            if slot_seq != 2 * seq:
+                continue  # being written, or already reused for a newer frame
+            frame = self._views[slot].copy() if copy else self._views[slot]
+            if copy and struct.unpack_from("<Q", buf, off)[0] != slot_seq:
+                continue  # overwritten while copying
+            self._last_seq = seq
+            self._read_slot = slot
+            self._read_slot_seq = slot_seq
+            return seq, ts, frame
+        return None
+
+    def is_current(self):
+        """True if the slot returned by the last read() has not been overwritten since."""
+        if self._read_slot is None:
+            return False
+        off = self._offsets[self._read_slot]
+        return struct.unpack_from("<Q", self._shm.buf, off)[0] == self._read_slot_seq
+
+    def close(self):
+        self._views = []
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
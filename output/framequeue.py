@@ -0,0 +1,109 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+
+POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+class FrameQueue:
+    """Bounded frame queue backed by a pool of reusable buffers.
+
+    The producer (render thread) copies each frame into a pooled buffer;
+    the consumer thread gets (buffer, meta) pairs and must release() the
+    buffer when done. When all buffers are in use the policy decides:
+    - "block":       wait for the consumer to free a buffer (at most
+                     `block_timeout` seconds, then the frame is dropped)
+    - "drop_oldest": discard the oldest pending frame and reuse its buffer
+    - "drop_newest": discard the incoming frame
+    The consumer should close() the queue if it exits early (e.g. on an
+    encoder error) so a blocked producer is released at once.
+    """
+
+    def __init__(self, capacity=8, policy="drop_oldest", block_timeout=1.0):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy!r} (options: {', '.join(POLICIES)})")
+        self.capacity = max(2, int(capacity))
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.accepted = 0
+        self.dropped = 0
+
+        self._free = []
+        self._pending = deque()
+        self._allocated = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def _acquire(self, frame):
+        """Get a buffer for `frame` (lock held). Returns None if the frame is dropped."""
+        while True:
+            while self._free and self._free[-1].shape != frame.shape:
+                self._free.pop()
+                self._allocated -= 1
+            if self._free:
+                return self._free.pop()
+            if self._allocated < self.capacity:
+                self._allocated += 1
+                return np.empty_like(frame)
+
+            if self.policy == "drop_newest":
+                return None
+            if self.policy == "drop_oldest" and self._pending:
+                buf, _ = self._pending.popleft()
+                self.dropped += 1
+                if buf.shape == frame.shape:
+                    return buf
+                self._allocated -= 1
+                continue
+
+            if not self._cond.wait(self.block_timeout) or self._closed:
+                return None     # consumer stalled or gone: drop rather than hang the producer
+
+    def put(self, frame, meta=None):
+        """Copy `frame` into the queue. Returns False if it was dropped."""
+        with self._cond:
+            if self._closed:
+                return False
+            buf = self._acquire(frame)
+            if buf is None:
+                self.dropped += 1
+                return False
+
+        # The buffer is ours until queued: copy without holding the lock
+        np.copyto(buf, frame)
+
+        with self._cond:
+            self._pending.append((buf, meta))
+            self.accepted += 1
+            self._cond.notify_all()
+        return True
+
+    def get(self, timeout=None):
+        """Next (buffer, meta), or None once closed and drained (or on timeout)."""
+        with self._cond:
+            while not self._pending:
+                if self._closed:
+                    return None
+                if not self._cond.wait(timeout) and timeout is not None:
+                    return None
+            item = self._pending.popleft()
+            self._cond.notify_all()
+            return item
+
+    def release(self, buf):
+        """Return a buffer obtained from get() to the pool."""
+        with self._cond:
+            self._free.append(buf)
+            self._cond.notify_all()
+
+    def close(self):
+        """Stop accepting frames; the consumer drains what is pending."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -1,24 +1,76 @@
+import json
 import os
+import threading
 import time
 import cv2
 
+from .framequeue import FrameQueue
+
 
 class VideoRecorder:
-    """Record processed video output to file."""
+    """Record processed video output to file.
+
+    Encoding runs on a writer thread fed by a bounded FrameQueue, so the
+    render thread only pays for one frame copy. `drop_policy` decides what
+    happens when the encoder falls behind (see FrameQueue).
+
+    Frames carry timestamps and the file is constant-rate at `fps`: each
+    frame is written as many times as output slots it covers on the
+    timeline (duplicated when the show runs slower than `fps`, skipped
+    when faster). With `timestamps=True` a CSV sidecar maps every source
+    frame to its output frames for variable-rate reconstruction.
+
+    Long shows can be split into segments every `segment_minutes` and/or
+    `segment_mb` (0 = off): rec-<ts>-000.mp4, rec-<ts>-001.mp4, ... plus a
+    rec-<ts>.json manifest. The next segment's writer is opened ahead of
+    the boundary on the writer thread and the finished one is closed in
+    the background, so no frame is lost at the cut.
+    """
 
-    def __init__(self, output_dir="output", codec="mp4v", fps=30.0):
+    def __init__(self, output_dir="output", codec="mp4v", fps=30.0,
+                 queue_size=8, drop_policy="drop_oldest", timestamps=False,
+                 segment_minutes=0, segment_mb=0):
         self.output_dir = output_dir
         self.codec = codec
         self.fps = fps
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.timestamps = timestamps
+        self.segment_frames = int(segment_minutes * 60 * fps)
+        self.segment_bytes = int(segment_mb * 1024 * 1024)
         self._writer = None
+        self._next_writer = None
+        self._closers = []
+        self._sidecar = None
+        self._queue = None
+        self._thread = None
         self._enabled = False
         self._filepath = None
-        self._frame_count = 0
+        self._reset_timeline()
+
+    def _reset_timeline(self):
+        self._frame_count = 0       # output frames written (writer thread)
+        self._t0 = None             # timestamp of the first frame
+        self._last_ts = None
+        self._last_slot = -1        # last output slot claimed by the render thread
+        self._received = 0          # frames passed to write()
+        self._skipped = 0           # frames merged into an already-filled slot
+        self._duplicated = 0        # extra copies written to fill slow frames
 
     @property
     def enabled(self):
         return self._enabled
 
+    @property
+    def dropped(self):
+        """Frames dropped because the encoder fell behind (current recording)."""
+        return self._queue.dropped if self._queue is not None else 0
+
+    @property
+    def pending(self):
+        """Frames queued but not yet encoded."""
+        return self._queue.pending if self._queue is not None else 0
+
     def toggle(self, frame_size=None):
         """Toggle recording on/off. Pass current frame size when starting."""
         if self._enabled:
@@ -30,17 +82,40 @@ class VideoRecorder:
                 print("[rec] Need frame size to start recording")
         return self._enabled
 
+    @property
+    def segmented(self):
+        return self.segment_frames > 0 or self.segment_bytes > 0
+
+    def _segment_path(self, idx):
+        if not self.segmented:
+            return self._base + ".mp4"
+        return f"{self._base}-{idx:03d}.mp4"
+
+    def _open_writer(self, path):
+        fourcc = cv2.VideoWriter_fourcc(*self.codec)
+        return cv2.VideoWriter(path, fourcc, self.fps, self._size)
+
     def start(self, width, height):
         os.makedirs(self.output_dir, exist_ok=True)
         ts = time.strftime("%Y%m%d-%H%M%S")
-        self._filepath = os.path.join(self.output_dir, f"rec-{ts}.mp4")
+        self._base = os.path.join(self.output_dir, f"rec-{ts}")
+        self._size = (width, height)
+        self._filepath = self._segment_path(0)
 
-        fourcc = cv2.VideoWriter_fourcc(*self.codec)
-        self._writer = cv2.VideoWriter(self._filepath, fourcc, self.fps, (width, height))
+        self._writer = self._open_writer(self._filepath)
 
         if self._writer.isOpened():
             self._enabled = True
-            self._frame_count = 0
+            self._reset_timeline()
+            self._segments = []
+            if self.segmented:
+                self._begin_segment(self._filepath)
+            if self.timestamps:
+                self._sidecar = open(self._base + ".csv", "w")
+                self._sidecar.write("frame,out_frame,repeats,t_ms\n")
+            self._queue = FrameQueue(self.queue_size, self.drop_policy)
+            self._thread = threading.Thread(target=self._write_loop, daemon=True)
+            self._thread.start()
             print(f"[rec] recording to {self._filepath}")
             return True
         else:
@@ -48,20 +123,166 @@ class VideoRecorder:
             self._writer = None
             return False
 
-    def write(self, frame):
-        """Write a frame to the recording."""
-        if not self._enabled or self._writer is None:
+    def write(self, frame, ts=None):
+        """Queue a frame for the writer thread. `ts` defaults to now (perf_counter)."""
+        if not self._enabled or self._queue is None:
+            return
+        if ts is None:
+            ts = time.perf_counter()
+        if self._t0 is None:
+            self._t0 = ts
+        self._last_ts = ts
+        self._received += 1
+
+        # Faster than fps: this slot is already covered, skip the copy
+        slot = int((ts - self._t0) * self.fps + 0.5)
+        if slot <= self._last_slot:
+            self._skipped += 1
             return
-        self._writer.write(frame)
-        self._frame_count += 1
+        self._last_slot = slot
+        self._queue.put(frame, (self._received - 1, ts))
+
+    def _write_loop(self):
+        queue = self._queue
+        try:
+            self._write_frames(queue)
+        except Exception as e:
+            print(f"[rec] writer failed: {e}")
+        finally:
+            queue.close()   # releases a producer blocked on a full queue
+
+    def _write_frames(self, queue):
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            buf, (index, ts) = item
+
+            # Repeat until the output timeline reaches this frame's slot
+            # (also covers the gap left by frames the queue dropped)
+            target = int((ts - self._t0) * self.fps + 0.5) + 1
+            repeats = max(1, target - self._frame_count)
+            if self._sidecar is not None:
+                t_ms = (ts - self._t0) * 1000.0
+                self._sidecar.write(f"{index},{self._frame_count},{repeats},{t_ms:.2f}\n")
+            for _ in range(repeats):
+                if self.segmented:
+                    self._check_segment()
+                self._writer.write(buf)
+                self._frame_count += 1
+            self._duplicated += repeats - 1
+            queue.release(buf)
+
+    # -------- Segments (writer thread) --------
+
+    def _begin_segment(self, path):
+        self._seg_start = self._frame_count
+        self._seg_bytes_due = False
+        self._seg_bytes_near = False
+        self._next_retry = 0        # in-segment frame at which opening the next file may be retried
+        self._segments.append({
+            "file": os.path.basename(path),
+            "start_frame": self._frame_count,
+            "start_s": round(self._frame_count / self.fps, 3),
+            "started": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "frames": 0,
+        })
+        self._write_manifest()
+
+    def _write_manifest(self):
+        if self._segments:
+            self._segments[-1]["frames"] = self._frame_count - self._seg_start
+        manifest = {
+            "fps": self.fps,
+            "size": list(self._size),
+            "segments": self._segments,
+        }
+        tmp = self._base + ".json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, self._base + ".json")
+
+    def _check_segment(self):
+        in_seg = self._frame_count - self._seg_start
+        due = near = False
+
+        if self.segment_frames:
+            due = in_seg >= self.segment_frames
+            near = in_seg >= self.segment_frames - self.fps
+
+        # File size: checked about once per second of output
+        if self.segment_bytes and in_seg and in_seg % max(1, int(self.fps)) == 0:
+            size = os.path.getsize(self._filepath)
+            self._seg_bytes_due = size >= self.segment_bytes
+            self._seg_bytes_near = size >= self.segment_bytes * 0.9
+        due = due or self._seg_bytes_due
+        near = near or self._seg_bytes_near
+
+        if (near or due) and self._next_writer is None and in_seg >= self._next_retry:
+            idx = len(self._segments)
+            self._next_path = self._segment_path(idx)
+            writer = self._open_writer(self._next_path)
+            if writer.isOpened():
+                self._next_writer = writer
+            else:
+                # Disk full, codec gone...: keep writing the current segment, retry in a second
+                writer.release()
+                self._next_retry = in_seg + max(1, int(self.fps))
+                print(f"[rec] could not open {self._next_path}, continuing in {self._filepath}")
+
+        if due and self._next_writer is not None:
+            self._roll_segment()
+
+    def _roll_segment(self):
+        old = self._writer
+        self._writer, self._next_writer = self._next_writer, None
+        self._filepath = self._next_path
+
+        # Finalizing an mp4 can take a while: do it off the writer thread
+        closer = threading.Thread(target=old.release, daemon=True)
+        closer.start()
+        self._closers.append(closer)
+
+        self._write_manifest()
+        self._begin_segment(self._filepath)
 
     def stop(self):
+        dropped = self.dropped
+        if self._queue is not None:
+            # Flush: the writer drains everything still queued before exiting
+            self._queue.close()
+            self._thread.join()
+            self._queue = None
+            self._thread = None
         if self._writer is not None:
             self._writer.release()
             self._writer = None
+        if self._next_writer is not None:
+            # Opened ahead of a boundary that never came: discard it
+            self._next_writer.release()
+            self._next_writer = None
+            if os.path.exists(self._next_path):
+                os.remove(self._next_path)
+        for closer in self._closers:
+            closer.join()
+        self._closers = []
+        if self._enabled and self.segmented:
+            self._write_manifest()
+        if self._sidecar is not None:
+            self._sidecar.close()
+            self._sidecar = None
         if self._enabled:
             duration = self._frame_count / max(1, self.fps)
-            print(f"[rec] saved {self._filepath} ({self._frame_count} frames, {duration:.1f}s)")
+            saved = self._base + (".json" if self.segmented else ".mp4")
+            print(f"[rec] saved {saved} ({self._frame_count} frames, {duration:.1f}s, {dropped} dropped)")
+            if self.segmented:
+                print(f"[rec] {len(self._segments)} segments")
+            if self._received > 1 and self._last_ts > self._t0:
+                achieved = (self._received - 1) / (self._last_ts - self._t0)
+                print(
+                    f"[rec] input {achieved:.1f} fps vs target {self.fps:.1f} fps "
+                    f"({self._duplicated} duplicated, {self._skipped} skipped)"
+                )
         self._enabled = False
         self._filepath = None
-        self._frame_count = 0
+        self._reset_timeline()
@@ -0,0 +1,168 @@
+import os
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from .framequeue import FrameQueue
+
+
+class ReplayBuffer:
+    """Instant replay: keep the last `seconds` of output as JPEG bytes.
+
+    feed() only copies the frame into a small FrameQueue; an encoder thread
+    compresses it (optionally downscaled by `scale`) and appends it to a ring
+    bounded both by time and by `max_mb`. dump() writes the current ring to
+    replay-<ts>.mp4 at a constant `fps` on a background thread, so a great
+    moment can be saved after it happened without recording beforehand.
+    """
+
+    def __init__(self, output_dir="output", seconds=15.0, fps=30.0, quality=80,
+                 max_mb=256, scale=1.0, codec="mp4v"):
+        self.output_dir = output_dir
+        self.seconds = float(seconds)
+        self.fps = float(fps)
+        self.quality = int(quality)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.scale = float(scale)
+        self.codec = codec
+
+        self._ring = deque()            # (ts, jpeg ndarray)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._dumps = []
+        self._small = None
+        self._enabled = False
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @property
+    def buffered_seconds(self):
+        with self._lock:
+            if len(self._ring) < 2:
+                return 0.0
+            return self._ring[-1][0] - self._ring[0][0]
+
+    def toggle(self):
+        if self._enabled:
+            self.stop()
+        else:
+            self.start()
+        return self._enabled
+
+    def start(self):
+        if self._enabled:
+            return True
+        # Encoding is slower than copying: keep only the newest frames if it lags
+        self._queue = FrameQueue(capacity=4, policy="drop_oldest")
+        self._thread = threading.Thread(target=self._encode_loop, daemon=True)
+        self._thread.start()
+        self._enabled = True
+        print(f"[replay] buffering last {self.seconds:.0f}s (max {self.max_bytes // (1024 * 1024)} MB)")
+        return True
+
+    def feed(self, frame, ts=None):
+        """Call once per output frame."""
+        if not self._enabled:
+            return
+        if ts is None:
+            ts = time.perf_counter()
+        self._queue.put(frame, ts)
+
+    def _encode_loop(self):
+        queue = self._queue
+        try:
+            self._encode_frames(queue)
+        except Exception as e:
+            print(f"[replay] encoder failed: {e}")
+        finally:
+            queue.close()
+
+    def _encode_frames(self, queue):
+        params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            buf, ts = item
+            src = buf
+            if self.scale != 1.0:
+                h, w = buf.shape[:2]
+                size = (int(w * self.scale), int(h * self.scale))
+                if self._small is None or self._small.shape[:2] != (size[1], size[0]):
+                    self._small = np.empty((size[1], size[0], 3), np.uint8)
+                src = cv2.resize(buf, size, dst=self._small, interpolation=cv2.INTER_AREA)
+            ok, jpg = cv2.imencode(".jpg", src, params)
+            queue.release(buf)
+            if not ok:
+                continue
+
+            with self._lock:
+                self._ring.append((ts, jpg))
+                self._bytes += jpg.nbytes
+                while self._ring and (
+                    ts - self._ring[0][0] > self.seconds or self._bytes > self.max_bytes
+                ):
+                    _, old = self._ring.popleft()
+                    self._bytes -= old.nbytes
+
+    def dump(self):
+        """Write the buffered frames to a video file in the background. Returns its path."""
+        with self._lock:
+            frames = list(self._ring)
+        if len(frames) < 2:
+            print("[replay] buffer is empty")
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        ts = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"replay-{ts}.mp4")
+        t = threading.Thread(target=self._write_clip, args=(frames, path), daemon=True)
+        t.start()
+        self._dumps = [d for d in self._dumps if d.is_alive()] + [t]
+        print(f"[replay] saving {frames[-1][0] - frames[0][0]:.1f}s to {path}")
+        return path
+
+    def _write_clip(self, frames, path):
+        first = cv2.imdecode(frames[0][1], cv2.IMREAD_COLOR)
+        h, w = first.shape[:2]
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*self.codec), self.fps, (w, h))
+        if not writer.isOpened():
+            print(f"[replay] Failed to open video writer for {path}")
+            return
+
+        # Constant rate from the frame timestamps (same timeline rule as VideoRecorder)
+        t0 = frames[0][0]
+        written = 0
+        for ts, jpg in frames:
+            target = int((ts - t0) * self.fps + 0.5) + 1
+            if target <= written:
+                continue
+            frame = first if written == 0 else cv2.imdecode(jpg, cv2.IMREAD_COLOR)
+            for _ in range(target - written):
+                writer.write(frame)
+            written = target
+        writer.release()
+        print(f"[replay] saved {path} ({written} frames)")
+
+    def stop(self):
+        if self._queue is not None:
+            self._queue.close()
+            self._thread.join()
+            self._queue = None
+            self._thread = None
+        for t in self._dumps:
+            t.join()
+        self._dumps = []
+        with self._lock:
+            self._ring.clear()
+            self._bytes = 0
+        if self._enabled:
+            print("[replay] disabled")
+        self._enabled = False
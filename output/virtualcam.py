@@ -1,22 +1,89 @@
+import importlib
+import importlib.util
+import threading
+import time
 import cv2
+import numpy as np
 
-try:
-    import pyvirtualcam
-    HAS_VCAM = True
-except ImportError:
-    HAS_VCAM = False
+# pyvirtualcam is imported on first start() (or a background preload), not at startup
+HAS_VCAM = importlib.util.find_spec("pyvirtualcam") is not None
+pyvirtualcam = None
+
+
+def load_pyvirtualcam():
+    """Import pyvirtualcam once. Returns the module, or None if it cannot be loaded."""
+    global pyvirtualcam
+    if pyvirtualcam is None and HAS_VCAM:
+        try:
+            pyvirtualcam = importlib.import_module("pyvirtualcam")
+        except Exception as e:
+            print(f"[vcam] failed to load pyvirtualcam: {e}")
+    return pyvirtualcam
+
+
+class NullCamera:
+    """Stand-in for pyvirtualcam.Camera: accepts and counts frames, paces like the real one.
+
+    Lets the output path run (and be timed) on machines without a virtual cam driver.
+    """
+
+    def __init__(self, width, height, fps):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.device = "null"
+        self.frames_sent = 0
+        self._next = None
+
+    def send(self, frame):
+        if frame.shape != (self.height, self.width, 3):
+            raise ValueError(f"frame shape {frame.shape} != {(self.height, self.width, 3)}")
+        self.frames_sent += 1
+
+    def sleep_until_next_frame(self):
+        now = time.perf_counter()
+        if self._next is None or now - self._next > 1.0:
+            self._next = now
+        self._next += 1.0 / self.fps
+        delay = self._next - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        pass
 
 
 class VirtualCamOutput:
-    """Send processed frames to a virtual camera for OBS/projector."""
+    """Send processed frames to a virtual camera for OBS/projector.
+
+    send() only copies the frame into a triple buffer; a sender thread takes
+    the latest frame, resizes and converts it to RGB into preallocated
+    buffers and paces itself to the camera fps. A slow consumer never
+    stalls rendering: frames it cannot take are simply replaced.
+    backend="null" uses NullCamera (no driver needed).
+    """
 
-    def __init__(self, width=1280, height=720, fps=30):
+    def __init__(self, width=1280, height=720, fps=30, backend="pyvirtualcam"):
         self.width = width
         self.height = height
         self.fps = fps
+        self.backend = backend
         self._cam = None
         self._enabled = False
-        self._available = HAS_VCAM
+        self._available = HAS_VCAM or backend == "null"
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._back = None       # written by the render thread
+        self._ready = None      # latest complete frame
+        self._front = None      # being converted/sent by the sender thread
+        self._fresh = False
+        self._resized = np.empty((height, width, 3), np.uint8)
+        self._rgb = np.empty((height, width, 3), np.uint8)
+
+        self.sent = 0
+        self.skipped = 0        # frames replaced before the sender took them
 
     @property
     def available(self):
@@ -33,6 +100,13 @@ class VirtualCamOutput:
             self.start()
         return self._enabled
 
+    def _open_camera(self):
+        if self.backend == "null":
+            return NullCamera(self.width, self.height, self.fps)
+        if load_pyvirtualcam() is None:
+            raise RuntimeError("pyvirtualcam could not be loaded")
+        return pyvirtualcam.Camera(width=self.width, height=self.height, fps=self.fps)
+
     def start(self):
         if not self._available:
             print("[vcam] pyvirtualcam not installed. Install with: pip install pyvirtualcam")
@@ -42,12 +116,13 @@ class VirtualCamOutput:
             return True
 
         try:
-            self._cam = pyvirtualcam.Camera(
-                width=self.width,
-                height=self.height,
-                fps=self.fps,
-            )
+            self._cam = self._open_camera()
             self._enabled = True
+            self._fresh = False
+            self.sent = 0
+            self.skipped = 0
+            self._thread = threading.Thread(target=self._send_loop, daemon=True)
+            self._thread.start()
             print(f"[vcam] enabled ({self.width}x{self.height}@{self.fps} via {self._cam.device})")
             return True
         except Exception as e:
@@ -56,22 +131,68 @@ class VirtualCamOutput:
             return False
 
     def send(self, frame):
-        """Send a BGR frame to the virtual camera."""
+        """Hand a BGR frame to the sender thread (copy only, never blocks on the camera)."""
         if not self._enabled or self._cam is None:
             return
 
-        # Resize if needed
-        h, w = frame.shape[:2]
-        if w != self.width or h != self.height:
-            frame = cv2.resize(frame, (self.width, self.height))
+        if self._back is None or self._back.shape != frame.shape:
+            self._back = np.empty_like(frame)
+        np.copyto(self._back, frame)
+
+        with self._lock:
+            self._back, self._ready = self._ready, self._back
+            if self._fresh:
+                self.skipped += 1
+            self._fresh = True
+        self._wake.set()
+
+    def _send_loop(self):
+        cam = self._cam
+        try:
+            self._send_frames(cam)
+        finally:
+            # The thread owns the device: release it however the loop ends
+            self._cam = None
+            try:
+                cam.close()
+            except Exception as e:
+                print(f"[vcam] close failed: {e}")
+
+    def _send_frames(self, cam):
+        while self._enabled:
+            if not self._wake.wait(0.1):
+                continue
+            self._wake.clear()
+
+            with self._lock:
+                if not self._fresh:
+                    continue
+                self._front, self._ready = self._ready, self._front
+                self._fresh = False
 
-        # Convert BGR to RGB (pyvirtualcam expects RGB)
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        self._cam.send(rgb)
+            frame = self._front
+            h, w = frame.shape[:2]
+            if w != self.width or h != self.height:
+                frame = cv2.resize(frame, (self.width, self.height), dst=self._resized)
+
+            # Convert BGR to RGB (pyvirtualcam expects RGB)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            try:
+                cam.send(self._rgb)
+            except Exception as e:
+                print(f"[vcam] send failed: {e}")
+                self._enabled = False
+                break
+            self.sent += 1
+            cam.sleep_until_next_frame()
 
     def stop(self):
+        self._enabled = False
+        if self._thread is not None:
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
         if self._cam is not None:
             self._cam.close()
             self._cam = None
-        self._enabled = False
         print("[vcam] disabled")
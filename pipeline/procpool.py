@@ -0,0 +1,297 @@
+"""
+Process-pool rendering for GIL-bound effects (hot loops still in Python).
+
+Each attached effect gets one shared memory block holding an input and an
+output frame. Per frame the render thread copies its frame into the input
+view and sends a small message per worker (the effect's get_params() plus
+its `proc_sync` attributes); workers render straight into the output view
+and answer with their compute time. Frames are never pickled.
+
+The effect instance is pickled once, at attach time, and then lives in the
+worker: its temporal state (previous frames, counters) stays there. The
+render-thread instance remains the source of truth for parameters (knobs,
+presets, morphs and set_controls() all keep working on it). Effects that
+are also tile_safe are split into bands, one per worker, each worker
+holding its own copy; the rest run whole in a single worker.
+
+ipc_ms is the measured per-frame overhead: the round trip (copies, pipe
+messages, wake-ups) minus the time workers spent inside the effect.
+"""
+import itertools
+import multiprocessing
+import pickle
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def _worker_main(conn):
+    """Worker process loop: resident effects keyed by handle."""
+    slots = {}      # handle -> (effect, shm, inp, out)
+    conn.send(("ready", None))
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            break
+        op = msg[0]
+        if op == "apply":
+            _, handle, params, extra, band = msg
+            try:
+                effect, _, inp, out = slots[handle]
+                effect.set_params(params)
+                for attr, value in extra.items():
+                    setattr(effect, attr, value)
+                t0 = time.perf_counter()
+                if band is None:
+                    res = effect.apply(inp)
+                    if res is not out:
+                        np.copyto(out, res)
+                else:
+                    y0, y1, halo = band
+                    effect.begin_frame(inp)
+                    a = max(0, y0 - halo)
+                    b = min(inp.shape[0], y1 + halo)
+                    res = effect.apply_tile(inp[a:b], a)
+                    out[y0:y1] = res[y0 - a:y1 - a]
+                conn.send(("done", (time.perf_counter() - t0) * 1000.0))
+            except Exception as e:
+                conn.send(("error", f"{type(e).__name__}: {e}"))
+        elif op == "attach":
+            _, handle, shm_name, shape, blob = msg
+            shm = shared_memory.SharedMemory(name=shm_name)
+            n = int(np.prod(shape))
+            inp = np.ndarray(shape, np.uint8, buffer=shm.buf)
+            out = np.ndarray(shape, np.uint8, buffer=shm.buf, offset=n)
+            slots[handle] = (pickle.loads(blob), shm, inp, out)
+        elif op == "reset":
+            slot = slots.get(msg[1])
+            if slot is not None:
+                slot[0].reset()
+        elif op == "detach":
+            slot = slots.pop(msg[1], None)
+            if slot is not None:
+                shm = slot[1]
+                del slot    # drop the views before closing the mapping
+                try:
+                    shm.close()
+                except BufferError:
+                    pass    # the effect still holds a view; freed with the process
+        elif op == "stop":
+            break
+    slots.clear()
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+        self.load = 0           # attached slots
+
+
+class _Slot:
+    def __init__(self, effect, handle, shape, workers, banded):
+        self.effect = effect    # keeps id(effect) from being reused while attached
+        self.handle = handle
+        self.shape = shape
+        self.workers = workers
+        self.banded = banded
+        n = int(np.prod(shape))
+        self.shm = shared_memory.SharedMemory(create=True, size=2 * n)
+        self.inp = np.ndarray(shape, np.uint8, buffer=self.shm.buf)
+        self.out = np.ndarray(shape, np.uint8, buffer=self.shm.buf, offset=n)
+
+    def close(self):
+        self.inp = self.out = None
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ProcessPool:
+    """Render effects flagged gil_bound in worker processes (see module docstring).
+
+    start() spawns the workers (the runner does it in the background after
+    the first frame); until they are up, and whenever a worker fails,
+    apply() falls back to effect.apply() on the calling thread.
+    """
+
+    def __init__(self, workers=2, min_rows=64, timeout=1.0, start_timeout=30.0):
+        self.n_workers = max(0, int(workers))
+        self.min_rows = max(1, int(min_rows))
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self._workers = []
+        self._slots = {}            # id(effect) -> _Slot
+        self._handles = itertools.count(1)
+        self._ready = False
+
+        self.frames = 0
+        self.ipc_ms = 0.0           # EMA of per-frame IPC overhead
+        self.work_ms = 0.0          # EMA of per-frame worker compute (slowest band)
+        self._alpha = 0.05
+
+    @property
+    def ready(self):
+        return self._ready
+
+    def start(self):
+        """Spawn the workers and wait until they are up (blocking: call it off
+        the render thread). Returns self, or None if disabled or failed."""
+        if self.n_workers == 0:
+            return None
+        if self._workers:
+            return self
+        ctx = multiprocessing.get_context("spawn")
+        try:
+            self._workers = [_Worker(ctx) for _ in range(self.n_workers)]
+            for w in self._workers:
+                if not w.conn.poll(self.start_timeout):
+                    raise TimeoutError(f"worker {w.proc.pid} did not start")
+                w.conn.recv()
+        except Exception as e:
+            self.stop()
+            print(f"[procpool] failed to start workers: {e}")
+            self._workers = []
+            return None
+        self._ready = True
+        return self
+
+    # -------- Slots --------
+
+    def _banded(self, effect, shape):
+        return effect.tile_safe and len(self._workers) > 1 and shape[0] // self.min_rows >= 2
+
+    def _attach(self, effect, shape, banded):
+        if banded:
+            workers = list(self._workers)
+        else:
+            workers = [min(self._workers, key=lambda w: w.load)]
+        slot = _Slot(effect, next(self._handles), shape, workers, banded)
+        try:
+            blob = pickle.dumps(effect)
+            for w in workers:
+                w.conn.send(("attach", slot.handle, slot.shm.name, shape, blob))
+        except Exception:
+            slot.close()
+            raise
+        for w in workers:
+            w.load += 1
+        self._slots[id(effect)] = slot
+        return slot
+
+    def _detach(self, slot):
+        for w in slot.workers:
+            w.load -= 1
+            try:
+                w.conn.send(("detach", slot.handle))
+            except (OSError, BrokenPipeError):
+                pass
+        slot.close()
+
+    def retain(self, effects):
+        """Detach every attached effect not in `effects` (frees its worker state)."""
+        if not self._slots:
+            return
+        keep = {id(e) for e in effects}
+        for key in [k for k in self._slots if k not in keep]:
+            self._detach(self._slots.pop(key))
+
+    def reset(self, effect):
+        slot = self._slots.get(id(effect))
+        if slot is not None:
+            try:
+                for w in slot.workers:
+                    w.conn.send(("reset", slot.handle))
+            except OSError as e:
+                print(f"[procpool] reset of {effect.name} failed, running in-process: {e}")
+                self._fail()
+
+    # -------- Rendering --------
+
+    def apply(self, effect, frame):
+        """Equivalent of effect.apply(frame), rendered in the worker(s)."""
+        if not self._ready or frame.dtype != np.uint8:
+            return effect.apply(frame)
+
+        t0 = time.perf_counter()
+        try:
+            banded = self._banded(effect, frame.shape)
+            slot = self._slots.get(id(effect))
+            if slot is not None and (slot.effect is not effect or slot.shape != frame.shape
+                                     or slot.banded != banded):
+                self._detach(self._slots.pop(id(effect)))
+                slot = None
+            attached = slot is None
+            if attached:
+                slot = self._attach(effect, frame.shape, banded)
+
+            np.copyto(slot.inp, frame)
+            params = effect.get_params()
+            extra = {attr: getattr(effect, attr) for attr in effect.proc_sync}
+            if slot.banded:
+                h = frame.shape[0]
+                n = len(slot.workers)
+                halo = max(0, int(effect.tile_halo))
+                bands = [(i * h // n, (i + 1) * h // n, halo) for i in range(n)]
+            else:
+                bands = [None]
+            for w, band in zip(slot.workers, bands):
+                w.conn.send(("apply", slot.handle, params, extra, band))
+            work = 0.0
+            for w in slot.workers:
+                if not w.conn.poll(self.timeout):
+                    raise TimeoutError(f"worker {w.proc.pid} did not answer in {self.timeout:.1f}s")
+                status, value = w.conn.recv()
+                if status != "done":
+                    raise RuntimeError(value)
+                work = max(work, value)
+        except Exception as e:
+            print(f"[procpool] {effect.name} failed in worker, running in-process: {e}")
+            self._fail()
+            return effect.apply(frame)
+
+        res = slot.out.copy()
+        if attached:
+            return res  # one-off unpickling cost: kept out of the IPC numbers
+        total = (time.perf_counter() - t0) * 1000.0
+        self.frames += 1
+        a = 1.0 if self.frames == 1 else self._alpha
+        self.ipc_ms += (max(0.0, total - work) - self.ipc_ms) * a
+        self.work_ms += (work - self.work_ms) * a
+        return res
+
+    def mode(self, effect):
+        """How `effect` is rendered: "bands", "whole", or None if not attached."""
+        slot = self._slots.get(id(effect))
+        if slot is None or slot.effect is not effect:
+            return None
+        return "bands" if slot.banded else "whole"
+
+    def _fail(self):
+        """A worker broke (crash, timeout, exception): stop the pool, keep rendering in-process."""
+        self.stop()
+
+    def stop(self):
+        self._ready = False
+        for slot in self._slots.values():
+            slot.close()
+        self._slots = {}
+        for w in self._workers:
+            try:
+                w.conn.send(("stop",))
+            except (OSError, BrokenPipeError):
+                pass
+        for w in self._workers:
+            w.proc.join(timeout=1.0)
+            if w.proc.is_alive():
+                w.proc.terminate()
+            w.conn.close()
+        if self._workers and self.frames:
+            print(f"[procpool] {self.frames} frames, IPC {self.ipc_ms:.2f} ms/frame, work {self.work_ms:.2f} ms/frame")
+        self._workers = []
@@ -1,17 +1,28 @@
+import math
 import os
+import threading
 import time
 import cv2
 import config
 
 from vision.motion import MotionEstimator
 from vision.zones import ZoneMapper
-from vision.pose import PoseEstimator, NeonSkeletonRenderer, detect_gestures
-from effects import EFFECTS_FACTORY
+from vision.flow import FlowEstimator
+from vision.pose import PoseEstimator, NeonSkeletonRenderer, detect_gestures, HAS_MEDIAPIPE
+from effects import EFFECTS_FACTORY, PAGE_SIZE
+from effects.params import ParamSmoother
 from audio import AudioManager
 from midi import MidiController
+from osc import OscController
 from autovj import AutoVJManager
-from output import VirtualCamOutput, VideoRecorder
+from output import VirtualCamOutput, VideoRecorder, FrameBusPublisher, ImageExporter, ReplayBuffer
 from scenes import SceneManager
+from audio.capture import load_sounddevice
+from midi.input import load_mido
+from output.virtualcam import load_pyvirtualcam
+from .startup import Preloader
+from .tiles import TileExecutor
+from .procpool import ProcessPool
 
 
 def _apply_hud(frame, lines):
@@ -32,8 +43,10 @@ def _apply_hud(frame, lines):
 
 
 class PipelineRunner:
-    def __init__(self, capture):
+    def __init__(self, capture, startup=None):
         self.capture = capture
+        self.startup = startup       # StartupTimer, reported after the first frame
+        self.preloader = None
 
         self.show_hud = config.SHOW_HUD_DEFAULT
         self.perf_mode = config.PERF_MODE_DEFAULT
@@ -43,22 +56,41 @@ class PipelineRunner:
         self.effect_stack = []       # list of (effect_id, Effect instance)
         self.active_idx = 0          # index into effect_stack for preset control
         self.preset_idx = 0
-        self.fx_page = 0             # 0=effects 1-12, 1=effects 13-20
+        self.fx_page = 0             # page p = effects p*12+1 .. p*12+12 (see _next_page)
 
         # --- Effect instance cache (avoid recreating on toggle) ---
         self._effect_cache = {}
+        self._warm_queue = []        # effect IDs to preinstantiate in the background (see _warm_effects)
+        self._warmed = {}            # effect ID -> (warmed instance, ms), filled by the warm thread
+        self._warm_thread = None
+        self.param_smoother = ParamSmoother(tau=config.PARAM_SMOOTH_TAU)
+        self.tiles = TileExecutor(threads=config.TILE_THREADS, min_rows=config.TILE_MIN_ROWS)
+        self.procpool = ProcessPool(workers=config.PROC_WORKERS, min_rows=config.TILE_MIN_ROWS)
+        self._last_frame_ts = None
 
         # --- Movimiento + Zonas ---
         self.motion = MotionEstimator(
             scale=config.MOTION_SCALE,
-            smooth=config.MOTION_SMOOTH
+            smooth=config.MOTION_SMOOTH,
+            backend=config.MOTION_BACKEND,
+            stride=config.MOTION_STRIDE,
+            rate_hz=config.MOTION_RATE_HZ,
         )
-        self.zones = ZoneMapper()
+        self.zones = ZoneMapper(*config.ZONE_GRID)
         self.show_vision_debug = False
 
+        # --- Optical flow ---
+        self.flow_enabled = config.FLOW_ENABLED
+        self.flow = FlowEstimator(
+            width=config.FLOW_WIDTH,
+            grid=config.FLOW_GRID,
+            gain=config.FLOW_GAIN,
+        )
+
         # --- Pose ---
         self.pose_enabled = False
-        self.pose = PoseEstimator(model_complexity=1)
+        self.pose = None             # built on first enable (or by the preloader)
+        self._pose_lock = threading.Lock()
         self.neon = NeonSkeletonRenderer(trail_len=14, glow=2)
         self._gesture_cooldown = 0
 
@@ -66,18 +98,60 @@ class PipelineRunner:
         self.audio = AudioManager()
 
         # --- MIDI ---
-        self.midi = MidiController()
+        self.midi = MidiController(clock_port=config.MIDI_CLOCK_PORT or None)
         self._midi_fader = 1.0  # global mix (1.0 = full effect)
 
+        # --- OSC ---
+        self.osc = OscController(host=config.OSC_HOST, port=config.OSC_PORT)
+        if config.OSC_ENABLED:
+            self.osc.start()
+
         # --- Auto-VJ ---
-        self.autovj = AutoVJManager()
+        self.autovj = AutoVJManager(
+            crossfade_frames=config.AUTOVJ_TRANSITION_FRAMES,
+            transition_mode=config.AUTOVJ_TRANSITION_MODE,
+            transition=config.AUTOVJ_TRANSITION,
+            outgoing_scale=config.AUTOVJ_OUTGOING_SCALE,
+            outgoing_budget_ms=config.AUTOVJ_OUTGOING_BUDGET_MS,
+            prewarm=config.AUTOVJ_PREWARM_SECONDS,
+            budget_ms=config.AUTOVJ_EFFECT_BUDGET_MS,
+        )
+        self.effect_costs = self.autovj.costs
+        if config.EFFECT_WARMUP == "all":
+            self._warm_queue = sorted(EFFECTS_FACTORY)
+        elif config.EFFECT_WARMUP == "autovj":
+            self._warm_queue = self.autovj.sequencer.pool_ids()
 
         # --- Output ---
-        self.vcam = VirtualCamOutput()
-        self.recorder = VideoRecorder()
+        self.vcam = VirtualCamOutput(backend=config.VCAM_BACKEND)
+        self.bus = FrameBusPublisher(name=config.FRAMEBUS_NAME, slots=config.FRAMEBUS_SLOTS)
+        self.exporter = ImageExporter(
+            workers=config.EXPORT_WORKERS,
+            max_pending=config.EXPORT_MAX_PENDING,
+        )
+        self.replay = ReplayBuffer(
+            seconds=config.REPLAY_SECONDS,
+            fps=config.REC_FPS,
+            quality=config.REPLAY_QUALITY,
+            max_mb=config.REPLAY_MAX_MB,
+            scale=config.REPLAY_SCALE,
+        )
+        if config.REPLAY_ENABLED:
+            self.replay.start()
+        self.recorder = VideoRecorder(
+            fps=config.REC_FPS,
+            timestamps=config.REC_TIMESTAMPS,
+            segment_minutes=config.REC_SEGMENT_MINUTES,
+            segment_mb=config.REC_SEGMENT_MB,
+            queue_size=config.REC_QUEUE_SIZE,
+            drop_policy=config.REC_DROP_POLICY,
+        )
 
         # --- Scenes ---
-        self.scene_mgr = SceneManager()
+        self.scene_mgr = SceneManager(snapshot_state=config.SCENE_SNAPSHOT_STATE)
+        self._scenes_prepared = False
+        self.morph_mode = False      # F-key loads morph instead of cutting
+        self.morph = None            # active SceneMorph
 
         # --- FPS counter ---
         self._fps_time = time.time()
@@ -85,10 +159,43 @@ class PipelineRunner:
         self._fps = 0.0
 
         self._ensure_output_dir()
+        if self.startup is not None:
+            self.startup.mark("runner")
 
     def _ensure_output_dir(self):
         os.makedirs("output", exist_ok=True)
 
+    # -------- Optional subsystems (loaded on first use) --------
+
+    def _ensure_pose(self):
+        """Build the PoseEstimator (imports mediapipe) if needed. Returns it, or None."""
+        with self._pose_lock:
+            if self.pose is None and HAS_MEDIAPIPE:
+                try:
+                    self.pose = PoseEstimator(
+                        model_complexity=1,
+                        rate_hz=config.POSE_INFERENCE_HZ,
+                        predict=config.POSE_PREDICT,
+                    )
+                except Exception as e:
+                    print(f"[pose] failed to start: {e}")
+            return self.pose
+
+    def _start_preload(self):
+        """Load the optional subsystems listed in PRELOAD_OPTIONAL on a background thread."""
+        loaders = {
+            "pose": self._ensure_pose,
+            "audio": load_sounddevice,
+            "midi": load_mido,
+            "vcam": load_pyvirtualcam,
+        }
+        tasks = [(name, loaders[name]) for name in config.PRELOAD_OPTIONAL if name in loaders]
+        if self.procpool.n_workers:
+            tasks.insert(0, ("procpool", self.procpool.start))
+        if tasks:
+            self.preloader = Preloader(tasks, verbose=not self.perf_mode)
+            self.preloader.start()
+
     # -------- Effect Stack Management --------
 
     def _get_effect(self, effect_id):
@@ -100,6 +207,47 @@ class PipelineRunner:
             self._effect_cache[effect_id] = EffectCls()
         return self._effect_cache[effect_id]
 
+    def _warm_effects(self, frame):
+        """Warm the queued effects on a background thread; adopt the finished ones."""
+        if self._warm_queue and self._warm_thread is None:
+            ids, self._warm_queue = self._warm_queue, []
+            self._warm_thread = threading.Thread(
+                target=self._warm, args=(ids, frame.copy()), daemon=True, name="fx-warm"
+            )
+            self._warm_thread.start()
+        while self._warmed:
+            eid, (effect, ms) = self._warmed.popitem()
+            # Keep an instance the user created (and maybe tweaked) meanwhile
+            self._effect_cache.setdefault(eid, effect)
+            # Seed the cost table with a first guess (two applies per warm-up)
+            if self.effect_costs.get(effect.name) is None:
+                self.effect_costs.record(effect.name, ms * 0.5)
+
+    def _warm(self, ids, frame):
+        for eid in ids:
+            if eid in self._effect_cache:
+                continue
+            EffectCls = EFFECTS_FACTORY.get(eid)
+            if EffectCls is None:
+                continue
+            effect = EffectCls()
+            t0 = time.perf_counter()
+            effect.warmup(frame)
+            self._warmed[eid] = (effect, (time.perf_counter() - t0) * 1000.0)
+
+    def _next_page(self):
+        """Cycle effect pages (as many as the registry needs, plugins included)."""
+        self.fx_page = (self.fx_page + 1) % EFFECTS_FACTORY.pages()
+        first = self.fx_page * PAGE_SIZE + 1
+        if not self.perf_mode:
+            print(f"[fx_page] {self.fx_page} (effects {first}-{first + PAGE_SIZE - 1})")
+
+    def _toggle_page_effect(self, slot):
+        """Toggle the effect in `slot` (1-12) of the current page, if there is one."""
+        effect_id = slot + self.fx_page * PAGE_SIZE
+        if effect_id in EFFECTS_FACTORY:
+            self._toggle_effect(effect_id)
+
     def _toggle_effect(self, effect_id):
         """Add effect to stack if not present, remove if present."""
         # Check if already in stack
@@ -141,7 +289,9 @@ class PipelineRunner:
     def _reset_active_effect(self):
         """Reset the currently active effect."""
         if self.effect_stack and self.active_idx < len(self.effect_stack):
-            self.effect_stack[self.active_idx][1].reset()
+            effect = self.effect_stack[self.active_idx][1]
+            effect.reset()
+            self.procpool.reset(effect)
 
     def _active_effect(self):
         """Get the active effect (for preset changes)."""
@@ -166,12 +316,28 @@ class PipelineRunner:
         return " | ".join(parts)
 
     def _screenshot(self, frame):
-        ts = time.strftime("%Y%m%d-%H%M%S")
-        path = os.path.join("output", f"snap-{ts}.png")
-        cv2.imwrite(path, frame)
-        if not self.perf_mode:
+        path = self.exporter.snapshot(frame)
+        if path is None:
+            print("[screenshot] dropped (exporter busy)")
+        elif not self.perf_mode:
             print(f"[screenshot] {path}")
 
+    def _dump_replay(self):
+        """Save the instant replay buffer (keyboard 'i' / MIDI replay button)."""
+        if not self.replay.enabled:
+            print("[replay] buffer off (REPLAY_ENABLED = False): nothing to save")
+            return
+        self.replay.dump()
+
+    def _morph_seconds(self, controls):
+        """Morph duration for the next scene load (0 = hard cut)."""
+        if not self.morph_mode:
+            return 0.0
+        if config.SCENE_MORPH_BEATS > 0:
+            bpm = controls.get("bpm") or config.SCENE_MORPH_DEFAULT_BPM
+            return config.SCENE_MORPH_BEATS * 60.0 / bpm
+        return config.SCENE_MORPH_SECONDS
+
     def _current_scale(self):
         return config.PREVIEW_SCALE_PERF if self.perf_mode else config.PREVIEW_SCALE_DEBUG
 
@@ -181,130 +347,7 @@ class PipelineRunner:
         effect, eid = self._active_effect()
         if effect is None:
             return
-
-        name = getattr(effect, "name", "")
-
-        if name == "color_posterize":
-            if self.preset_idx == 0:
-                effect.levels, effect.speed = 6, 0.03
-            elif self.preset_idx == 1:
-                effect.levels, effect.speed = 4, 0.06
-            else:
-                effect.levels, effect.speed = 10, 0.02
-
-        elif name == "contours_glow":
-            if self.preset_idx == 0:
-                effect.t1, effect.t2, effect.blur_ksize = 50, 150, 9
-            elif self.preset_idx == 1:
-                effect.t1, effect.t2, effect.blur_ksize = 30, 100, 13
-            else:
-                effect.t1, effect.t2, effect.blur_ksize = 80, 200, 7
-
-        elif name == "feedback_glitch":
-            if self.preset_idx == 0:
-                effect.feedback, effect.warp, effect.noise = 0.90, 4, 4
-            elif self.preset_idx == 1:
-                effect.feedback, effect.warp, effect.noise = 0.94, 7, 8
-            else:
-                effect.feedback, effect.warp, effect.noise = 0.88, 10, 12
-
-        elif name == "mirror_kaleido":
-            effect.mode = self.preset_idx
-
-        elif name == "scanlines_rgbshift":
-            if self.preset_idx == 0:
-                effect.scan_strength, effect.shift, effect.speed = 0.20, 3, 1
-            elif self.preset_idx == 1:
-                effect.scan_strength, effect.shift, effect.speed = 0.35, 6, 2
-            else:
-                effect.scan_strength, effect.shift, effect.speed = 0.15, 10, 3
-
-        elif name == "chromatic_aberration":
-            if self.preset_idx == 0:
-                effect.strength, effect.radial = 8, True
-            elif self.preset_idx == 1:
-                effect.strength, effect.radial = 16, True
-            else:
-                effect.strength, effect.radial = 12, False
-
-        elif name == "pixel_sort":
-            if self.preset_idx == 0:
-                effect.threshold, effect.intensity, effect._step = 80, 0.5, 4
-            elif self.preset_idx == 1:
-                effect.threshold, effect.intensity, effect._step = 40, 0.8, 2
-            else:
-                effect.threshold, effect.intensity, effect._step = 120, 0.4, 6
-
-        elif name == "thermal_vision":
-            effect._map_idx = self.preset_idx % 3
-            effect.colormap = effect._colormaps[effect._map_idx]
-
-        elif name == "strobe_flash":
-            if self.preset_idx == 0:
-                effect.rate, effect.intensity, effect.color_mode = 6, 0.8, 0
-            elif self.preset_idx == 1:
-                effect.rate, effect.intensity, effect.color_mode = 3, 1.0, 0
-            else:
-                effect.rate, effect.intensity, effect.color_mode = 4, 0.9, 1
-
-        elif name == "edge_neon":
-            if self.preset_idx == 0:
-                effect.t1, effect.t2, effect.hue_speed, effect.glow_size = 40, 120, 2.0, 5
-            elif self.preset_idx == 1:
-                effect.t1, effect.t2, effect.hue_speed, effect.glow_size = 20, 80, 4.0, 8
-            else:
-                effect.t1, effect.t2, effect.hue_speed, effect.glow_size = 60, 160, 1.0, 3
-
-        elif name == "vhs_retro":
-            if self.preset_idx == 0:
-                effect.tracking_intensity, effect.color_bleed, effect.noise_amount = 0.3, 4, 12
-            elif self.preset_idx == 1:
-                effect.tracking_intensity, effect.color_bleed, effect.noise_amount = 0.7, 8, 25
-            else:
-                effect.tracking_intensity, effect.color_bleed, effect.noise_amount = 0.15, 2, 6
-
-        elif name == "glitch_blocks":
-            if self.preset_idx == 0:
-                effect.block_count, effect.max_shift, effect.intensity = 8, 30, 0.5
-            elif self.preset_idx == 1:
-                effect.block_count, effect.max_shift, effect.intensity = 16, 60, 0.8
-            else:
-                effect.block_count, effect.max_shift, effect.intensity = 4, 15, 0.3
-
-        elif name == "ascii_art":
-            if self.preset_idx == 0:
-                effect.cell_size, effect.colored = 8, True
-            elif self.preset_idx == 1:
-                effect.cell_size, effect.colored = 5, True
-            else:
-                effect.cell_size, effect.colored = 8, False
-
-        elif name == "datamosh":
-            if self.preset_idx == 0:
-                effect.corruption, effect.intensity, effect.block_size = 0.3, 0.7, 16
-            elif self.preset_idx == 1:
-                effect.corruption, effect.intensity, effect.block_size = 0.6, 0.9, 8
-            else:
-                effect.corruption, effect.intensity, effect.block_size = 0.15, 0.5, 24
-
-        elif name == "zoom_pulse":
-            if self.preset_idx == 0:
-                effect.amplitude, effect.speed = 0.08, 0.12
-            elif self.preset_idx == 1:
-                effect.amplitude, effect.speed = 0.20, 0.20
-            else:
-                effect.amplitude, effect.speed = 0.04, 0.06
-
-        elif name == "duotone":
-            effect.palette_idx = self.preset_idx % len(effect.PALETTES)
-
-        elif name == "slit_scan":
-            if self.preset_idx == 0:
-                effect.buffer_size, effect.spread = 30, 1.0
-            elif self.preset_idx == 1:
-                effect.buffer_size, effect.spread = 50, 2.0
-            else:
-                effect.buffer_size, effect.spread = 15, 0.5
+        effect.apply_preset(self.preset_idx)
 
     # -------- FPS --------
     def _update_fps(self):
@@ -325,10 +368,15 @@ class PipelineRunner:
             ok, frame = self.capture.read()
             if not ok:
                 break
+            frame_ts = time.perf_counter()
 
             # --- Movimiento + Zonas ---
             motion_global, motion_mask = self.motion.update(frame)
-            zone_vals = self.zones.compute(motion_mask)
+            # Zonas solo cuando hubo análisis nuevo (misma máscara = mismas zonas)
+            zone_vals = self.zones.compute(motion_mask) if self.motion.fresh else self.zones.last
+
+            # --- Optical flow ---
+            flow = self.flow.update(frame) if self.flow_enabled else self.flow.last
 
             # --- Pose ---
             pose_data = None
@@ -348,32 +396,64 @@ class PipelineRunner:
             # --- Audio ---
             audio_controls = self.audio.update()
 
-            controls = {"motion": m, "zones": zone_vals}
+            controls = {"motion": m, "zones": zone_vals, "flow": flow}
             controls.update(audio_controls)
 
-            # --- MIDI poll ---
+            # --- MIDI clock: exact beat/tempo when present, audio beat otherwise ---
+            clock_controls = self.midi.clock_controls()
+            if clock_controls is not None:
+                controls.update(clock_controls)
+
+            # --- MIDI + OSC (applied at the frame boundary) ---
             self.midi.poll(self)
+            self.osc.poll(self, controls)
 
             # --- Auto-VJ ---
             if self.autovj.enabled:
-                pre_change_frame = None
-                old_stack = self._stack_ids()
-                self.autovj.update(self, controls)
-                if self._stack_ids() != old_stack:
-                    self.autovj.start_crossfade(frame)
-
-            # --- Apply effect stack ---
+                old_stack = list(self.effect_stack)
+                self.autovj.update(self, controls, frame)
+                if self._stack_ids() != [eid for eid, _ in old_stack]:
+                    self.autovj.start_transition(frame, old_stack, self.effect_stack)
+
+            # --- Scene recall: swap in a prepared stack at the frame boundary ---
+            self.scene_mgr.commit(self)
+            if self._last_frame_ts is not None:
+                self.param_smoother.step(frame_ts - self._last_frame_ts)
+            self._last_frame_ts = frame_ts
+            morph = self.morph
+            if morph is not None and not morph.update():
+                # Finished: drop the faded-out effects
+                self.effect_stack[:] = [
+                    (eid, fx) for eid, fx in self.effect_stack
+                    if all(fx is not old for _, old in morph.removed)
+                ]
+                self.active_idx = min(self.active_idx, max(0, len(self.effect_stack) - 1))
+                self.morph = morph = None
+                self.param_smoother.release()
+
+            # --- Apply effect stack (timed per effect for the AutoVJ cost table) ---
             out = frame
+            self.procpool.retain(fx for _, fx in self.effect_stack)
+            self.effect_costs.set_resolution(frame.shape[1], frame.shape[0])
             for _, effect in self.effect_stack:
+                weight = morph.weight(effect) if morph is not None else 1.0
+                if weight <= 0.0:
+                    continue
                 try:
                     effect.set_controls(controls)
                 except Exception:
                     pass
-                out = effect.apply(out)
-
-            # --- Auto-VJ crossfade ---
+                t0 = time.perf_counter()
+                if effect.gil_bound and self.procpool.ready:
+                    res = self.procpool.apply(effect, out)
+                else:
+                    res = self.tiles.apply(effect, out)
+                self.effect_costs.record(effect.name, (time.perf_counter() - t0) * 1000.0)
+                out = res if weight >= 1.0 else cv2.addWeighted(out, 1.0 - weight, res, weight, 0)
+
+            # --- Auto-VJ transition (outgoing stack still live in "live" mode) ---
             if self.autovj.enabled:
-                out = self.autovj.apply_crossfade(out)
+                out = self.autovj.apply_transition(frame, out, controls)
 
             # --- MIDI fader: global mix (original vs processed) ---
             if self._midi_fader < 0.99 and self.effect_stack:
@@ -409,16 +489,22 @@ class PipelineRunner:
                 out = _apply_hud(out, [
                     f"FPS: {self._fps:.1f} | Stack: [{','.join(str(e) for e in self._stack_ids())}]",
                     f"Active: {self._stack_names()}",
-                    f"Preset: {self.preset_idx} | Motion: {m:.2f} | Pose: {self.pose_enabled} | Audio: {self.audio.enabled} | MIDI: {self.midi.enabled} | AutoVJ: {self.autovj.enabled}{audio_str}",
-                    f"VCam: {self.vcam.enabled} | Rec: {self.recorder.enabled} | Page: {self.fx_page} ({self.fx_page*12+1}-{self.fx_page*12+12}) | {bars}",
-                    "1-9-=\\ fx | n page | 0 clr | [] pst | TAB cyc | c vcam | w rec | F1-8/!-* scene | a m x g f h q",
+                    f"Preset: {self.preset_idx} | Motion: {m:.2f} | Flow: {flow['mag']:.2f}@{math.degrees(flow['angle']):.0f} | Pose: {self.pose_enabled} | Audio: {self.audio.enabled} | MIDI: {self.midi.enabled} | AutoVJ: {self.autovj.enabled}{audio_str}",
+                    f"VCam: {self.vcam.enabled} | Rec: {self.recorder.enabled} ({self.recorder.dropped} drop) | Replay: {f'{self.replay.buffered_seconds:.0f}s' if self.replay.enabled else 'off'} | Bus: {self.bus.enabled} | Page: {self.fx_page} ({self.fx_page*PAGE_SIZE+1}-{self.fx_page*PAGE_SIZE+PAGE_SIZE}) | {bars}",
+                    "1-9-=\\ fx | n page | 0 clr | [] pst | TAB cyc | c vcam | w rec | b bus | s/S snap/burst | i replay | F1-8/!-* scene z morph | a m u x g o f h q",
                 ])
 
-            # --- Virtual cam + Recorder (clean frame, no HUD/FPS overlay) ---
+            # --- Virtual cam + Recorder + Frame bus (clean frame, no HUD/FPS overlay) ---
             if self.vcam.enabled:
                 self.vcam.send(out)
             if self.recorder.enabled:
-                self.recorder.write(out)
+                self.recorder.write(out, frame_ts)
+            if self.bus.enabled:
+                self.bus.publish(out, frame_ts)
+            if self.exporter.bursting:
+                self.exporter.feed(out, frame_ts)
+            if self.replay.enabled:
+                self.replay.feed(out, frame_ts)
 
             # --- FPS overlay (always visible) ---
             cv2.putText(out, f"{self._fps:.0f}", (out.shape[1] - 60, 30),
@@ -432,12 +518,26 @@ class PipelineRunner:
 
             cv2.imshow(config.WINDOW_NAME, out)
 
+            # --- Effect + scene warm-up (after the frame is on screen) ---
+            if not self._scenes_prepared:
+                self.scene_mgr.prepare_all(frame)
+                self._scenes_prepared = True
+            if self._warm_queue or self._warmed:
+                self._warm_effects(frame)
+
             if self.show_vision_debug and not self.perf_mode:
                 cv2.imshow("MotionMask (debug)", motion_mask)
 
             raw_key = cv2.waitKeyEx(1)
             key = raw_key & 0xFF
 
+            # --- First frame is up: report startup, load the rest in the background ---
+            if self.startup is not None:
+                self.startup.mark("first frame")
+                self.startup.report()
+                self.startup = None
+                self._start_preload()
+
             if key == ord("q"):
                 break
 
@@ -450,35 +550,30 @@ class PipelineRunner:
                 )
 
             elif key == ord("g"):
-                self.pose_enabled = not self.pose_enabled
-                if not self.perf_mode:
-                    print(f"[pose] enabled={self.pose_enabled}")
+                if not self.pose_enabled and self._ensure_pose() is None:
+                    print("[pose] mediapipe not available. Install with: pip install mediapipe")
+                else:
+                    self.pose_enabled = not self.pose_enabled
+                    if self.pose_enabled:
+                        self.pose.reset()
+                    if not self.perf_mode:
+                        print(f"[pose] enabled={self.pose_enabled}")
 
             # Effect page toggle: n
             elif key == ord("n"):
-                self.fx_page = 1 - self.fx_page
-                if not self.perf_mode:
-                    print(f"[fx_page] {self.fx_page} (effects {self.fx_page*12+1}-{self.fx_page*12+12})")
+                self._next_page()
 
             # Effect toggle: 1-9 (page-aware)
             elif ord("1") <= key <= ord("9"):
-                effect_id = key - ord("0") + self.fx_page * 12
-                if effect_id in EFFECTS_FACTORY:
-                    self._toggle_effect(effect_id)
+                self._toggle_page_effect(key - ord("0"))
 
             # Effects 10-12 on current page: - = \
             elif key == ord("-"):
-                eid = 10 + self.fx_page * 12
-                if eid in EFFECTS_FACTORY:
-                    self._toggle_effect(eid)
+                self._toggle_page_effect(10)
             elif key == ord("="):
-                eid = 11 + self.fx_page * 12
-                if eid in EFFECTS_FACTORY:
-                    self._toggle_effect(eid)
+                self._toggle_page_effect(11)
             elif key == ord("\\"):
-                eid = 12 + self.fx_page * 12
-                if eid in EFFECTS_FACTORY:
-                    self._toggle_effect(eid)
+                self._toggle_page_effect(12)
 
             # Clear effects: 0
             elif key == ord("0"):
@@ -502,26 +597,44 @@ class PipelineRunner:
                 self.perf_mode = not self.perf_mode
             elif key == ord("v"):
                 self.show_vision_debug = not self.show_vision_debug
+            elif key == ord("o"):
+                self.flow_enabled = not self.flow_enabled
+                if not self.flow_enabled:
+                    self.flow.reset()
+                if not self.perf_mode:
+                    print(f"[flow] enabled={self.flow_enabled}")
 
             elif key == ord("a"):
                 self.audio.toggle()
             elif key == ord("m"):
                 self.midi.toggle()
+            elif key == ord("u"):
+                self.osc.toggle()
             elif key == ord("x"):
                 self.autovj.toggle()
             elif key == ord("c"):
                 self.vcam.toggle()
             elif key == ord("w"):
                 self.recorder.toggle(frame_size=frame.shape[:2])
+            elif key == ord("b"):
+                self.bus.toggle(frame_size=frame.shape[:2])
 
             elif key == ord("r"):
                 self._reset_active_effect()
             elif key == ord("s"):
                 self._screenshot(out)
+            elif key == ord("S"):
+                self.exporter.start_burst(config.BURST_SECONDS, config.BURST_FORMAT)
+            elif key == ord("i"):
+                self._dump_replay()
+            elif key == ord("z"):
+                self.morph_mode = not self.morph_mode
+                if not self.perf_mode:
+                    print(f"[scenes] morph={self.morph_mode}")
 
             # Scene load: F1-F8 (OpenCV waitKeyEx codes on Windows)
             elif 0x700000 <= raw_key <= 0x700007:
-                self.scene_mgr.load_scene(raw_key - 0x700000 + 1, self)
+                self.scene_mgr.load_scene(raw_key - 0x700000 + 1, self, self._morph_seconds(controls))
             # Scene save: Shift+1-8 (!@#$%^&*)
             elif key in (ord("!"), ord("@"), ord("#"), ord("$"), ord("%"), ord("^"), ord("&"), ord("*")):
                 save_map = {"!": 1, "@": 2, "#": 3, "$": 4, "%": 5, "^": 6, "&": 7, "*": 8}
@@ -532,6 +645,14 @@ class PipelineRunner:
         # Cleanup
         self.vcam.stop()
         self.recorder.stop()
+        self.bus.stop()
+        self.exporter.stop()
+        self.replay.stop()
+        self.effect_costs.save()
+        self.scene_mgr.stop()
         self.audio.stop()
         self.midi.stop()
+        self.osc.stop()
+        self.tiles.stop()
+        self.procpool.stop()
         cv2.destroyAllWindows()
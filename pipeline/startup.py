@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+class StartupTimer:
+    """Wall-clock breakdown of startup, printed once the first frame is on screen.
+
+    mark(name) closes the phase that started at the previous mark (or at
+    `t0`, taken in main.py before the heavy imports).
+    """
+
+    def __init__(self, t0=None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self._last = self.t0
+        self.phases = []            # (name, ms)
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000.0))
+        self._last = now
+
+    @property
+    def total_ms(self):
+        return (self._last - self.t0) * 1000.0
+
+    def report(self):
+        parts = ", ".join(f"{name} {ms:.0f}" for name, ms in self.phases)
+        print(f"[startup] window live in {self.total_ms:.0f} ms ({parts})")
+
+
+class Preloader:
+    """Run loaders on one background thread, one after another, and time each.
+
+    Used after the first frame to import optional subsystems (mediapipe,
+    sounddevice, ...) before the user enables them. Loaders must be safe to
+    run concurrently with a first use on the render thread.
+    """
+
+    def __init__(self, tasks, verbose=True):
+        self.tasks = list(tasks)    # (name, callable)
+        self.verbose = verbose
+        self.timings = {}           # name -> ms
+        self._thread = None
+
+    def start(self):
+        if not self.tasks or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for name, load in self.tasks:
+            t0 = time.perf_counter()
+            try:
+                ok = load() is not None
+            except Exception as e:
+                print(f"[startup] preload {name} failed: {e}")
+                continue
+            ms = (time.perf_counter() - t0) * 1000.0
+            self.timings[name] = ms
+            if self.verbose and ok:
+                print(f"[startup] preloaded {name} in {ms:.0f} ms (background)")
+
+    @property
+    def done(self):
+        return self._thread is not None and not self._thread.is_alive()
@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+
+class TileExecutor:
+    """Run tile-safe effects as horizontal bands on a persistent thread pool.
+
+    For an effect with tile_safe = True, begin_frame() runs once on the
+    calling thread, then the frame is split into `threads` bands; each band
+    (plus `tile_halo` rows of context on both sides) goes through
+    apply_tile() on a pool thread and its inner rows are copied into the
+    output. OpenCV and NumPy release the GIL in their kernels, so the bands
+    really run in parallel. Every other effect (stateful ones: trails,
+    feedback, datamosh, ...) just runs apply() on the calling thread, as do
+    gil_bound effects (their Python loops would only contend for the GIL;
+    see pipeline/procpool.py) and frames too small to give each band
+    `min_rows` rows.
+
+    OpenCV's own worker threads are switched off (cv2.setNumThreads(1))
+    while the bands run: one band per core already fills the machine, and
+    stacking OpenCV's pool on top of every band oversubscribes it.
+
+    threads=0 uses os.cpu_count(); threads=1 disables tiling.
+    """
+
+    def __init__(self, threads=0, min_rows=64):
+        self.threads = max(1, int(threads) or os.cpu_count() or 1)
+        self.min_rows = max(1, int(min_rows))
+        self._pool = None
+        if self.threads > 1:
+            self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="tile")
+        self.tiled = 0          # apply() calls that ran as bands
+        self.fallback = 0       # calls that ran on the calling thread
+
+    @property
+    def enabled(self):
+        return self._pool is not None
+
+    def bands(self, height):
+        """Row ranges [(y0, y1)] a frame of `height` rows is split into."""
+        n = min(self.threads, height // self.min_rows)
+        if n < 2:
+            return [(0, height)]
+        return [(i * height // n, (i + 1) * height // n) for i in range(n)]
+
+    def apply(self, effect, frame):
+        """Equivalent of effect.apply(frame), banded when the effect allows it."""
+        if self._pool is None or effect.gil_bound or not effect.tile_safe:
+            self.fallback += 1
+            return effect.apply(frame)
+        bands = self.bands(frame.shape[0])
+        if len(bands) < 2:
+            self.fallback += 1
+            return effect.apply(frame)
+
+        effect.begin_frame(frame)
+        halo = max(0, int(effect.tile_halo))
+        out = np.empty_like(frame)
+        cv_threads = cv2.getNumThreads()
+        cv2.setNumThreads(1)
+        try:
+            futures = [
+                self._pool.submit(self._band, effect, frame, out, y0, y1, halo)
+                for y0, y1 in bands[1:]
+            ]
+            self._band(effect, frame, out, bands[0][0], bands[0][1], halo)
+            for f in futures:
+                f.result()
+        finally:
+            cv2.setNumThreads(cv_threads)
+        self.tiled += 1
+        return out
+
+    @staticmethod
+    def _band(effect, frame, out, y0, y1, halo):
+        a = max(0, y0 - halo)
+        b = min(frame.shape[0], y1 + halo)
+        res = effect.apply_tile(frame[a:b], a)
+        out[y0:y1] = res[y0 - a:y1 - a]
+
+    def stop(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
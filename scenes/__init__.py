@@ -1 +1,2 @@
 from .manager import SceneManager
+from .morph import SceneMorph
@@ -1,10 +1,39 @@
+import copy
 import json
 import os
+import threading
+
+import numpy as np
+
+from effects import EFFECTS_FACTORY
+from .morph import SceneMorph
 
 SCENES_FILE = "scenes.json"
 MAX_SCENES = 8  # F1-F8
 
 
+def _freeze(value):
+    """Copy of `value` that the live effect can no longer change: arrays are
+    np.copy'd and containers rebuilt; anything else is shared until the
+    builder deep-copies it."""
+    if isinstance(value, np.ndarray):
+        return np.copy(value)
+    if isinstance(value, list):
+        return [_freeze(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _freeze(v) for k, v in value.items()}
+    return value
+
+
+def _thaw(cls, state):
+    """New `cls` instance holding a private copy of a frozen state."""
+    effect = cls.__new__(cls)
+    effect.__dict__.update(copy.deepcopy(state))
+    return effect
+
+
 class SceneManager:
     """Save and load effect stack configurations (scenes).
 
@@ -13,11 +42,38 @@ class SceneManager:
     - Active effect index
     - Preset index
     - Per-effect parameters
+
+    Every saved slot keeps a ready-made stack (new effect instances with the
+    scene's parameters, warmed up when a frame is available) built on a
+    background thread. load_scene() only marks it pending; the runner swaps
+    it in with commit() at the first frame boundary where the stack is
+    ready (the render thread never waits on a build: until then the current
+    stack keeps playing). With snapshot_state the
+    live effects' state (temporal buffers included) is captured on save
+    (array copies only; the instances are rebuilt by the builder) and
+    recalled as it was. load_scene(..., morph_seconds=N) turns the swap
+    into a SceneMorph instead of a cut. scenes.json is written by a background writer
+    (temp file + rename), so neither path blocks the render thread.
     """
 
-    def __init__(self, filepath=SCENES_FILE):
+    def __init__(self, filepath=SCENES_FILE, snapshot_state=False):
         self.filepath = filepath
+        self.snapshot_state = snapshot_state
         self.scenes = {}
+        self._snapshots = {}        # slot key -> [(eid, class, frozen state)] (in memory only)
+
+        self._lock = threading.Lock()
+        self._prepared = {}         # slot key -> [(eid, effect)] ready to go live
+        self._preparing = {}        # slot key -> Thread
+        self._building = set()      # slot keys with a build thread running
+        self._stale = set()         # slot keys changed while their build ran: build again
+        self._pending = None        # (key, morph_seconds) to commit once its stack is ready
+        self._warm_frame = None
+
+        self._save_wake = threading.Event()
+        self._save_data = None
+        self._writer = None
+        self._closing = False
         self._load()
 
     def _load(self):
@@ -30,12 +86,149 @@ class SceneManager:
                 print(f"[scenes] failed to load: {e}")
                 self.scenes = {}
 
+    # -------- Persistence (background writer) --------
+
     def _save(self):
-        try:
-            with open(self.filepath, "w") as f:
-                json.dump(self.scenes, f, indent=2)
-        except Exception as e:
-            print(f"[scenes] failed to save: {e}")
+        """Queue the current scenes for writing (latest state wins)."""
+        with self._lock:
+            self._save_data = json.dumps(self.scenes, indent=2)
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+        self._save_wake.set()
+
+    def _write_loop(self):
+        while True:
+            self._save_wake.wait()
+            self._save_wake.clear()
+            with self._lock:
+                data, self._save_data = self._save_data, None
+            if data is not None:
+                tmp = self.filepath + ".tmp"
+                try:
+                    with open(tmp, "w") as f:
+                        f.write(data)
+                    os.replace(tmp, self.filepath)
+                except Exception as e:
+                    print(f"[scenes] failed to save: {e}")
+            if self._closing:
+                break
+
+    def stop(self):
+        """Flush pending saves."""
+        if self._writer is not None:
+            self._closing = True
+            self._save_wake.set()
+            self._writer.join()
+            self._writer = None
+        for t in list(self._preparing.values()):
+            t.join()
+
+    # -------- Prepared stacks --------
+
+    def prepare_all(self, frame=None):
+        """(Re)build the ready-made stack of every saved slot in the background.
+
+        `frame` (any frame at the working resolution) is kept to warm up new
+        instances.
+        """
+        if frame is not None:
+            self._warm_frame = frame.copy()
+        for key in self.scenes:
+            self._prepare(key)
+
+    def _prepare(self, key):
+        with self._lock:
+            if key in self._building:
+                # The running build may be for an older version: have it go again
+                self._stale.add(key)
+                return
+            self._building.add(key)
+        t = threading.Thread(target=self._build_loop, args=(key,), daemon=True)
+        self._preparing[key] = t
+        t.start()
+
+    def _build_loop(self, key):
+        while True:
+            self._build(key)
+            with self._lock:
+                if key not in self._stale:
+                    self._building.discard(key)
+                    return
+                self._stale.discard(key)
+
+    def _build(self, key):
+        scene = self.scenes.get(key)
+        if scene is None:
+            return
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None:
+            stack = [(eid, _thaw(cls, state)) for eid, cls, state in snapshot]
+        else:
+            stack = []
+            for effect_data in scene.get("effects", []):
+                EffectCls = EFFECTS_FACTORY.get(effect_data["id"])
+                if EffectCls is None:
+                    continue
+                effect = EffectCls()
+                params = effect_data.get("params", {})
+                self._apply_params(effect, params)
+                if self._warm_frame is not None:
+                    effect.warmup(self._warm_frame)  # with the scene's params
+                stack.append((effect_data["id"], effect))
+        with self._lock:
+            if self.scenes.get(key) is scene:
+                self._prepared[key] = stack
+            else:
+                self._stale.add(key)    # saved again meanwhile: rebuild
+
+    def commit(self, runner):
+        """Swap in a pending scene. Call once per frame, before the effect stack runs."""
+        if self._pending is None:
+            return False
+        key, morph_seconds = self._pending
+        with self._lock:
+            scene = self.scenes.get(key)
+            stack = self._prepared.pop(key, None)
+            building = key in self._building
+        if scene is None:
+            self._pending = None
+            return False
+        if stack is None:
+            if not building:
+                self._prepare(key)
+            return False            # keep playing the current stack
+        self._pending = None
+
+        if morph_seconds > 0:
+            targets = {e["id"]: e.get("params", {}) for e in scene.get("effects", [])}
+            morph = SceneMorph(runner.effect_stack, stack, targets, morph_seconds)
+            runner.morph = morph
+            runner.param_smoother.hold(morph.owned)
+            stack = morph.stack
+        else:
+            runner.morph = None
+            runner.param_smoother.release()
+
+        runner._clear_effects()
+        runner.effect_stack[:] = stack
+        for eid, effect in runner.effect_stack:
+            runner._effect_cache[eid] = effect
+        runner.active_idx = min(
+            scene.get("active_idx", 0),
+            max(0, len(runner.effect_stack) - 1)
+        )
+        runner.preset_idx = scene.get("preset_idx", 0)
+
+        # These instances are live now: build a fresh set for the next recall
+        self._prepare(key)
+
+        names = [str(e["id"]) for e in scene.get("effects", [])]
+        how = f"morphing {morph_seconds:.1f}s" if morph_seconds > 0 else "loaded"
+        print(f"[scenes] {how} slot {key}: [{','.join(names)}]")
+        return True
+
+    # -------- Save / load --------
 
     def save_scene(self, slot, runner):
         """Save current effect stack to a slot (1-8).
@@ -60,90 +253,48 @@ class SceneManager:
             }
             scene["effects"].append(effect_data)
 
-        self.scenes[str(slot)] = scene
+        key = str(slot)
+        if self.snapshot_state:
+            # Only np.copy the buffers here; deep copies happen on the builder
+            self._snapshots[key] = [
+                (eid, type(effect), _freeze(vars(effect))) for eid, effect in runner.effect_stack
+            ]
+        with self._lock:
+            self.scenes[key] = scene
+            self._prepared.pop(key, None)
         self._save()
+        self._prepare(key)
         names = [str(e["id"]) for e in scene["effects"]]
         print(f"[scenes] saved slot {slot}: [{','.join(names)}]")
 
-    def load_scene(self, slot, runner):
-        """Load a scene from slot into runner.
+    def load_scene(self, slot, runner, morph_seconds=0.0):
+        """Queue a scene from slot to go live at the next frame boundary.
 
         Args:
             slot: Scene slot number (1-8)
             runner: PipelineRunner instance
+            morph_seconds: If > 0, morph into the scene over this time
         """
         key = str(slot)
         if key not in self.scenes:
             print(f"[scenes] slot {slot} is empty")
             return
 
-        scene = self.scenes[key]
-
-        # Clear current stack
-        runner._clear_effects()
-
-        # Load effects
-        for effect_data in scene.get("effects", []):
-            eid = effect_data["id"]
-            runner._toggle_effect(eid)
-
-            # Apply saved params
-            if runner.effect_stack:
-                _, effect = runner.effect_stack[-1]
-                self._apply_params(effect, effect_data.get("params", {}))
-
-        runner.active_idx = min(
-            scene.get("active_idx", 0),
-            max(0, len(runner.effect_stack) - 1)
-        )
-        runner.preset_idx = scene.get("preset_idx", 0)
-
-        names = [str(e["id"]) for e in scene["effects"]]
-        print(f"[scenes] loaded slot {slot}: [{','.join(names)}]")
+        with self._lock:
+            ready = key in self._prepared
+        if not ready:
+            # Not prepared yet (or just used): commit() picks it up when built
+            self._prepare(key)
+            print(f"[scenes] slot {slot} is being prepared, loading when ready")
+        self._pending = (key, morph_seconds)
 
     def _extract_params(self, effect):
-        """Extract tunable parameters from an effect."""
-        params = {}
-        # Common params across effects
-        for attr in [
-            "levels", "speed", "phase",
-            "t1", "t2", "blur_ksize",
-            "feedback", "warp", "noise",
-            "mode",
-            "scan_strength", "shift",
-            "persist", "glow",
-            "strength", "radial",
-            "threshold", "intensity", "direction",
-            "contrast", "blur", "_map_idx",
-            "rate", "color_mode",
-            "hue_speed", "glow_size",
-            "tracking_intensity", "color_bleed", "noise_amount",
-            "block_count", "max_shift",
-            "cell_size", "colored", "font_scale",
-            "max_particles",
-            "blend", "smooth",
-            "corruption", "block_size",
-            "amplitude",
-            "palette_idx",
-            "buffer_size", "spread",
-        ]:
-            if hasattr(effect, attr):
-                val = getattr(effect, attr)
-                # Only save serializable types
-                if isinstance(val, (int, float, bool, str)):
-                    params[attr] = val
-        return params
+        """Extract tunable parameters (the effect's PARAMS schema)."""
+        return effect.get_params()
 
     def _apply_params(self, effect, params):
-        """Apply saved parameters to an effect."""
-        for attr, val in params.items():
-            if hasattr(effect, attr):
-                setattr(effect, attr, val)
-
-        # Special: update colormap if _map_idx was saved
-        if "_map_idx" in params and hasattr(effect, "_colormaps"):
-            idx = int(params["_map_idx"]) % len(effect._colormaps)
-            effect.colormap = effect._colormaps[idx]
+        """Apply saved parameters to an effect (unknown names are ignored)."""
+        effect.set_params(params)
 
     def list_scenes(self):
         """Return dict of slot -> effect IDs."""
@@ -0,0 +1,125 @@
+import time
+
+import numpy as np
+
+# Int parameters that size buffers: switched at the midpoint instead of swept
+RESIZING_PARAMS = {"max_particles", "buffer_size"}
+
+
+def smoothstep(t):
+    t = min(1.0, max(0.0, t))
+    return t * t * (3.0 - 2.0 * t)
+
+
+class SceneMorph:
+    """Timed transition from the live stack to a scene.
+
+    Effects in both stacks keep their live instance and have every numeric
+    parameter of their PARAMS schema interpolated to the scene's value
+    (discrete ones switch at the midpoint); effects only in the scene
+    fade in, effects only in the live stack fade out. All curves (parameters
+    and fade weights) live in flat arrays built once in __init__, so each
+    update() is a single vectorized evaluation plus one set_param() per
+    curve (so on_change hooks run). `owned` lists the (effect, Param) pairs
+    the morph drives; the caller keeps the ParamSmoother off them.
+    """
+
+    def __init__(self, old_stack, new_stack, targets, duration, now=None):
+        """
+        Args:
+            old_stack: live [(eid, effect)]
+            new_stack: prepared [(eid, effect)] for the scene
+            targets: {eid: params} saved with the scene
+            duration: seconds
+        """
+        self.duration = max(1e-3, float(duration))
+        self.start_time = time.perf_counter() if now is None else now
+
+        live = dict(old_stack)
+        self.final = [(eid, live.get(eid, effect)) for eid, effect in new_stack]
+        final_ids = {eid for eid, _ in self.final}
+        self.removed = [(eid, effect) for eid, effect in old_stack if eid not in final_ids]
+        self.stack = self.final + self.removed
+
+        a, b, is_int, is_odd = [], [], [], []
+        self._setters = []          # (effect, Param) for each numeric curve
+        self._discrete = []         # (effect, {attr: value}) applied at the midpoint
+        for eid, effect in self.final:
+            if eid not in live:
+                continue
+            switch = {}
+            for attr, end in targets.get(eid, {}).items():
+                param = effect.PARAMS.get(attr)
+                if param is None:
+                    continue
+                start = getattr(effect, attr)
+                if start == end:
+                    continue
+                if param.discrete or attr in RESIZING_PARAMS:
+                    switch[attr] = end
+                    continue
+                a.append(float(start))
+                b.append(float(end))
+                is_int.append(param.kind is int)
+                is_odd.append(param.odd)
+                self._setters.append((effect, param))
+            if switch:
+                self._discrete.append((effect, switch))
+
+        # Fade weights share the same arrays (after the parameter curves)
+        self._weight_idx = {}
+        for eid, effect in self.final:
+            if eid not in live:
+                self._weight_idx[id(effect)] = len(a)
+                a.append(0.0)
+                b.append(1.0)
+                is_int.append(False)
+                is_odd.append(False)
+        for eid, effect in self.removed:
+            self._weight_idx[id(effect)] = len(a)
+            a.append(1.0)
+            b.append(0.0)
+            is_int.append(False)
+            is_odd.append(False)
+
+        self._a = np.array(a, np.float64)
+        self._span = np.array(b, np.float64) - self._a
+        self._int = np.array(is_int, bool)
+        self._odd = np.array(is_odd, bool)
+        self._values = self._a.copy()
+        self._n_params = len(self._setters)
+        self._switched = False
+        self.done = False
+
+    def update(self, now=None):
+        """Advance the morph. Returns False once it has finished."""
+        if now is None:
+            now = time.perf_counter()
+        s = smoothstep((now - self.start_time) / self.duration)
+
+        v = self._values
+        np.multiply(self._span, s, out=v)
+        v += self._a
+        np.rint(v, out=v, where=self._int)
+        np.copyto(v, np.floor(v * 0.5) * 2.0 + 1.0, where=self._odd)
+
+        vals = v[:self._n_params].tolist()
+        for (effect, param), val, as_int in zip(self._setters, vals, self._int):
+            effect.set_param(param, int(val) if as_int else val)
+
+        if s >= 0.5 and not self._switched:
+            for effect, params in self._discrete:
+                effect.set_params(params)
+            self._switched = True
+
+        self.done = s >= 1.0
+        return not self.done
+
+    @property
+    def owned(self):
+        return self._setters
+
+    def weight(self, effect):
+        """Fade weight of `effect` (1.0 for effects that are not fading)."""
+        idx = self._weight_idx.get(id(effect))
+        return 1.0 if idx is None else float(self._values[idx])
@@ -0,0 +1,95 @@
+import cv2
+import numpy as np
+
+
+class FlowEstimator:
+    """
+    Optical flow denso a baja resolución (DIS ultrafast, o Farneback si no hay DIS).
+
+    update(frame_bgr) -> dict listo para meter en controls["flow"]:
+      - grid: np.ndarray (rows, cols, 2) float32, vector medio por celda
+              en fracción del frame por frame (dx/ancho, dy/alto)
+      - dx, dy: dirección dominante (misma unidad que grid)
+      - mag: magnitud dominante normalizada 0..1 (con gain)
+      - angle: ángulo de la dirección dominante en radianes (0 = derecha, pi/2 = abajo)
+    """
+
+    def __init__(self, width=160, grid=(8, 6), gain=60.0, min_cell_mag=0.002):
+        self.width = int(width)            # ancho de análisis (el alto sigue el aspect ratio)
+        self.cols, self.rows = int(grid[0]), int(grid[1])
+        self.gain = float(gain)
+        self.min_cell_mag = float(min_cell_mag)
+
+        if hasattr(cv2, "DISOpticalFlow_create"):
+            self._dis = cv2.DISOpticalFlow_create(cv2.DISOPTICAL_FLOW_PRESET_ULTRAFAST)
+        else:
+            self._dis = None
+
+        self._small = None
+        self._gray = None
+        self._prev = None
+        self._flow = None
+        self._grid = np.zeros((self.rows, self.cols, 2), np.float32)
+        self.last = self._empty()
+
+    def _empty(self):
+        return {"grid": self._grid, "dx": 0.0, "dy": 0.0, "mag": 0.0, "angle": 0.0}
+
+    def reset(self):
+        self._prev = None
+        self._grid[:] = 0.0
+        self.last = self._empty()
+
+    def _alloc(self, frame_bgr):
+        h, w = frame_bgr.shape[:2]
+        sw = min(self.width, w)
+        sh = max(2, int(round(h * sw / w)))
+        self._small = np.empty((sh, sw, 3), np.uint8)
+        self._gray = np.empty((sh, sw), np.uint8)
+        self._prev = np.empty((sh, sw), np.uint8)
+        self._flow = np.zeros((sh, sw, 2), np.float32)
+        self._norm = np.array([1.0 / sw, 1.0 / sh], np.float32)
+        self._src_shape = frame_bgr.shape
+
+    def update(self, frame_bgr):
+        first = self._prev is None or self._src_shape != frame_bgr.shape
+        if first:
+            self._alloc(frame_bgr)
+
+        sh, sw = self._gray.shape
+        cv2.resize(frame_bgr, (sw, sh), dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+
+        if first:
+            np.copyto(self._prev, self._gray)
+            return self.last
+
+        if self._dis is not None:
+            self._flow = self._dis.calc(self._prev, self._gray, self._flow)
+        else:
+            self._flow = cv2.calcOpticalFlowFarneback(
+                self._prev, self._gray, self._flow, 0.5, 2, 9, 2, 5, 1.1, 0
+            )
+        np.copyto(self._prev, self._gray)
+
+        # Grilla gruesa: promedio por celda (INTER_AREA) y normalizado a fracción del frame
+        cv2.resize(self._flow, (self.cols, self.rows), dst=self._grid, interpolation=cv2.INTER_AREA)
+        self._grid *= self._norm
+
+        # Dirección dominante: promedio de celdas que realmente se mueven
+        mags = np.hypot(self._grid[..., 0], self._grid[..., 1])
+        moving = mags > self.min_cell_mag
+        if np.any(moving):
+            dx = float(self._grid[..., 0][moving].mean())
+            dy = float(self._grid[..., 1][moving].mean())
+        else:
+            dx = dy = 0.0
+
+        self.last = {
+            "grid": self._grid,
+            "dx": dx,
+            "dy": dy,
+            "mag": min(1.0, float(np.hypot(dx, dy)) * self.gain),
+            "angle": float(np.arctan2(dy, dx)),
+        }
+        return self.last
@@ -1,47 +1,210 @@
+import time
+
 import cv2
 import numpy as np
 
 
+class Mog2Backend:
+    """Background subtraction MOG2 (el más robusto, también el más caro)."""
+
+    name = "mog2"
+
+    def __init__(self, history=200, var_threshold=16, detect_shadows=False):
+        self.history = int(history)
+        self.var_threshold = float(var_threshold)
+        self.detect_shadows = bool(detect_shadows)
+        self.reset()
+
+    def reset(self):
+        self.bg = cv2.createBackgroundSubtractorMOG2(
+            history=self.history,
+            varThreshold=self.var_threshold,
+            detectShadows=self.detect_shadows,
+        )
+        self._fg = None
+
+    def apply(self, gray, steps=1):
+        # Con stride > 1 aprendemos más rápido para mantener la misma constante de tiempo
+        lr = min(1.0, steps / float(self.history)) if steps > 1 else -1
+        # MOG2 escribe en el mismo buffer cada frame
+        self._fg = self.bg.apply(gray, self._fg, lr)
+        cv2.threshold(self._fg, 200, 255, cv2.THRESH_BINARY, dst=self._fg)
+        return self._fg
+
+
+class FrameDiffBackend:
+    """Diferencia absoluta contra el frame anterior (muy barato)."""
+
+    name = "framediff"
+
+    def __init__(self, threshold=25):
+        self.threshold = int(threshold)
+        self._prev = None
+        self._diff = None
+
+    def reset(self):
+        self._prev = None
+        self._diff = None
+
+    def apply(self, gray, steps=1):
+        if self._prev is None or self._prev.shape != gray.shape:
+            self._prev = gray.copy()
+            self._diff = np.zeros_like(gray)
+            return self._diff
+
+        cv2.absdiff(gray, self._prev, dst=self._diff)
+        np.copyto(self._prev, gray)
+        cv2.threshold(self._diff, self.threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+        return self._diff
+
+
+class RunningAverageBackend:
+    """Fondo como promedio móvil (accumulateWeighted) + diferencia absoluta."""
+
+    name = "running_avg"
+
+    def __init__(self, alpha=0.05, threshold=25):
+        self.alpha = float(alpha)
+        self.threshold = int(threshold)
+        self._acc = None
+        self._bg = None
+        self._diff = None
+
+    def reset(self):
+        self._acc = None
+        self._bg = None
+        self._diff = None
+
+    def apply(self, gray, steps=1):
+        if self._acc is None or self._acc.shape != gray.shape:
+            self._acc = gray.astype(np.float32)
+            self._bg = gray.copy()
+            self._diff = np.zeros_like(gray)
+            return self._diff
+
+        alpha = 1.0 - (1.0 - self.alpha) ** steps
+        cv2.accumulateWeighted(gray, self._acc, alpha)
+        cv2.convertScaleAbs(self._acc, dst=self._bg)
+        cv2.absdiff(gray, self._bg, dst=self._diff)
+        cv2.threshold(self._diff, self.threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+        return self._diff
+
+
+MOTION_BACKENDS = {
+    Mog2Backend.name: Mog2Backend,
+    FrameDiffBackend.name: FrameDiffBackend,
+    RunningAverageBackend.name: RunningAverageBackend,
+}
+
+
 class MotionEstimator:
     """
-    Estima movimiento usando background subtraction (MOG2).
+    Estima movimiento con un backend intercambiable (ver MOTION_BACKENDS).
     Devuelve:
       - motion_global: float [0..1]
       - motion_mask_small: máscara binaria en resolución reducida (para debug/zones)
+
+    La máscara devuelta es un buffer reutilizado: es válida hasta el próximo update().
+
+    Decimación: con stride=k analiza 1 de cada k frames (o a rate_hz fijo si > 0).
+    En los frames intermedios motion se extrapola linealmente desde los dos últimos
+    análisis y la máscara es la del último análisis; `fresh` indica si hubo análisis.
     """
 
-    def __init__(self, scale=0.5, history=200, var_threshold=16, detect_shadows=False, smooth=0.2):
+    def __init__(self, scale=0.5, history=200, var_threshold=16, detect_shadows=False,
+                 smooth=0.2, backend="mog2", stride=1, rate_hz=0.0):
         self.scale = float(scale)
         self.smooth = float(smooth)
-        self.bg = cv2.createBackgroundSubtractorMOG2(
-            history=int(history),
-            varThreshold=float(var_threshold),
-            detectShadows=bool(detect_shadows),
-        )
+        self.stride = max(1, int(stride))
+        self.rate_hz = float(rate_hz)
+        self.fresh = False
+
+        if backend not in MOTION_BACKENDS:
+            raise ValueError(f"Unknown motion backend: {backend!r} (options: {', '.join(MOTION_BACKENDS)})")
+        if backend == Mog2Backend.name:
+            self.backend = Mog2Backend(history, var_threshold, detect_shadows)
+        else:
+            self.backend = MOTION_BACKENDS[backend]()
+
         self._ema = 0.0
+        self._kernel = np.ones((3, 3), np.uint8)
+
+        # Estado de decimación
+        self._since = 0                 # frames desde el último análisis
+        self._last_t = None             # (t, ema) del último análisis
+        self._prev_t = None             # (t, ema) del análisis anterior
+
+        # Buffers preasignados (se recrean si cambia la resolución)
+        self._small = None
+        self._gray = None
+        self._open = None
+        self._mask = None
+
+    def _alloc(self, frame_bgr):
+        h, w = frame_bgr.shape[:2]
+        sw, sh = int(w * self.scale), int(h * self.scale)
+        self._small = np.empty((sh, sw, 3), np.uint8) if self.scale != 1.0 else None
+        self._gray = np.empty((sh, sw), np.uint8)
+        self._open = np.empty((sh, sw), np.uint8)
+        self._mask = np.empty((sh, sw), np.uint8)
+        self._src_shape = frame_bgr.shape
 
     def _preprocess(self, frame_bgr):
-        if self.scale != 1.0:
-            h, w = frame_bgr.shape[:2]
-            frame_bgr = cv2.resize(frame_bgr, (int(w * self.scale), int(h * self.scale)))
-        gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (5, 5), 0)
-        return gray
+        if self._gray is None or self._src_shape != frame_bgr.shape:
+            self._alloc(frame_bgr)
+        if self._small is not None:
+            h, w = self._gray.shape
+            frame_bgr = cv2.resize(frame_bgr, (w, h), dst=self._small)
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        cv2.GaussianBlur(self._gray, (5, 5), 0, dst=self._gray)
+        return self._gray
+
+    def _due(self, now):
+        if self._last_t is None or self._mask is None:
+            return True
+        if self.rate_hz > 0:
+            return now - self._last_t[0] >= 1.0 / self.rate_hz
+        return self._since >= self.stride
+
+    def _extrapolate(self, now):
+        t1, v1 = self._last_t
+        if self._prev_t is None:
+            return v1
+        t0, v0 = self._prev_t
+        dt = t1 - t0
+        if dt <= 0:
+            return v1
+        # Como mucho un intervalo hacia adelante, para no dispararse si se atrasa
+        ahead = min(now - t1, dt)
+        v = v1 + (v1 - v0) * ahead / dt
+        return min(1.0, max(0.0, v))
 
     def update(self, frame_bgr):
+        now = time.perf_counter()
+        self._since += 1
+        if not self._due(now):
+            self.fresh = False
+            return self._extrapolate(now), self._mask
+
+        steps = self._since if self._last_t is not None else 1
+        self._since = 0
+        self.fresh = True
+
         gray = self._preprocess(frame_bgr)
 
-        fg = self.bg.apply(gray)
+        fg = self.backend.apply(gray, steps)
 
-        # Limpieza: binarizar + morfología para ruido
-        _, fg = cv2.threshold(fg, 200, 255, cv2.THRESH_BINARY)
-        fg = cv2.morphologyEx(fg, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8), iterations=1)
-        fg = cv2.dilate(fg, None, iterations=1)
+        # Limpieza: morfología para ruido (el backend ya binarizó)
+        cv2.morphologyEx(fg, cv2.MORPH_OPEN, self._kernel, dst=self._open, iterations=1)
+        cv2.dilate(self._open, None, dst=self._mask, iterations=1)
 
         # Intensidad: % de pixeles activos
-        motion = float(np.mean(fg > 0))  # 0..1
+        motion = cv2.countNonZero(self._mask) / float(self._mask.size)  # 0..1
 
-        # Suavizado EMA para que no “tiemble”
-        self._ema = (1 - self.smooth) * self._ema + self.smooth * motion
+        # Suavizado EMA para que no “tiemble” (equivalente a `steps` frames)
+        a = 1.0 - (1.0 - self.smooth) ** steps
+        self._ema = (1 - a) * self._ema + a * motion
 
-        return self._ema, fg
+        self._prev_t = self._last_t
+        self._last_t = (now, self._ema)
+        return self._ema, self._mask
@@ -1,14 +1,124 @@
+import importlib
+import importlib.util
+import time
+
 import cv2
-import mediapipe as mp
 import numpy as np
 
+# MediaPipe tarda ~1 s en importar: se carga recién al construir PoseEstimator
+HAS_MEDIAPIPE = importlib.util.find_spec("mediapipe") is not None
+mp = None
+
+
+def load_mediapipe():
+    """Importa mediapipe una sola vez. Devuelve el módulo o None si no está."""
+    global mp
+    if mp is None and HAS_MEDIAPIPE:
+        try:
+            mp = importlib.import_module("mediapipe")
+        except Exception as e:
+            print(f"[pose] failed to load mediapipe: {e}")
+    return mp
+
+
+# Landmarks que usamos (índices MediaPipe Pose)
+KEYPOINTS = {
+    "l_shoulder": 11,
+    "r_shoulder": 12,
+    "l_elbow": 13,
+    "r_elbow": 14,
+    "l_wrist": 15,
+    "r_wrist": 16,
+    "l_hip": 23,
+    "r_hip": 24,
+}
+
+
+class LandmarkFilter:
+    """
+    Filtro One-Euro por landmark (vectorizado) + predicción a velocidad constante.
+    - correct(t, xy, vis): incorpora una inferencia nueva (xy: (N,2), vis: (N,))
+    - predict(t) -> (xy, vis): posición estimada para cualquier frame intermedio
+
+    Los landmarks con visibilidad < min_vis no actualizan el filtro (se mantienen
+    y se reporta su visibilidad medida). Si pasan más de max_predict segundos sin
+    inferencia, se deja de extrapolar y la visibilidad decae (vis_decay por segundo).
+    """
+
+    def __init__(self, n, min_cutoff=1.0, beta=1.5, d_cutoff=1.0,
+                 max_predict=0.2, vis_decay=4.0, min_vis=0.4):
+        self.n = int(n)
+        self.min_cutoff = float(min_cutoff)
+        self.beta = float(beta)
+        self.d_cutoff = float(d_cutoff)
+        self.max_predict = float(max_predict)
+        self.vis_decay = float(vis_decay)
+        self.min_vis = float(min_vis)
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = np.zeros((self.n, 2), np.float32)
+        self._dx = np.zeros((self.n, 2), np.float32)
+        self._vis = np.zeros(self.n, np.float32)
+        self._seen = np.zeros(self.n, bool)
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * np.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def correct(self, t, xy, vis):
+        ok = vis >= self.min_vis
+        if self._t is None:
+            self._x[:] = xy
+            self._dx[:] = 0.0
+            self._seen[:] = ok
+        else:
+            dt = max(1e-3, t - self._t)
+
+            # Derivada filtrada y cutoff adaptativo (rápido = menos lag, lento = menos jitter)
+            raw_dx = (xy - self._x) / dt
+            dx_hat = self._dx + self._alpha(self.d_cutoff, dt) * (raw_dx - self._dx)
+            speed = np.hypot(dx_hat[:, 0], dx_hat[:, 1])
+            a = self._alpha(self.min_cutoff + self.beta * speed, dt)[:, None]
+            x_hat = self._x + a * (xy - self._x)
+
+            upd = ok & self._seen
+            new = ok & ~self._seen
+            self._x[upd] = x_hat[upd]
+            self._dx[upd] = dx_hat[upd]
+            self._x[new] = xy[new]
+            self._dx[new] = 0.0
+            self._dx[~ok] = 0.0
+            self._seen |= ok
+
+        self._vis[:] = vis
+        self._t = t
+
+    def predict(self, t):
+        age = max(0.0, t - self._t)
+        ahead = min(age, self.max_predict)
+        xy = self._x + self._dx * ahead
+        vis = self._vis
+        if age > self.max_predict:
+            vis = vis * np.exp(-self.vis_decay * (age - self.max_predict))
+        return xy, vis
+
 
 class PoseEstimator:
     """
     MediaPipe Pose wrapper:
     - update(frame_bgr) -> pose_dict (landmarks normalizados + algunos scores)
+
+    Con rate_hz > 0 la inferencia corre a esa tasa y, si predict=True, los frames
+    intermedios reciben posiciones predichas por LandmarkFilter (trails y gestos
+    siguen suaves aunque MediaPipe corra a 10–15 Hz).
     """
-    def __init__(self, model_complexity=1, smooth=True, det_conf=0.5, track_conf=0.5):
+    def __init__(self, model_complexity=1, smooth=True, det_conf=0.5, track_conf=0.5,
+                 rate_hz=0.0, predict=True):
+        if load_mediapipe() is None:
+            raise RuntimeError("mediapipe not installed. Install with: pip install mediapipe")
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             model_complexity=int(model_complexity),
@@ -16,8 +126,18 @@ class PoseEstimator:
             min_detection_confidence=float(det_conf),
             min_tracking_confidence=float(track_conf),
         )
+        self.rate_hz = float(rate_hz)
+        self.filter = LandmarkFilter(len(KEYPOINTS)) if predict else None
+        self._last_infer = None
+        self._last_data = None
 
-    def update(self, frame_bgr):
+    def reset(self):
+        self._last_infer = None
+        self._last_data = None
+        if self.filter is not None:
+            self.filter.reset()
+
+    def _infer(self, frame_bgr):
         # MediaPipe usa RGB
         rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
         rgb.flags.writeable = False
@@ -30,25 +150,41 @@ class PoseEstimator:
 
         # landmarks normalizados (x,y en 0..1)
         # devolvemos solo los que vamos a usar
-        def pt(i):
-            return (float(lm[i].x), float(lm[i].y), float(lm[i].visibility))
-
-        # índices relevantes
-        # 11 L shoulder, 12 R shoulder
-        # 13 L elbow, 14 R elbow
-        # 15 L wrist, 16 R wrist
-        # 23 L hip, 24 R hip
         data = {
-            "l_shoulder": pt(11),
-            "r_shoulder": pt(12),
-            "l_elbow": pt(13),
-            "r_elbow": pt(14),
-            "l_wrist": pt(15),
-            "r_wrist": pt(16),
-            "l_hip": pt(23),
-            "r_hip": pt(24),
-            "all": lm,  # por si querés dibujar todo
+            key: (float(lm[i].x), float(lm[i].y), float(lm[i].visibility))
+            for key, i in KEYPOINTS.items()
+        }
+        data["all"] = lm  # por si querés dibujar todo
+        return data
+
+    def update(self, frame_bgr):
+        now = time.perf_counter()
+        due = (
+            self.rate_hz <= 0
+            or self._last_infer is None
+            or now - self._last_infer >= 1.0 / self.rate_hz
+        )
+
+        if due:
+            self._last_infer = now
+            self._last_data = self._infer(frame_bgr)
+            if self._last_data is None:
+                if self.filter is not None:
+                    self.filter.reset()
+                return None
+            if self.filter is not None:
+                pts = np.array([self._last_data[k] for k in KEYPOINTS], np.float32)
+                self.filter.correct(now, pts[:, :2], pts[:, 2])
+
+        if self.filter is None or self._last_data is None:
+            return self._last_data
+
+        xy, vis = self.filter.predict(now)
+        data = {
+            key: (float(xy[j, 0]), float(xy[j, 1]), float(vis[j]))
+            for j, key in enumerate(KEYPOINTS)
         }
+        data["all"] = self._last_data["all"]
         return data
 
 
@@ -1,33 +1,51 @@
+import cv2
 import numpy as np
 
 
 class ZoneMapper:
     """
-    Divide en 4 zonas: left/right/top/bottom.
-    Calcula movimiento por zona a partir de una máscara binaria (255 = movimiento).
+    Divide la máscara en una grilla de cols x rows celdas (por defecto 8x6).
+    Calcula movimiento por celda a partir de una máscara binaria (255 = movimiento)
+    en una sola pasada (cv2.resize INTER_AREA = promedio por celda).
+
+    Las 4 zonas clásicas left/right/top/bottom se derivan de la grilla,
+    y la grilla queda disponible en zones["grid"] (rows, cols) float32 0..1.
     """
 
-    def __init__(self):
-        self.last = {"left": 0.0, "right": 0.0, "top": 0.0, "bottom": 0.0}
+    def __init__(self, cols=8, rows=6):
+        self.cols = max(1, int(cols))
+        self.rows = max(1, int(rows))
+        self._grid8 = np.zeros((self.rows, self.cols), np.uint8)
+        self._grid = np.zeros((self.rows, self.cols), np.float32)
+
+        # Pesos de cada columna/fila para cada mitad (la central se reparte si es impar)
+        self._w_left = np.clip(self.cols / 2.0 - np.arange(self.cols), 0.0, 1.0).astype(np.float32)
+        self._w_right = self._w_left[::-1].copy()
+        self._w_top = np.clip(self.rows / 2.0 - np.arange(self.rows), 0.0, 1.0).astype(np.float32)
+        self._w_bottom = self._w_top[::-1].copy()
+
+        self.last = {"left": 0.0, "right": 0.0, "top": 0.0, "bottom": 0.0, "grid": self._grid}
 
     def compute(self, mask):
         # mask: 2D uint8 (0/255)
         h, w = mask.shape[:2]
-        if h < 2 or w < 2:
+        if h < self.rows or w < self.cols:
             return self.last
 
-        left = mask[:, : w // 2]
-        right = mask[:, w // 2 :]
-        top = mask[: h // 2, :]
-        bottom = mask[h // 2 :, :]
+        cv2.resize(mask, (self.cols, self.rows), dst=self._grid8, interpolation=cv2.INTER_AREA)
+        np.multiply(self._grid8, 1.0 / 255.0, out=self._grid, casting="unsafe")
+
+        col_means = self._grid.mean(axis=0)
+        row_means = self._grid.mean(axis=1)
 
-        def intensity(m):
-            return float(np.mean(m > 0))
+        def half(means, weights):
+            return float(np.dot(means, weights) / weights.sum())
 
         self.last = {
-            "left": intensity(left),
-            "right": intensity(right),
-            "top": intensity(top),
-            "bottom": intensity(bottom),
+            "left": half(col_means, self._w_left),
+            "right": half(col_means, self._w_right),
+            "top": half(row_means, self._w_top),
+            "bottom": half(row_means, self._w_bottom),
+            "grid": self._grid,
         }
         return self.last